@@ -0,0 +1,253 @@
+# python -m benchmarks.capture_benchmark --sizes 1,10,100 --output bench.json
+
+import argparse
+import asyncio
+import configparser
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+
+from collections import Counter
+from datetime import datetime, timezone
+
+import psutil
+
+from benchmarks.synthetic_server import PAGE_KINDS, SyntheticSiteServer
+from src.config import ConfigManager
+
+DEFAULT_SIZES = (1, 10, 100, 1000)
+RSS_SAMPLE_INTERVAL = 0.1
+
+
+class PeakRssSampler:
+    """
+    현재 프로세스와 자식 프로세스(Chromium, 인코딩 워커) RSS 합계의 최대값 측정
+    """
+
+    def __init__(self, interval: float = RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _sample(self) -> int:
+        process = psutil.Process()
+        total = 0
+        for proc in [process, *process.children(recursive=True)]:
+            try:
+                total += proc.memory_info().rss
+            except psutil.Error:
+                pass
+        return total
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self._sample())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self._sample())
+
+
+def percentile(values: list[float], ratio: float) -> float:
+    """
+    nearest-rank 백분위수
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(ratio * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(size: int, results: list, wall_seconds: float, peak_rss: int) -> dict:
+    """
+    캡처 결과 목록을 벤치마크 지표로 요약
+    """
+    latencies = [sum((r.phaseTimings or {}).values()) for r in results]
+    phases = {}
+    for result in results:
+        for phase, seconds in (result.phaseTimings or {}).items():
+            phases.setdefault(phase, []).append(seconds)
+    succeeded = sum(1 for r in results if r.isSuccess)
+    return {
+        "urls": size,
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "wallSeconds": round(wall_seconds, 3),
+        "throughput": round(succeeded / wall_seconds, 3) if wall_seconds else 0.0,
+        "latencyP50": round(percentile(latencies, 0.50), 3),
+        "latencyP95": round(percentile(latencies, 0.95), 3),
+        "phaseP50": {
+            phase: round(percentile(values, 0.50), 4)
+            for phase, values in sorted(phases.items())
+        },
+        "readySignals": dict(Counter(r.readySignal for r in results if r.readySignal)),
+        "peakRssMb": round(peak_rss / 1024 / 1024, 1),
+    }
+
+
+def compare(run: dict, baseline: dict) -> dict:
+    """
+    기준 결과 대비 비율 (throughput은 클수록, latency/RSS는 작을수록 좋음)
+    """
+    def ratio(key):
+        return round(run[key] / baseline[key], 3) if baseline.get(key) else None
+
+    return {
+        "throughputRatio": ratio("throughput"),
+        "latencyP50Ratio": ratio("latencyP50"),
+        "latencyP95Ratio": ratio("latencyP95"),
+        "peakRssRatio": ratio("peakRssMb"),
+    }
+
+
+def write_bench_config(save_path: str, per_host: bool) -> str:
+    """
+    벤치마크용 config.ini 생성
+    - 현재 설정(config.ini, 없으면 config.sample.ini)을 복사하고 저장 경로만 임시 경로로 변경합니다.
+    - 합성 페이지는 모두 같은 호스트이므로 per_host가 false이면 호스트별 제한을 전체 제한과 같게 둡니다.
+    """
+    parser = configparser.ConfigParser()
+    source = ConfigManager.CONFIG_FILE
+    if not os.path.exists(source):
+        source = ConfigManager.SAMPLE_FILE
+    parser.read(source, encoding="utf-8")
+    if "SCREENSHOT" not in parser:
+        parser["SCREENSHOT"] = {}
+    screenshot = parser["SCREENSHOT"]
+    screenshot["SAVE_PATH"] = save_path
+    if not per_host:
+        screenshot["MAX_CONCURRENCY_PER_HOST"] = screenshot.get("MAX_CONCURRENCY", "4")
+    config_path = os.path.join(save_path, "config.ini")
+    with open(config_path, "w", encoding="utf-8") as f:
+        parser.write(f)
+    return config_path
+
+
+async def run_size(server: SyntheticSiteServer, size: int, kinds: list[str]) -> dict:
+    """
+    size개 URL을 캡처하고 지표 계산 (1개면 capture_one, 그 이상이면 capture_all)
+    """
+    from src.capture import capture_all, capture_one
+    from src.models import UrlInfo
+
+    urlinfos = []
+    for i in range(size):
+        kind = kinds[i % len(kinds)]
+        urlinfos.append(UrlInfo(name=f"bench-{kind}-{i}", url=server.url(kind, i)))
+    with PeakRssSampler() as sampler:
+        started = time.perf_counter()
+        if size == 1:
+            results = [await capture_one(urlinfos[0])]
+        else:
+            results = [result async for result in capture_all(urlinfos)]
+        wall_seconds = time.perf_counter() - started
+    return summarize(size, results, wall_seconds, sampler.peak)
+
+
+async def run_benchmark(sizes: list[int], kinds: list[str], per_host: bool) -> dict:
+    """
+    합성 페이지 서버를 띄우고 URL 수별로 캡처 벤치마크 실행
+    """
+    with tempfile.TemporaryDirectory() as save_path:
+        ConfigManager.CONFIG_FILE = write_bench_config(save_path, per_host)
+        config = ConfigManager()
+        config.reload()
+
+        from src.browser_pool import BrowserPool
+        from src.image_encoder import shutdown_encoder
+
+        browser_pool = BrowserPool()
+        report = {
+            "startedAt": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpuCount": os.cpu_count(),
+            "config": {
+                "BROWSER_POOL_SIZE": config.BROWSER_POOL_SIZE,
+                "MAX_CONCURRENCY": config.MAX_CONCURRENCY,
+                "MAX_CONCURRENCY_PER_HOST": config.MAX_CONCURRENCY_PER_HOST,
+                "ENCODER_WORKERS": config.ENCODER_WORKERS,
+                "TIMEOUT": config.TIMEOUT,
+                "IMG_MAX_WIDTH": config.IMG_MAX_WIDTH,
+            },
+            "pages": kinds,
+            "runs": [],
+        }
+        with SyntheticSiteServer() as server:
+            started = time.perf_counter()
+            await browser_pool.start()
+            report["startupSeconds"] = round(time.perf_counter() - started, 3)
+            try:
+                for size in sizes:
+                    run = await run_size(server, size, kinds)
+                    report["runs"].append(run)
+                    print(
+                        f"{size:>5} urls: {run['throughput']:>7} captures/s, "
+                        f"p50 {run['latencyP50']}s, p95 {run['latencyP95']}s, "
+                        f"failed {run['failed']}, peak RSS {run['peakRssMb']} MB",
+                        file=sys.stderr,
+                    )
+            finally:
+                await browser_pool.stop()
+                shutdown_encoder()
+        return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hermetic capture benchmark")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="comma separated URL counts (default: 1,10,100,1000)",
+    )
+    parser.add_argument(
+        "--pages",
+        default=",".join(PAGE_KINDS),
+        help=f"comma separated page kinds from {', '.join(PAGE_KINDS)}",
+    )
+    parser.add_argument("--output", help="write JSON report to this file")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument(
+        "--per-host",
+        action="store_true",
+        help="keep MAX_CONCURRENCY_PER_HOST (all synthetic pages share one host)",
+    )
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    kinds = [kind for kind in args.pages.split(",") if kind]
+    unknown = set(kinds) - set(PAGE_KINDS)
+    if unknown:
+        parser.error(f"unknown page kinds: {', '.join(sorted(unknown))}")
+
+    report = asyncio.run(run_benchmark(sizes, kinds, args.per_host))
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline_runs = {run["urls"]: run for run in json.load(f)["runs"]}
+        for run in report["runs"]:
+            if run["urls"] in baseline_runs:
+                run["baseline"] = compare(run, baseline_runs[run["urls"]])
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
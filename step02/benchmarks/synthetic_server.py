@@ -0,0 +1,170 @@
+import io
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from PIL import Image
+
+# 벤치마크용 합성 페이지 종류
+PAGE_TALL = "tall"
+PAGE_IMAGES = "images"
+PAGE_TRICKLE = "trickle"
+PAGE_POLLING = "polling"
+PAGE_KINDS = (PAGE_TALL, PAGE_IMAGES, PAGE_TRICKLE, PAGE_POLLING)
+
+TALL_PAGE_HEIGHT = 20000
+IMAGE_COUNT = 60
+IMAGE_SIZE = (320, 240)
+TRICKLE_CHUNKS = 20
+TRICKLE_INTERVAL = 0.1
+POLLING_INTERVAL_MS = 250
+
+PAGE_TEMPLATE = """<!doctype html>
+<html lang="ko">
+<head><meta charset="utf-8"><title>{title}</title>{head}</head>
+<body style="margin:0;font-family:sans-serif">{body}</body>
+</html>
+"""
+
+
+def _tall_page(query: dict) -> str:
+    height = int(query.get("h", [TALL_PAGE_HEIGHT])[0])
+    sections = "".join(
+        f'<section style="height:1000px;background:hsl({i * 37 % 360},60%,80%)">'
+        f"<h2>Section {i}</h2><p>{'벤치마크 본문 ' * 200}</p></section>"
+        for i in range(height // 1000)
+    )
+    return PAGE_TEMPLATE.format(title="tall", head="", body=sections)
+
+
+def _images_page(query: dict) -> str:
+    version = query.get("i", ["0"])[0]
+    images = "".join(
+        f'<img src="/image/{i}.png?v={version}" width="{IMAGE_SIZE[0]}"'
+        f' height="{IMAGE_SIZE[1]}">'
+        for i in range(IMAGE_COUNT)
+    )
+    return PAGE_TEMPLATE.format(title="images", head="", body=images)
+
+
+def _trickle_page(query: dict) -> str:
+    version = query.get("i", ["0"])[0]
+    head = f'<script src="/trickle.js?v={version}" async></script>'
+    body = "<h1>Trickle</h1><p>리소스 하나가 천천히 내려오는 페이지</p>"
+    return PAGE_TEMPLATE.format(title="trickle", head=head, body=body)
+
+
+def _polling_page(query: dict) -> str:
+    head = (
+        "<script>"
+        f"setInterval(() => fetch('/ping?t=' + Date.now()), {POLLING_INTERVAL_MS});"
+        "</script>"
+    )
+    body = "<h1>Polling</h1><p>networkidle에 도달하지 않는 페이지</p>"
+    return PAGE_TEMPLATE.format(title="polling", head=head, body=body)
+
+
+PAGES = {
+    PAGE_TALL: _tall_page,
+    PAGE_IMAGES: _images_page,
+    PAGE_TRICKLE: _trickle_page,
+    PAGE_POLLING: _polling_page,
+}
+
+
+def _png_bytes(index: int) -> bytes:
+    color = (index * 53 % 256, index * 97 % 256, index * 151 % 256)
+    buffer = io.BytesIO()
+    Image.new("RGB", IMAGE_SIZE, color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    images = [_png_bytes(i) for i in range(IMAGE_COUNT)]
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        kind = parsed.path.strip("/")
+        if kind in PAGES:
+            self._send(PAGES[kind](query).encode("utf-8"), "text/html; charset=utf-8")
+        elif parsed.path.startswith("/image/"):
+            index = int(parsed.path.rsplit("/", 1)[-1].split(".")[0])
+            self._send(self.images[index % IMAGE_COUNT], "image/png")
+        elif parsed.path == "/trickle.js":
+            self._trickle()
+        elif parsed.path == "/ping":
+            self._send(b"pong", "text/plain")
+        else:
+            self.send_error(404)
+
+    def _send(self, body: bytes, content_type: str):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _trickle(self):
+        chunk = b"/* trickle */\n" * 64
+        self.send_response(200)
+        self.send_header("Content-Type", "application/javascript")
+        self.send_header("Content-Length", str(len(chunk) * TRICKLE_CHUNKS))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        try:
+            for _ in range(TRICKLE_CHUNKS):
+                self.wfile.write(chunk)
+                self.wfile.flush()
+                time.sleep(TRICKLE_INTERVAL)
+        except (BrokenPipeError, ConnectionResetError):
+            # 캡처가 끝나 컨텍스트가 닫히면 연결이 끊김
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class SyntheticSiteServer:
+    """
+    벤치마크용 로컬 HTTP 서버
+    - 외부 사이트 없이 같은 조건을 반복 재현할 수 있도록 합성 페이지를 제공합니다.
+        - /tall: 세로로 긴 페이지
+        - /images: 이미지가 많은 페이지
+        - /trickle: 스크립트 하나가 천천히 내려오는 페이지
+        - /polling: 주기적으로 요청을 보내 networkidle에 도달하지 않는 페이지
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, kind: str, index: int = 0) -> str:
+        """
+        합성 페이지 URL (index로 URL마다 내용을 구분)
+        """
+        return f"{self.base_url}/{kind}?i={index}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,326 @@
+import asyncio
+
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Optional
+import psutil
+from playwright.async_api import async_playwright
+from src.config import ConfigManager
+from src.logger import get_logger
+from src.metrics import (
+    BROWSER_RECYCLES_TOTAL,
+    PHASE_BROWSER_LAUNCH,
+    PHASE_DRIVER_START,
+    time_browser_phase,
+)
+
+_logger = get_logger(__name__)
+_config = ConfigManager()
+
+# 브라우저 교체 사유
+RECYCLE_CONTEXTS = "contexts"
+RECYCLE_RSS = "rss"
+RECYCLE_CRASH = "crash"
+
+# Chromium 메인 프로세스 식별용 (Playwright가 launch시 항상 붙이는 인자)
+CHROMIUM_PIPE_ARG = "--remote-debugging-pipe"
+# Chromium 하위 프로세스(렌더러, GPU 등)에만 붙는 인자
+CHROMIUM_CHILD_ARG = "--type="
+# 브라우저 RSS 확인 주기 (초, 프로세스 트리를 훑으므로 캡처마다 하지 않음)
+RSS_SAMPLE_INTERVAL = 10.0
+
+
+@dataclass(eq=False)
+class PooledBrowser:
+    """
+    풀에 속한 브라우저와 사용 현황
+    - contexts: 지금까지 만든 BrowserContext 수
+    - active: 아직 닫히지 않은 BrowserContext 수
+    - pid: Chromium 메인 프로세스 pid (찾지 못하면 None, RSS 확인 생략)
+    """
+    browser: object
+    pid: Optional[int] = None
+    contexts: int = 0
+    active: int = 0
+    retired: bool = False
+
+
+class BrowserPool:
+    """
+    Chromium 브라우저 풀
+    - Playwright 드라이버와 Chromium을 앱 수명주기 동안 띄워두고 재사용합니다.
+    - 캡처마다 브라우저를 새로 띄우지 않고, 격리된 BrowserContext만 생성합니다.
+    - BrowserContext를 BROWSER_MAX_CONTEXTS개 만들었거나 프로세스 RSS가
+      BROWSER_MAX_RSS_MB를 넘거나 연결이 끊기면 교체 브라우저를 백그라운드에서 띄우고,
+      준비되면 바꿔 끼웁니다. 기존 브라우저는 열린 컨텍스트가 모두 닫힌 뒤 종료합니다.
+    - RSS는 RSS_SAMPLE_INTERVAL마다 백그라운드에서 확인합니다.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(BrowserPool, cls).__new__(cls)
+            cls._instance._playwright = None
+            cls._instance._browsers = []
+            cls._instance._warming = {}
+            cls._instance._retired = set()
+            cls._instance._closing = set()
+            cls._instance._cursor = 0
+            cls._instance._loop = None
+            cls._instance._lock = None
+            cls._instance._launch_lock = None
+            cls._instance._sampler = None
+        return cls._instance
+
+    @property
+    def is_started(self) -> bool:
+        return bool(self._browsers) and self._loop is _running_loop()
+
+    async def start(self):
+        """
+        브라우저 풀 기동
+        - 이미 현재 이벤트 루프에서 기동되어 있으면 아무것도 하지 않습니다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._browsers:
+                # 다른 이벤트 루프에서 띄운 브라우저는 재사용할 수 없음
+                _logger.warning("Browser pool bound to another event loop, discarding.")
+            self._playwright = None
+            self._browsers = []
+            self._warming = {}
+            self._retired = set()
+            self._closing = set()
+            self._sampler = None
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._launch_lock = asyncio.Lock()
+
+        async with self._lock:
+            if self._browsers:
+                return
+            pool_size = max(1, _config.BROWSER_POOL_SIZE)
+            with time_browser_phase(PHASE_DRIVER_START):
+                self._playwright = await async_playwright().start()
+            try:
+                for index in range(pool_size):
+                    self._browsers.append(await self._launch(index))
+            except Exception:
+                await self.stop()
+                raise
+            self._sampler = asyncio.create_task(self._sample_rss())
+            _logger.info(f"Browser pool started with {pool_size} browser(s).")
+
+    async def stop(self):
+        """
+        브라우저 풀 종료 (교체 대기 중인 브라우저 포함)
+        """
+        if self._loop is not _running_loop():
+            return
+        if self._sampler:
+            self._sampler.cancel()
+            await asyncio.gather(self._sampler, return_exceptions=True)
+            self._sampler = None
+        warming, self._warming = list(self._warming.values()), {}
+        for task in warming:
+            task.cancel()
+        results = await asyncio.gather(*warming, return_exceptions=True)
+        await asyncio.gather(*self._closing, return_exceptions=True)
+        pooled = self._browsers + list(self._retired) + [
+            result for result in results if isinstance(result, PooledBrowser)
+        ]
+        self._browsers = []
+        self._retired = set()
+        for entry in pooled:
+            await self._close(entry)
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+        _logger.info("Browser pool stopped.")
+
+    @asynccontextmanager
+    async def new_context(self, **kwargs):
+        """
+        풀의 브라우저에서 격리된 BrowserContext 생성
+        - param
+            - kwargs: Browser.new_context 옵션
+        - return
+            - context: 블록 종료시 자동으로 닫히는 BrowserContext
+        """
+        entry = await self._acquire()
+        try:
+            context = await entry.browser.new_context(**kwargs)
+            try:
+                yield context
+            finally:
+                try:
+                    await context.close()
+                except Exception as e:
+                    _logger.warning(f"Error occurred while closing context: {e}")
+        finally:
+            entry.active -= 1
+            if entry.retired and entry.active == 0 and entry in self._retired:
+                self._retired.discard(entry)
+                await self._close(entry)
+
+    async def _acquire(self) -> PooledBrowser:
+        if not self.is_started:
+            await self.start()
+        while True:
+            async with self._lock:
+                index = self._next_connected()
+                if index is not None:
+                    entry = self._browsers[index]
+                    entry.contexts += 1
+                    entry.active += 1
+                    max_contexts = _config.BROWSER_MAX_CONTEXTS
+                    if max_contexts > 0 and entry.contexts >= max_contexts:
+                        self._warm(index, RECYCLE_CONTEXTS)
+                    return entry
+                waiting = list(self._warming.values())
+            # 연결된 브라우저가 없으면 락을 놓고 교체 브라우저를 기다림 (비정상 종료시에만 발생)
+            _logger.warning("All pooled browsers disconnected, waiting for replacement.")
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            if all(task.cancelled() or task.exception() for task in done):
+                next(iter(done)).result()
+
+    def _next_connected(self) -> Optional[int]:
+        """
+        라운드 로빈으로 연결된 브라우저 슬롯 선택 (끊긴 슬롯은 교체 브라우저를 띄우고 건너뜀)
+        - return
+            - index: 슬롯 번호, 연결된 브라우저가 없으면 None
+        """
+        for _ in range(len(self._browsers)):
+            index = self._cursor % len(self._browsers)
+            self._cursor += 1
+            self._swap_if_warm(index)
+            if self._browsers[index].browser.is_connected():
+                return index
+            self._warm(index, RECYCLE_CRASH)
+        return None
+
+    async def _sample_rss(self):
+        """
+        브라우저 RSS를 주기적으로 확인해 BROWSER_MAX_RSS_MB를 넘으면 교체 브라우저를 띄움
+        """
+        while True:
+            await asyncio.sleep(RSS_SAMPLE_INTERVAL)
+            max_rss_mb = _config.BROWSER_MAX_RSS_MB
+            if max_rss_mb <= 0:
+                continue
+            for index, entry in enumerate(list(self._browsers)):
+                rss = await asyncio.to_thread(browser_rss, entry.pid)
+                if rss is None or rss <= max_rss_mb * 1024 * 1024:
+                    continue
+                if index < len(self._browsers) and self._browsers[index] is entry:
+                    self._warm(index, RECYCLE_RSS)
+
+    def _warm(self, index: int, reason: str):
+        """
+        슬롯의 교체 브라우저를 백그라운드에서 기동 (이미 기동 중이면 무시)
+        """
+        if index in self._warming:
+            return
+        _logger.info(f"Warming replacement for browser {index} ({reason}).")
+        BROWSER_RECYCLES_TOTAL.labels(reason=reason).inc()
+        self._warming[index] = asyncio.create_task(self._launch(index))
+
+    def _swap_if_warm(self, index: int):
+        """
+        교체 브라우저가 준비되었으면 슬롯의 브라우저를 교체하고 기존 브라우저는 은퇴
+        """
+        task = self._warming.get(index)
+        if task is None or not task.done():
+            return
+        del self._warming[index]
+        if task.cancelled() or task.exception() is not None:
+            error = "cancelled" if task.cancelled() else task.exception()
+            _logger.error(f"Replacement browser {index} failed to launch: {error}")
+            return
+        old, self._browsers[index] = self._browsers[index], task.result()
+        old.retired = True
+        if old.active:
+            self._retired.add(old)
+        else:
+            task = asyncio.create_task(self._close(old))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        _logger.info(f"Browser {index} recycled after {old.contexts} context(s).")
+
+    async def _launch(self, index: int) -> PooledBrowser:
+        # 동시에 띄우면 새 Chromium 프로세스를 구분할 수 없으므로 하나씩 기동
+        async with self._launch_lock:
+            before = _chromium_pids()
+            with time_browser_phase(PHASE_BROWSER_LAUNCH):
+                browser = await self._playwright.chromium.launch(headless=True)
+            started = _chromium_pids() - before
+        entry = PooledBrowser(
+            browser=browser, pid=next(iter(started)) if len(started) == 1 else None
+        )
+        browser.on("disconnected", lambda _: self._on_disconnected(index, entry))
+        return entry
+
+    def _on_disconnected(self, index: int, entry: PooledBrowser):
+        # 은퇴시킨 브라우저를 닫은 경우가 아니면 바로 교체 브라우저를 띄움
+        if entry.retired or self._loop is not _running_loop():
+            return
+        if index < len(self._browsers) and self._browsers[index] is entry:
+            self._warm(index, RECYCLE_CRASH)
+
+    async def _close(self, entry: PooledBrowser):
+        entry.retired = True
+        try:
+            await entry.browser.close()
+        except Exception as e:
+            _logger.warning(f"Error occurred while closing browser: {e}")
+
+
+def browser_rss(pid: Optional[int]) -> Optional[int]:
+    """
+    Chromium 메인 프로세스와 하위 프로세스(렌더러, GPU 등)의 RSS 합계
+    - param
+        - pid: Chromium 메인 프로세스 pid
+    - return
+        - rss: 바이트, 프로세스를 찾을 수 없으면 None
+    """
+    if pid is None:
+        return None
+    try:
+        process = psutil.Process(pid)
+        processes = [process, *process.children(recursive=True)]
+    except psutil.Error:
+        return None
+    rss = 0
+    for child in processes:
+        try:
+            rss += child.memory_info().rss
+        except psutil.Error:
+            continue
+    return rss
+
+
+def _chromium_pids() -> set[int]:
+    """
+    현재 프로세스 하위의 Chromium 메인 프로세스 pid
+    """
+    pids = set()
+    try:
+        children = psutil.Process().children(recursive=True)
+    except psutil.Error:
+        return pids
+    for child in children:
+        try:
+            cmdline = child.cmdline()
+        except psutil.Error:
+            continue
+        is_child = any(arg.startswith(CHROMIUM_CHILD_ARG) for arg in cmdline)
+        if CHROMIUM_PIPE_ARG in cmdline and not is_child:
+            pids.add(child.pid)
+    return pids
+
+
+def _running_loop():
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
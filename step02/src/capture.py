@@ -1,14 +1,43 @@
 import asyncio
+import os
 import time
 
+from typing import AsyncIterator, Optional
 from urllib.parse import urlparse
-from playwright.async_api import async_playwright
+from src.browser_pool import BrowserPool
+from src.capture_queue import CaptureQueue
+from src.change_probe import ProbeOutcome, probe_change
 from src.config import ConfigManager
+from src.image_encoder import SavedScreenshot, save_screenshot
+from src.image_hash import hamming_distance
+from src.image_pyramid import schedule_pyramid
 from src.logger import get_logger
-from src.models import UrlInfo
+from src.metrics import (
+    PHASE_CONTEXT,
+    PHASE_ENCODE,
+    PHASE_ENCODER_WAIT,
+    PHASE_INDEX,
+    PHASE_PROBE,
+    PHASE_QUEUE,
+    PHASE_READINESS,
+    PHASE_SCREENSHOT,
+    PHASE_WRITE,
+    CAPTURES_SHARED_TOTAL,
+    PhaseTimer,
+    observe_capture,
+)
+from src.models import CaptureResult, UrlInfo, ViewportCapture
+from src.network_filter import apply_block_rule, block_rule_for
+from src.readiness import wait_for_layout, wait_until_ready
+from src.screenshot_index import get_screenshot_index
+from src.single_flight import FLIGHT_LEADER, SingleFlight
+from src.viewport import Viewport, viewport_system_name
 
 _logger = get_logger(__name__)
 _config = ConfigManager()
+_browser_pool = BrowserPool()
+_capture_queue = CaptureQueue()
+_single_flight = SingleFlight()
 
 
 def is_valid_url(url: str) -> bool:
@@ -29,80 +58,354 @@ def is_valid_url(url: str) -> bool:
     return True
 
 
-async def capture_one(urlinfo: UrlInfo) -> bool:
+async def capture_one(
+    urlinfo: UrlInfo,
+    probe: bool = False,
+    viewports: Optional[list[Viewport]] = None,
+) -> CaptureResult:
     """
     스크린샷 캡처 단건
+    - 같은 대상/옵션으로 진행 중인 캡처가 있으면 새로 캡처하지 않고 그 결과를 함께 받습니다.
+    - FRESH_SECONDS 안에 성공한 같은 캡처가 있으면 그 결과를 그대로 돌려줍니다.
     - param
         - url: 스크린샷 캡처 대상 URL
+        - probe: 브라우저를 띄우기 전에 HTTP 검증값으로 변경 여부를 먼저 확인할지 여부
+          (변경이 없으면 렌더링하지 않고 직전 캡처를 변경 없음으로 기록)
+        - viewports: 뷰포트 매트릭스, 있으면 페이지를 한 번만 불러와 뷰포트마다 캡처
+          (사전 확인은 하지 않음)
     - return
-        - is_success: 캡처 성공 여부
+        - result: 캡처 결과 (성공 여부, 저장 경로, 직전 캡처 대비 변경 여부,
+          캡처 시점을 결정한 신호, 차단한 요청 수, 단계별 소요 시간,
+          뷰포트별 캡처 결과)
     """
     _logger.debug(f"capture called for one url: {urlinfo}")
-    is_success = None
-    save_path = _config.SAVE_PATH
 
     if not is_valid_url(urlinfo.url):
         _logger.error(f"Invalid URL format: {urlinfo.url}")
         raise ValueError(f"Invalid URL format: {urlinfo.url}")
 
+    key = (urlinfo.name, urlinfo.url, probe, tuple(viewports or ()))
+    result, flight = await _single_flight.run(
+        key,
+        lambda: _capture_one(urlinfo, probe, viewports),
+        fresh_seconds=_config.FRESH_SECONDS,
+        is_reusable=lambda result: result.isSuccess,
+    )
+    if flight != FLIGHT_LEADER:
+        _logger.info(f"Capture shared ({flight}): {urlinfo.name}")
+        CAPTURES_SHARED_TOTAL.labels(system=urlinfo.name, flight=flight).inc()
+    # 캐시된 결과 객체를 여러 요청이 나눠 쓰지 않도록 먼저 실행한 요청에도 복사본 반환
+    return result.model_copy(deep=True)
+
+
+async def _capture_one(
+    urlinfo: UrlInfo, probe: bool, viewports: Optional[list[Viewport]]
+) -> CaptureResult:
+    save_path = _config.SAVE_PATH
+    timer = PhaseTimer()
+    ready_signal = None
+    probed = None
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            try:
-                await page.goto(urlinfo.url, wait_until="networkidle")
-            except Exception as e:
-                msg = f"Network idle not reached for {urlinfo.url}: {e}"
-                _logger.warning(msg)
-                await page.goto(urlinfo.url)  # 강제 캡처를 위해 재시도
-
-            timestamp = time.strftime("%Y%m%d-%H%M%S")
-            screenshot_path = f"{save_path}/{urlinfo.name}-{timestamp}.png"
-            await page.screenshot(path=screenshot_path, full_page=True)
-            _logger.info(f"Screenshot saved: {screenshot_path}")
-            await browser.close()
-        is_success = True
+        if probe and not viewports:
+            screenshot_index = get_screenshot_index(save_path)
+            probed = await probe_change(
+                urlinfo, screenshot_index.get_probe(urlinfo.name)
+            )
+            timer.lap(PHASE_PROBE)
+        result = None
+        if probed and probed.unchanged_by:
+            result = _record_probe_unchanged(urlinfo, probed, save_path)
+        if result is None:
+            async with _capture_queue.slot(urlinfo.url):
+                timer.lap(PHASE_QUEUE)
+                context_options = {"viewport": viewports[0].size} if viewports else {}
+                async with _browser_pool.new_context(**context_options) as context:
+                    stats = await apply_block_rule(
+                        context, block_rule_for(urlinfo.name)
+                    )
+                    page = await context.new_page()
+                    timer.lap(PHASE_CONTEXT)
+                    ready_signal = await wait_until_ready(
+                        page,
+                        urlinfo.url,
+                        _config.TIMEOUT,
+                        _config.READY_QUIET_MS,
+                        timer=timer,
+                    )
+
+                    captured_at = time.time()
+                    if viewports:
+                        shots = await _screenshot_viewports(page, viewports, timer)
+                    else:
+                        png_bytes = await page.screenshot(full_page=True)
+                        timer.lap(PHASE_SCREENSHOT)
+                timer.lap(PHASE_CONTEXT)
+
+            # 브라우저 컨텍스트를 반납한 뒤 프로세스 풀에서 축소/WebP 변환
+            if viewports:
+                result = await _save_viewports(
+                    urlinfo, shots, ready_signal, captured_at, save_path, timer
+                )
+            else:
+                result = await _save_and_record(
+                    urlinfo, png_bytes, captured_at, save_path, timer
+                )
+            result.blockedRequests = stats.blocked_requests
+            result.transferredBytes = stats.transferred_bytes
+            _logger.debug(
+                f"Network for {urlinfo.url}: {stats.blocked_requests} blocked, "
+                f"{stats.transferred_bytes} bytes transferred"
+            )
+            if probed and probed.validators:
+                # 렌더링한 페이지의 검증값을 다음 사전 확인 기준으로 저장
+                get_screenshot_index(save_path).save_probe(
+                    urlinfo.name, probed.validators
+                )
     except Exception as e:
         msg = f"Error occurred while capturing {urlinfo.url}: {e}"
         _logger.error(msg)
-        is_success = False
+        result = CaptureResult(urlinfo=urlinfo, isSuccess=False, errorMsg=str(e))
+
+    result.readySignal = ready_signal
+    result.phaseTimings = {
+        phase: round(seconds, 4) for phase, seconds in timer.durations.items()
+    }
+    observe_capture(result)
+    return result
+
+
+async def _screenshot_viewports(
+    page, viewports: list[Viewport], timer: PhaseTimer
+) -> list[tuple[Viewport, Optional[str], bytes]]:
+    """
+    한 번 불러온 페이지를 뷰포트 크기만 바꿔 가며 캡처
+    - 첫 뷰포트는 페이지를 불러온 크기이므로 바로 캡처하고, 이후 뷰포트는
+      레이아웃 안정만 다시 기다립니다.
+    - return
+        - shots: (뷰포트, 레이아웃 안정 신호, PNG 바이트) 목록
+    """
+    shots = []
+    for index, viewport in enumerate(viewports):
+        signal = None
+        if index:
+            await page.set_viewport_size(viewport.size)
+            signal = await wait_for_layout(
+                page, _config.TIMEOUT, _config.LAYOUT_QUIET_MS
+            )
+            timer.lap(PHASE_READINESS)
+        png_bytes = await page.screenshot(full_page=True)
+        timer.lap(PHASE_SCREENSHOT)
+        shots.append((viewport, signal, png_bytes))
+    return shots
+
+
+async def _save_and_record(
+    urlinfo: UrlInfo,
+    png_bytes: bytes,
+    captured_at: float,
+    save_path: str,
+    timer: PhaseTimer,
+) -> CaptureResult:
+    """
+    스크린샷을 인코딩/저장하고 인덱스에 등록
+    """
+    while True:
+        saved = await save_screenshot(png_bytes, save_path)
+        elapsed = timer.lap()
+        timer.record(PHASE_ENCODE, saved.encode_seconds)
+        timer.record(PHASE_WRITE, saved.write_seconds)
+        timer.record(
+            PHASE_ENCODER_WAIT,
+            max(elapsed - saved.encode_seconds - saved.write_seconds, 0.0),
+        )
+        result = _record_capture(urlinfo, saved, captured_at, save_path)
+        timer.lap(PHASE_INDEX)
+        if result is not None:
+            break
+        # 등록 전에 보존 정책이 같은 내용의 blob을 지운 경우
+        _logger.warning(
+            f"Screenshot blob removed before indexing, saving again: {saved.blob.path}"
+        )
+    if result.imagePath:
+        # 썸네일/중간 크기는 결과 반환을 막지 않도록 백그라운드에서 생성
+        screenshot_index = get_screenshot_index(save_path)
+        schedule_pyramid(os.path.join(screenshot_index.save_path, result.imagePath))
+    return result
+
+
+async def _save_viewports(
+    urlinfo: UrlInfo,
+    shots: list[tuple[Viewport, Optional[str], bytes]],
+    ready_signal: Optional[str],
+    captured_at: float,
+    save_path: str,
+    timer: PhaseTimer,
+) -> CaptureResult:
+    """
+    뷰포트별 캡처를 시스템명@뷰포트 이름으로 인덱스에 등록
+    - 대표 결과(imagePath 등)는 첫 뷰포트 기준이며, 하나라도 바뀌면 변경으로 봅니다.
+    """
+    captures = []
+    for viewport, signal, png_bytes in shots:
+        viewport_urlinfo = UrlInfo(
+            name=viewport_system_name(urlinfo.name, viewport), url=urlinfo.url
+        )
+        recorded = await _save_and_record(
+            viewport_urlinfo, png_bytes, captured_at, save_path, timer
+        )
+        captures.append(ViewportCapture(
+            viewport=viewport.name,
+            width=viewport.width,
+            height=viewport.height,
+            imagePath=recorded.imagePath,
+            isChanged=recorded.isChanged,
+            hammingDistance=recorded.hammingDistance,
+            readySignal=signal or ready_signal,
+        ))
+    return CaptureResult(
+        urlinfo=urlinfo,
+        isSuccess=True,
+        imagePath=captures[0].imagePath,
+        isChanged=any(capture.isChanged for capture in captures),
+        hammingDistance=captures[0].hammingDistance,
+        viewports=captures,
+    )
+
 
-    return is_success
+def _record_capture(
+    urlinfo: UrlInfo, saved: SavedScreenshot, captured_at: float, save_path: str
+) -> CaptureResult:
+    """
+    저장된 스크린샷을 인덱스에 등록하고 직전 캡처 대비 변경 여부 판단
+    - 직전 캡처와 dHash 해밍 거리가 CHANGE_THRESHOLD 이하이면 변경 없음으로 봅니다.
+    - KEEP_UNCHANGED가 false이면 변경 없는 캡처는 새 blob을 지우고 직전 캡처의
+      blob을 가리키는 인덱스 항목만 남깁니다.
+    - 결과의 imagePath는 응답으로 나가므로 SAVE_PATH 기준 상대 경로입니다.
+    - return
+        - result: 캡처 결과, 등록 전에 보존 정책이 같은 내용의 blob을 지웠으면 None
+          (다시 저장 필요)
+    """
+    screenshot_index = get_screenshot_index(save_path)
+    previous = screenshot_index.latest(urlinfo.name)
+    blob = saved.blob
+
+    hamming = None
+    is_changed = True
+    if previous and previous.phash:
+        hamming = hamming_distance(previous.phash, saved.phash)
+        is_changed = hamming > _config.CHANGE_THRESHOLD
+
+    image_path = None
+    if not is_changed and not _config.KEEP_UNCHANGED:
+        # 직전 캡처 파일이 보존 정책으로 지워졌으면 새 blob을 그대로 등록
+        if screenshot_index.add(
+            urlinfo.name,
+            screenshot_index.absolute_path(previous),
+            captured_at,
+            blob_hash=previous.blob_hash,
+            phash=previous.phash,
+            require_file=True,
+        ) is not None:
+            image_path = screenshot_index.absolute_path(previous)
+            if blob.is_new:
+                screenshot_index.remove_unreferenced(blob.path)
+            _logger.info(f"Screenshot unchanged, discarded: {urlinfo.name}")
+
+    if image_path is None:
+        if screenshot_index.add(
+            urlinfo.name,
+            blob.path,
+            captured_at,
+            blob_hash=blob.digest,
+            phash=saved.phash,
+            require_file=True,
+        ) is None:
+            return None
+        image_path = blob.path
+        if blob.is_new:
+            _logger.info(f"Screenshot saved: {blob.path}")
+        else:
+            _logger.info(f"Screenshot identical, reusing blob: {blob.path}")
+
+    return CaptureResult(
+        urlinfo=urlinfo,
+        isSuccess=True,
+        imagePath=screenshot_index.relative_path(image_path),
+        isChanged=is_changed,
+        hammingDistance=hamming,
+    )
+
+
+def _record_probe_unchanged(
+    urlinfo: UrlInfo, probed: ProbeOutcome, save_path: str
+) -> Optional[CaptureResult]:
+    """
+    사전 확인에서 변경이 없던 캡처를 직전 캡처의 blob을 가리키는 인덱스 항목으로 기록
+    - return
+        - result: 캡처 결과, 재사용할 직전 캡처가 없으면 None (전체 캡처 필요)
+    """
+    screenshot_index = get_screenshot_index(save_path)
+    previous = screenshot_index.latest(urlinfo.name)
+    if previous is None or screenshot_index.add(
+        urlinfo.name,
+        screenshot_index.absolute_path(previous),
+        time.time(),
+        blob_hash=previous.blob_hash,
+        phash=previous.phash,
+        require_file=True,
+    ) is None:
+        return None
+    screenshot_index.save_probe(urlinfo.name, probed.validators)
+    _logger.info(
+        f"Screenshot unchanged ({probed.unchanged_by}), render skipped: {urlinfo.name}"
+    )
+    return CaptureResult(
+        urlinfo=urlinfo,
+        isSuccess=True,
+        imagePath=previous.image_path,
+        isChanged=False,
+        hammingDistance=0,
+        probeSignal=probed.unchanged_by,
+    )
 
 
 async def capture_all(
     urlinfos: list[UrlInfo],
-) -> tuple[list[UrlInfo], list[UrlInfo]]:
+    viewports: Optional[list[Viewport]] = None,
+) -> AsyncIterator[CaptureResult]:
     """
     스크린샷 캡처 여러건
     - param
         - urls: 스크린샷 캡처 대상 URL 리스트
+        - viewports: 뷰포트 매트릭스 (capture_one 참고)
     - return
-        - passed_url: 캡처 성공한 URL 리스트
-        - failed_url: 캡처 실패한 URL 리스트
+        - results: 캡처가 끝나는 순서대로 CaptureResult를 내보내는 async generator
     """
     _logger.debug(f"capture called for multi urls: {urlinfos}")
 
-    passed_url = []
-    failed_url = []
-
     if not urlinfos or len(urlinfos) < 2:
         raise ValueError("urls must contain at least two URLs.")
 
-    tasks = []
-    for urlinfo in urlinfos:
-        tasks.append(capture_one(urlinfo))
-
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # 동시 캡처 수는 capture_one 내부에서 CaptureQueue가 제한
+    tasks = [
+        asyncio.create_task(_capture_one_safely(urlinfo, viewports))
+        for urlinfo in urlinfos
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # 호출자가 중간에 소비를 멈추면(클라이언트 연결 종료 등) 남은 캡처 취소
+        for task in tasks:
+            task.cancel()
 
-    for urlinfo, result in zip(urlinfos, results):
-        if isinstance(result, Exception):
-            msg = f"Error occurred while capturing {urlinfo.url}: {result}"
-            _logger.error(msg)
-            failed_url.append(urlinfo)
-        elif result:
-            passed_url.append(urlinfo)
-        else:
-            failed_url.append(urlinfo)
 
-    return passed_url, failed_url
+async def _capture_one_safely(
+    urlinfo: UrlInfo, viewports: Optional[list[Viewport]] = None
+) -> CaptureResult:
+    try:
+        return await capture_one(urlinfo, viewports=viewports)
+    except Exception as e:
+        msg = f"Error occurred while capturing {urlinfo.url}: {e}"
+        _logger.error(msg)
+        return CaptureResult(urlinfo=urlinfo, isSuccess=False, errorMsg=str(e))
@@ -0,0 +1,88 @@
+import asyncio
+
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+from src.config import ConfigManager
+from src.logger import get_logger
+
+_logger = get_logger(__name__)
+_config = ConfigManager()
+
+
+class CaptureQueue:
+    """
+    캡처 대기열
+    - 전체 동시 캡처 수(MAX_CONCURRENCY)와 호스트별 동시 캡처 수
+      (MAX_CONCURRENCY_PER_HOST)를 제한합니다.
+    - 자리가 없으면 요청 순서대로 대기하고, 한도에 걸린 호스트의 요청은
+      다른 호스트의 요청을 막지 않습니다.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(CaptureQueue, cls).__new__(cls)
+            cls._instance._reset(None)
+        return cls._instance
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """
+        캡처 슬롯 확보
+        - param
+            - url: 캡처 대상 URL (호스트별 한도 계산에 사용)
+        """
+        host = urlparse(url).hostname or ""
+        condition = self._get_condition()
+        async with condition:
+            self._waiting += 1
+            try:
+                await condition.wait_for(lambda: self._has_room(host))
+            finally:
+                self._waiting -= 1
+            self._active += 1
+            self._active_per_host[host] += 1
+        _logger.debug(
+            f"Capture slot acquired for {host} "
+            f"(active={self._active}, waiting={self._waiting})"
+        )
+        try:
+            yield
+        finally:
+            async with condition:
+                self._active -= 1
+                self._active_per_host[host] -= 1
+                if self._active_per_host[host] <= 0:
+                    del self._active_per_host[host]
+                condition.notify_all()
+
+    def _has_room(self, host: str) -> bool:
+        max_concurrency = max(1, _config.MAX_CONCURRENCY)
+        max_per_host = max(1, _config.MAX_CONCURRENCY_PER_HOST)
+        return (
+            self._active < max_concurrency
+            and self._active_per_host[host] < max_per_host
+        )
+
+    def _get_condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 다른 이벤트 루프의 대기열 상태는 더 이상 유효하지 않음
+            self._reset(loop)
+        return self._condition
+
+    def _reset(self, loop):
+        self._loop = loop
+        self._condition = asyncio.Condition() if loop else None
+        self._active = 0
+        self._waiting = 0
+        self._active_per_host = defaultdict(int)
@@ -0,0 +1,187 @@
+import asyncio
+import heapq
+import random
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+from src.capture import capture_one
+from src.config import ConfigManager
+from src.cron import CronExpression
+from src.logger import get_logger
+from src.models import UrlInfo
+
+_logger = get_logger(__name__)
+_config = ConfigManager()
+
+# 시스템별 일정 섹션: 시스템명=cron 표현식
+SCHEDULES_SECTION = "SCHEDULES"
+# 대기할 일정이 없을 때 다시 확인하는 주기 (초)
+IDLE_INTERVAL = 60.0
+
+
+@dataclass
+class ScheduleEntry:
+    """
+    시스템별 캡처 일정
+    - cron 실행 시각에 offset(시차 분산)과 0~jitter초의 무작위 지연을 더해 실행합니다.
+    """
+    urlinfo: UrlInfo
+    cron: CronExpression
+    offset: float = 0.0
+    jitter: float = 0.0
+
+    def next_fire(self, after: datetime) -> datetime:
+        """
+        다음 실행 시각 계산 (cron 시각 + offset + jitter)
+        - 밀려서 지나간 cron 시각은 건너뛰고 after 이후 시각부터 계산합니다.
+        - param
+            - after: 기준 시각
+        """
+        delay = self.offset + random.uniform(0, self.jitter)
+        return self.cron.next_after(after) + timedelta(seconds=delay)
+
+
+def build_schedule(urlinfos: list[UrlInfo]) -> list[ScheduleEntry]:
+    """
+    설정 파일에서 시스템별 캡처 일정 생성
+    - [SCHEDULES]에 시스템명=cron이 있으면 그 일정을, 없으면 [SCHEDULE] DEFAULT를 사용합니다.
+    - 같은 cron을 쓰는 시스템은 STAGGER_SECONDS 구간에 고르게 시작 시각을 나눕니다.
+    - param
+        - urlinfos: 캡처 대상 목록
+    - return
+        - entries: 캡처 일정 목록
+    """
+    schedules = _config.get_section(SCHEDULES_SECTION)
+    default = _config.SCHEDULE_DEFAULT.strip()
+    by_expression: dict[str, list[UrlInfo]] = {}
+    for urlinfo in urlinfos:
+        expression = schedules.get(urlinfo.name, default).strip()
+        if expression:
+            by_expression.setdefault(expression, []).append(urlinfo)
+
+    stagger = max(0, _config.SCHEDULE_STAGGER_SECONDS)
+    jitter = max(0, _config.SCHEDULE_JITTER_SECONDS)
+    entries = []
+    for expression, group in by_expression.items():
+        cron = CronExpression(expression)
+        step = stagger / len(group)
+        for index, urlinfo in enumerate(sorted(group, key=lambda u: u.name)):
+            entries.append(ScheduleEntry(
+                urlinfo=urlinfo, cron=cron, offset=index * step, jitter=jitter
+            ))
+    return entries
+
+
+class CaptureScheduler:
+    """
+    앱 내장 캡처 스케줄러
+    - 시스템별 cron 일정에 따라 capture_one을 실행합니다.
+    - PROBE_ENABLED이면 렌더링 전에 HTTP 검증값으로 변경 여부를 먼저 확인합니다.
+    - 실행 시각이 겹쳐도 RATE_PER_MINUTE 간격으로 하나씩 내보내 캡처 부하를 고르게 유지합니다.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(CaptureScheduler, cls).__new__(cls)
+            cls._instance._queue = []
+            cls._instance._sequence = 0
+            cls._instance._last_dispatch = None
+            cls._instance._task = None
+            cls._instance._captures = set()
+        return cls._instance
+
+    @property
+    def is_started(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def min_interval(self) -> float:
+        return 60.0 / max(1, _config.SCHEDULE_RATE_PER_MINUTE)
+
+    def load(self, entries: list[ScheduleEntry], now: Optional[datetime] = None):
+        """
+        캡처 일정 등록 (기존 일정은 지움)
+        """
+        now = now or datetime.now()
+        self._queue = []
+        for entry in entries:
+            self._push(entry, entry.next_fire(now))
+        for fire_at, _, entry in sorted(self._queue):
+            _logger.info(
+                f"Capture scheduled: {entry.urlinfo.name} at {fire_at:%Y-%m-%d %H:%M:%S}"
+            )
+
+    def start(self):
+        """
+        설정 파일의 일정으로 스케줄러 기동
+        """
+        if self.is_started:
+            return
+        self.load(build_schedule(_config.URLS))
+        self._task = asyncio.create_task(self._run())
+        _logger.info(f"Capture scheduler started with {len(self._queue)} system(s).")
+
+    async def stop(self):
+        """
+        스케줄러 종료 (진행 중인 캡처도 취소)
+        """
+        tasks = [self._task, *self._captures] if self._task else list(self._captures)
+        self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._captures.clear()
+        if tasks:
+            _logger.info("Capture scheduler stopped.")
+
+    async def _run(self):
+        while True:
+            delay = self.dispatch_due(datetime.now())
+            await asyncio.sleep(delay)
+
+    def dispatch_due(self, now: datetime) -> float:
+        """
+        실행 시각이 지난 일정 중 가장 이른 하나를 실행
+        - 직전 실행 후 min_interval이 지나지 않았으면 실행하지 않습니다.
+        - return
+            - delay: 다음 확인까지 대기할 시간 (초)
+        """
+        if not self._queue:
+            return IDLE_INTERVAL
+        if self._last_dispatch is not None:
+            wait = self.min_interval - (now - self._last_dispatch).total_seconds()
+            if wait > 0:
+                return wait
+
+        fire_at, _, entry = self._queue[0]
+        if fire_at > now:
+            return min((fire_at - now).total_seconds(), IDLE_INTERVAL)
+
+        heapq.heappop(self._queue)
+        self._push(entry, entry.next_fire(now))
+        self._last_dispatch = now
+        delay = (now - fire_at).total_seconds()
+        _logger.info(
+            f"Scheduled capture started: {entry.urlinfo.name} (delayed {delay:.1f}s)"
+        )
+        task = asyncio.create_task(self._capture(entry.urlinfo))
+        self._captures.add(task)
+        task.add_done_callback(self._captures.discard)
+        return self.min_interval if self._queue else IDLE_INTERVAL
+
+    def _push(self, entry: ScheduleEntry, fire_at: datetime):
+        self._sequence += 1
+        heapq.heappush(self._queue, (fire_at, self._sequence, entry))
+
+    async def _capture(self, urlinfo: UrlInfo):
+        try:
+            result = await capture_one(urlinfo, probe=_config.PROBE_ENABLED)
+        except Exception as e:
+            _logger.error(f"Scheduled capture failed: {urlinfo.name}: {e}")
+            return
+        if not result.isSuccess:
+            _logger.error(
+                f"Scheduled capture failed: {urlinfo.name}: {result.errorMsg}"
+            )
@@ -0,0 +1,317 @@
+import asyncio
+import atexit
+import multiprocessing
+import threading
+import uuid
+
+from typing import AsyncIterator, Optional
+from urllib.parse import urlparse
+from src.config import ConfigManager
+from src.logger import get_logger
+from src.metrics import observe_capture
+from src.models import CaptureResult, UrlInfo
+from src.viewport import Viewport
+
+_logger = get_logger(__name__)
+_config = ConfigManager()
+
+# 워커 메시지 종류
+MESSAGE_CAPTURE = "capture"
+MESSAGE_CANCEL = "cancel"
+# 배치 결과 큐에서 워커 프로세스가 죽었음을 알리는 표시
+WORKER_EXITED = "exited"
+WORKER_JOIN_TIMEOUT = 30
+# 배치를 기다리는 동안 워커 프로세스 생존 확인 주기 (초)
+WORKER_POLL_INTERVAL = 1.0
+
+
+def shard_urlinfos(urlinfos: list[UrlInfo], shard_count: int) -> list[list[UrlInfo]]:
+    """
+    캡처 대상을 워커 수만큼 나눔
+    - 같은 호스트는 한 배치 안에서 같은 워커에 배정되어 배치 단위로는 MAX_CONCURRENCY_PER_HOST가 지켜집니다.
+      배치가 여러 개 동시에 돌면 같은 호스트가 다른 워커에 배정될 수 있고,
+      이때 호스트 동시성 제한과 같은 URL 중복 캡처 방지(single-flight)는 워커 프로세스마다 따로 적용됩니다.
+    - URL이 많은 호스트부터 가장 적게 배정된 워커에 넣어 워커별 URL 수를 고르게 맞춥니다.
+    - param
+        - urlinfos: 캡처 대상 목록
+        - shard_count: 워커 수
+    - return
+        - shards: 워커별 캡처 대상 목록 (비어 있을 수 있음)
+    """
+    by_host: dict[str, list[UrlInfo]] = {}
+    for urlinfo in urlinfos:
+        host = (urlparse(urlinfo.url or "").hostname or "").lower()
+        by_host.setdefault(host, []).append(urlinfo)
+
+    shards = [[] for _ in range(max(1, shard_count))]
+    for host_urlinfos in sorted(by_host.values(), key=len, reverse=True):
+        min(shards, key=len).extend(host_urlinfos)
+    return shards
+
+
+class CaptureWorkerPool:
+    """
+    멀티 프로세스 캡처 워커 풀
+    - 워커 프로세스마다 자체 이벤트 루프, Playwright 드라이버, 브라우저 풀을 띄웁니다.
+    - capture_all 배치를 호스트 단위로 나눠 워커에 보내고, 결과는 끝나는 순서대로 받습니다.
+    - BROWSER_POOL_SIZE, MAX_CONCURRENCY는 워커 프로세스마다 적용됩니다.
+    - 배치 도중 워커가 죽으면 그 워커에 남은 캡처는 실패로 돌려주고 워커를 다시 띄웁니다.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(CaptureWorkerPool, cls).__new__(cls)
+            cls._instance._workers = []
+            cls._instance._results = None
+            cls._instance._reader = None
+            cls._instance._batches = {}
+            cls._instance._lock = threading.Lock()
+        return cls._instance
+
+    @property
+    def is_started(self) -> bool:
+        return bool(self._workers)
+
+    @property
+    def size(self) -> int:
+        return len(self._workers)
+
+    def start(self, workers: Optional[int] = None):
+        """
+        워커 프로세스 기동
+        - param
+            - workers: 워커 수, 없으면 CAPTURE_WORKERS 설정값
+        """
+        with self._lock:
+            if self._workers:
+                return
+            count = workers or _config.CAPTURE_WORKERS
+            if count < 1:
+                raise ValueError("Capture workers must be at least 1.")
+            self._results = multiprocessing.get_context("spawn").Queue()
+            for index in range(count):
+                self._workers.append(self._spawn(index))
+            self._reader = threading.Thread(
+                target=self._read_results, name="capture-worker-results", daemon=True
+            )
+            self._reader.start()
+            atexit.register(self.stop)
+        _logger.info(f"Capture worker pool started with {count} worker(s).")
+
+    def _spawn(self, index: int) -> tuple:
+        context = multiprocessing.get_context("spawn")
+        inbox = context.Queue()
+        # 워커가 인코딩 프로세스 풀을 띄우므로 daemon 프로세스로 만들 수 없음
+        process = context.Process(
+            target=_worker_main,
+            args=(index, inbox, self._results),
+            name=f"capture-worker-{index}",
+        )
+        process.start()
+        return process, inbox
+
+    def _restart(self, index: int, process):
+        """
+        죽은 워커 프로세스를 새로 띄움 (다른 배치가 이미 다시 띄웠으면 무시)
+        """
+        with self._lock:
+            if index >= len(self._workers) or self._workers[index][0] is not process:
+                return
+            process.join(0)
+            self._workers[index] = self._spawn(index)
+        _logger.warning(
+            f"{process.name} exited with code {process.exitcode}, restarted."
+        )
+
+    def stop(self):
+        """
+        워커 프로세스 종료
+        """
+        with self._lock:
+            workers, self._workers = self._workers, []
+            if not workers:
+                return
+            for _, inbox in workers:
+                inbox.put(None)
+            for process, _ in workers:
+                process.join(WORKER_JOIN_TIMEOUT)
+                if process.is_alive():
+                    _logger.warning(f"{process.name} did not stop, terminating.")
+                    process.terminate()
+                    process.join()
+            self._results.put(None)
+            self._reader.join()
+            self._results = None
+            self._reader = None
+            atexit.unregister(self.stop)
+        _logger.info("Capture worker pool stopped.")
+
+    async def capture(
+        self, urlinfos: list[UrlInfo], viewports: Optional[list[Viewport]] = None
+    ) -> AsyncIterator[CaptureResult]:
+        """
+        캡처 대상을 워커에 나눠 캡처
+        - param
+            - urlinfos: 캡처 대상 목록
+            - viewports: 뷰포트 매트릭스 (capture_one 참고)
+        - return
+            - results: 캡처가 끝나는 순서대로 CaptureResult를 내보내는 async generator
+        """
+        if not self.is_started:
+            self.start()
+        loop = asyncio.get_running_loop()
+        batch_id = uuid.uuid4().hex
+        results: asyncio.Queue = asyncio.Queue()
+        self._batches[batch_id] = (loop, results)
+
+        workers = list(self._workers)
+        shards = shard_urlinfos(urlinfos, len(workers))
+        # 워커 번호 → (프로세스, 아직 결과가 오지 않은 캡처 대상)
+        pending: dict[int, tuple] = {}
+        watcher = None
+        try:
+            for index, ((process, inbox), shard) in enumerate(zip(workers, shards)):
+                if shard:
+                    payload = ([u.model_dump() for u in shard], viewports)
+                    inbox.put((MESSAGE_CAPTURE, batch_id, payload))
+                    pending[index] = (process, list(shard))
+            watcher = asyncio.create_task(self._watch(pending, results))
+            while pending:
+                index, payload = await results.get()
+                if index not in pending:
+                    # 실패 처리한 워커가 죽기 전에 보낸 결과
+                    continue
+                process, remains = pending[index]
+                if payload is WORKER_EXITED:
+                    pending.pop(index)
+                    self._restart(index, process)
+                    for urlinfo in remains:
+                        result = CaptureResult(
+                            urlinfo=urlinfo,
+                            isSuccess=False,
+                            errorMsg=f"Capture worker {index} exited unexpectedly.",
+                        )
+                        observe_capture(result)
+                        yield result
+                    continue
+                if payload is None:
+                    pending.pop(index)
+                    continue
+                result = CaptureResult.model_validate(payload)
+                if result.urlinfo in remains:
+                    remains.remove(result.urlinfo)
+                # 워커 프로세스의 메트릭은 API 프로세스 /metrics에 보이지 않으므로 여기서 기록
+                observe_capture(result)
+                yield result
+        finally:
+            if watcher:
+                watcher.cancel()
+            self._batches.pop(batch_id, None)
+            # 호출자가 중간에 소비를 멈추면 워커에 남은 캡처 취소
+            for index in pending:
+                workers[index][1].put((MESSAGE_CANCEL, batch_id, None))
+
+    @staticmethod
+    async def _watch(pending: dict[int, tuple], results: asyncio.Queue):
+        """
+        배치가 끝날 때까지 워커 프로세스 생존 확인 (죽은 워커는 WORKER_EXITED로 알림)
+        """
+        reported = set()
+        while True:
+            await asyncio.sleep(WORKER_POLL_INTERVAL)
+            for index, (process, _) in list(pending.items()):
+                if index not in reported and not process.is_alive():
+                    reported.add(index)
+                    results.put_nowait((index, WORKER_EXITED))
+
+    def _read_results(self):
+        while True:
+            message = self._results.get()
+            if message is None:
+                return
+            batch_id, index, payload = message
+            batch = self._batches.get(batch_id)
+            if batch is None:
+                continue
+            loop, results = batch
+            try:
+                loop.call_soon_threadsafe(results.put_nowait, (index, payload))
+            except RuntimeError:
+                # 배치를 요청한 이벤트 루프가 이미 닫힘
+                self._batches.pop(batch_id, None)
+
+
+def _worker_main(index: int, inbox, results):
+    asyncio.run(_serve(index, inbox, results))
+
+
+async def _serve(index: int, inbox, results):
+    """
+    워커 프로세스: 배치를 받아 자체 브라우저 풀로 캡처하고 결과를 돌려보냄
+    """
+    from src.browser_pool import BrowserPool
+    from src.image_encoder import shutdown_encoder
+    from src.image_pyramid import wait_pyramids
+
+    browser_pool = BrowserPool()
+    try:
+        await browser_pool.start()
+    except Exception as e:
+        # 브라우저 풀은 첫 캡처시 다시 기동을 시도함
+        _logger.error(f"Capture worker {index} failed to start browser pool: {e}")
+
+    loop = asyncio.get_running_loop()
+    tasks: dict[str, asyncio.Task] = {}
+    while True:
+        try:
+            message = await loop.run_in_executor(None, inbox.get)
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+        kind, batch_id, payload = message
+        if kind == MESSAGE_CANCEL:
+            task = tasks.pop(batch_id, None)
+            if task:
+                task.cancel()
+            continue
+        urlinfo_dicts, viewports = payload
+        urlinfos = [UrlInfo.model_validate(u) for u in urlinfo_dicts]
+        task = asyncio.create_task(
+            _run_batch(index, batch_id, urlinfos, viewports, results)
+        )
+        tasks[batch_id] = task
+        task.add_done_callback(lambda _, batch_id=batch_id: tasks.pop(batch_id, None))
+
+    for task in list(tasks.values()):
+        task.cancel()
+    await asyncio.gather(*tasks.values(), return_exceptions=True)
+    await browser_pool.stop()
+    await wait_pyramids()
+    shutdown_encoder()
+
+
+async def _run_batch(
+    index: int,
+    batch_id: str,
+    urlinfos: list[UrlInfo],
+    viewports: Optional[list[Viewport]],
+    results,
+):
+    from src.capture import capture_all, capture_one
+
+    try:
+        if len(urlinfos) == 1:
+            try:
+                result = await capture_one(urlinfos[0], viewports=viewports)
+            except Exception as e:
+                result = CaptureResult(
+                    urlinfo=urlinfos[0], isSuccess=False, errorMsg=str(e)
+                )
+            results.put((batch_id, index, result.model_dump()))
+        else:
+            async for result in capture_all(urlinfos, viewports):
+                results.put((batch_id, index, result.model_dump()))
+    finally:
+        results.put((batch_id, index, None))
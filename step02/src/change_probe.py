@@ -0,0 +1,136 @@
+import asyncio
+import hashlib
+import re
+
+from dataclasses import dataclass
+from typing import Optional
+import httpx
+from src.config import ConfigManager
+from src.logger import get_logger
+from src.models import UrlInfo
+from src.screenshot_index import ProbeValidators
+
+_logger = get_logger(__name__)
+_config = ConfigManager()
+
+# 사전 확인으로 변경 없음을 판단한 근거
+PROBE_NOT_MODIFIED = "not-modified"
+PROBE_DOM_HASH = "dom-hash"
+
+# 요청마다 달라져 DOM 해시를 흔드는 부분 (스크립트, 스타일, 주석)
+_VOLATILE_HTML = re.compile(
+    r"<script\b.*?</script\s*>|<style\b.*?</style\s*>|<noscript\b.*?</noscript\s*>"
+    r"|<!--.*?-->",
+    re.IGNORECASE | re.DOTALL,
+)
+_WHITESPACE = re.compile(r"\s+")
+_BETWEEN_TAGS = re.compile(r">\s+<")
+
+
+@dataclass
+class ProbeOutcome:
+    """
+    사전 변경 확인 결과
+    - unchanged_by: 변경 없음으로 판단한 근거, 변경되었거나 판단할 수 없으면 None
+    - validators: 이번 응답의 검증값 (캡처가 끝나면 저장)
+    """
+    unchanged_by: Optional[str] = None
+    validators: Optional[ProbeValidators] = None
+
+
+def normalize_html(html: str) -> str:
+    """
+    DOM 해시용 HTML 정규화 (스크립트/스타일/주석 제거, 공백 정리)
+    """
+    html = _VOLATILE_HTML.sub("", html)
+    html = _BETWEEN_TAGS.sub("><", html)
+    return _WHITESPACE.sub(" ", html).strip()
+
+
+def dom_hash(html: str) -> str:
+    """
+    정규화한 HTML의 SHA-256
+    """
+    return hashlib.sha256(normalize_html(html).encode("utf-8")).hexdigest()
+
+
+class ProbeClient:
+    """
+    사전 변경 확인용 HTTP 클라이언트
+    - 이벤트 루프마다 httpx.AsyncClient 하나를 만들어 연결을 재사용합니다.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ProbeClient, cls).__new__(cls)
+            cls._instance._client = None
+            cls._instance._loop = None
+        return cls._instance
+
+    def get(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            # 다른 이벤트 루프에서 만든 클라이언트의 연결은 재사용할 수 없음
+            self._client = httpx.AsyncClient(
+                follow_redirects=True,
+                timeout=_config.PROBE_TIMEOUT,
+                limits=httpx.Limits(max_connections=_config.MAX_CONCURRENCY * 2),
+            )
+            self._loop = loop
+        return self._client
+
+    async def close(self):
+        client, self._client = self._client, None
+        if client is not None and self._loop is asyncio.get_running_loop():
+            await client.aclose()
+        self._loop = None
+
+
+async def probe_change(
+    urlinfo: UrlInfo, previous: Optional[ProbeValidators]
+) -> ProbeOutcome:
+    """
+    브라우저를 띄우기 전에 조건부 GET으로 페이지 변경 여부 확인
+    - 직전 캡처의 ETag/Last-Modified로 If-None-Match/If-Modified-Since를 보내
+      304를 받으면 변경 없음으로 봅니다.
+    - PROBE_DOM_HASH가 켜져 있으면 200 응답의 정규화한 HTML 해시도 비교합니다.
+    - 요청이 실패하면 변경 여부를 판단하지 않습니다. (전체 캡처 진행)
+    - param
+        - urlinfo: 캡처 대상
+        - previous: 직전 캡처의 검증값
+    - return
+        - outcome: 사전 확인 결과
+    """
+    if previous is not None and previous.url != urlinfo.url:
+        # 시스템 URL이 바뀌었으면 이전 검증값은 쓸 수 없음
+        previous = None
+    headers = {}
+    if previous and previous.etag:
+        headers["If-None-Match"] = previous.etag
+    if previous and previous.last_modified:
+        headers["If-Modified-Since"] = previous.last_modified
+
+    try:
+        async with ProbeClient().get().stream(
+            "GET", urlinfo.url, headers=headers
+        ) as response:
+            if response.status_code == httpx.codes.NOT_MODIFIED and previous:
+                return ProbeOutcome(PROBE_NOT_MODIFIED, previous)
+            if response.status_code != httpx.codes.OK:
+                return ProbeOutcome()
+            validators = ProbeValidators(
+                url=urlinfo.url,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+            if _config.PROBE_DOM_HASH:
+                await response.aread()
+                validators.dom_hash = dom_hash(response.text)
+    except httpx.HTTPError as e:
+        _logger.warning(f"Change probe failed for {urlinfo.url}: {e}")
+        return ProbeOutcome()
+
+    if previous and validators.dom_hash and validators.dom_hash == previous.dom_hash:
+        return ProbeOutcome(PROBE_DOM_HASH, validators)
+    return ProbeOutcome(validators=validators)
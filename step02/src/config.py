@@ -2,24 +2,52 @@ import configparser
 import logging
 import os
 
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Optional
 from src.models import UrlInfo
 from src.logger import get_logger
 
 logger = get_logger(__name__, level=logging.DEBUG)
 
 
+@dataclass(frozen=True)
+class UrlIndex:
+    """
+    [URLS] 섹션의 캡처 대상 목록과 시스템명 → UrlInfo 조회 테이블
+    - load()마다 한 번 만들고 통째로 교체하므로 읽는 쪽은 항상 한 시점의 목록을 봅니다.
+    """
+    urls: tuple[UrlInfo, ...] = ()
+    by_name: Mapping[str, UrlInfo] = field(default_factory=lambda: MappingProxyType({}))
+
+    @classmethod
+    def build(cls, urls) -> "UrlIndex":
+        urls = tuple(urls)
+        return cls(
+            urls=urls,
+            by_name=MappingProxyType({urlinfo.name: urlinfo for urlinfo in urls}),
+        )
+
+
 class ConfigManager:
     _instance = None
     CONFIG_FILE = "config.ini"
     SAMPLE_FILE = "config.sample.ini"
 
     @property
-    def URLS(self):
-        urls: list[UrlInfo] = []
-        if "URLS" in self._config:
-            for name, url in self._config.items("URLS"):
-                urls.append(UrlInfo(name=name, url=url))
-        return urls
+    def URL_INDEX(self) -> UrlIndex:
+        # load()에서 미리 만들어 둔 목록 (접근할 때마다 UrlInfo를 새로 만들지 않음)
+        return self._url_index
+
+    @property
+    def URLS(self) -> tuple[UrlInfo, ...]:
+        return self.URL_INDEX.urls
+
+    def get_url(self, name: str) -> Optional[UrlInfo]:
+        """
+        시스템명으로 캡처 대상 조회 (O(1), 없으면 None)
+        """
+        return self.URL_INDEX.by_name.get(name)
 
     @property
     def WEBP_QUALITY(self):
@@ -31,6 +59,19 @@ class ConfigManager:
             "SCREENSHOT", "IMG_MAX_WIDTH", fallback=1280
         )
 
+    @property
+    def THUMBNAIL_WIDTH(self):
+        return self._config.getint("SCREENSHOT", "THUMBNAIL_WIDTH", fallback=320)
+
+    @property
+    def THUMBNAIL_HEIGHT(self):
+        # 썸네일은 페이지 상단만 이 높이로 자름 (0이면 자르지 않음)
+        return self._config.getint("SCREENSHOT", "THUMBNAIL_HEIGHT", fallback=200)
+
+    @property
+    def MEDIUM_WIDTH(self):
+        return self._config.getint("SCREENSHOT", "MEDIUM_WIDTH", fallback=640)
+
     @property
     def TIMEOUT(self):
         return self._config.getint("SCREENSHOT", "TIMEOUT", fallback=30)
@@ -40,7 +81,176 @@ class ConfigManager:
         return self._config.get(
             "SCREENSHOT", "SAVE_PATH", fallback="./data/screenshots/"
         )
+
+    @property
+    def BROWSER_POOL_SIZE(self):
+        return self._config.getint(
+            "SCREENSHOT", "BROWSER_POOL_SIZE", fallback=2
+        )
+
+    @property
+    def BROWSER_MAX_CONTEXTS(self):
+        # 브라우저 하나에서 만들 BrowserContext 수, 넘으면 교체 (0이면 제한 없음)
+        return self._config.getint(
+            "SCREENSHOT", "BROWSER_MAX_CONTEXTS", fallback=200
+        )
+
+    @property
+    def BROWSER_MAX_RSS_MB(self):
+        # 브라우저 프로세스 RSS 한도 (MB), 넘으면 교체 (0이면 제한 없음)
+        return self._config.getint(
+            "SCREENSHOT", "BROWSER_MAX_RSS_MB", fallback=1024
+        )
+
+    @property
+    def MAX_CONCURRENCY(self):
+        return self._config.getint(
+            "SCREENSHOT", "MAX_CONCURRENCY", fallback=4
+        )
+
+    @property
+    def MAX_CONCURRENCY_PER_HOST(self):
+        return self._config.getint(
+            "SCREENSHOT", "MAX_CONCURRENCY_PER_HOST", fallback=2
+        )
+
+    @property
+    def CAPTURE_WORKERS(self):
+        # 0이면 API 프로세스에서 캡처, 1 이상이면 여러 건 캡처를 워커 프로세스에 분산
+        return self._config.getint(
+            "SCREENSHOT", "CAPTURE_WORKERS", fallback=0
+        )
+
+    @property
+    def ENCODER_WORKERS(self):
+        # 0이면 CPU 코어 수만큼 사용 (캡처 워커를 쓰면 워커 수로 나눔)
+        return self._config.getint(
+            "SCREENSHOT", "ENCODER_WORKERS", fallback=0
+        )
+
+    @property
+    def CHANGE_THRESHOLD(self):
+        # 직전 캡처와의 dHash 해밍 거리가 이 값을 넘으면 변경으로 판단
+        return self._config.getint(
+            "SCREENSHOT", "CHANGE_THRESHOLD", fallback=4
+        )
+
+    @property
+    def KEEP_UNCHANGED(self):
+        return self._config.getboolean(
+            "SCREENSHOT", "KEEP_UNCHANGED", fallback=True
+        )
+
+    @property
+    def READY_QUIET_MS(self):
+        # DOM 변경이 이 시간(ms) 동안 없으면 화면이 안정된 것으로 판단
+        return self._config.getint(
+            "SCREENSHOT", "READY_QUIET_MS", fallback=500
+        )
+
+    @property
+    def DIFF_WIDTH(self):
+        return self._config.getint("SCREENSHOT", "DIFF_WIDTH", fallback=320)
         
+    @property
+    def FRESH_SECONDS(self):
+        # 이 시간 안에 성공한 같은 캡처가 있으면 새로 캡처하지 않고 재사용 (0이면 사용 안함)
+        return self._config.getint("SCREENSHOT", "FRESH_SECONDS", fallback=0)
+
+    @property
+    def LAYOUT_QUIET_MS(self):
+        # 뷰포트 매트릭스 캡처에서 크기 변경 후 레이아웃 안정 판단 시간
+        return self._config.getint("SCREENSHOT", "LAYOUT_QUIET_MS", fallback=200)
+
+    @property
+    def PROBE_ENABLED(self):
+        # 예약 캡처 전에 ETag/Last-Modified로 변경 여부를 먼저 확인
+        return self._config.getboolean("PROBE", "ENABLED", fallback=True)
+
+    @property
+    def PROBE_DOM_HASH(self):
+        # 검증값이 없거나 바뀌어도 정규화한 HTML이 같으면 변경 없음으로 판단
+        return self._config.getboolean("PROBE", "DOM_HASH", fallback=False)
+
+    @property
+    def PROBE_TIMEOUT(self):
+        return self._config.getint("PROBE", "TIMEOUT", fallback=10)
+
+    @property
+    def SCHEDULE_ENABLED(self):
+        return self._config.getboolean("SCHEDULE", "ENABLED", fallback=False)
+
+    @property
+    def SCHEDULE_DEFAULT(self):
+        # [SCHEDULES]에 일정이 없는 시스템에 적용할 cron (비우면 실행하지 않음)
+        return self._config.get("SCHEDULE", "DEFAULT", fallback="")
+
+    @property
+    def SCHEDULE_STAGGER_SECONDS(self):
+        # 같은 cron을 쓰는 시스템의 시작 시각을 나눠 둘 구간 (초)
+        return self._config.getint("SCHEDULE", "STAGGER_SECONDS", fallback=600)
+
+    @property
+    def SCHEDULE_JITTER_SECONDS(self):
+        return self._config.getint("SCHEDULE", "JITTER_SECONDS", fallback=30)
+
+    @property
+    def SCHEDULE_RATE_PER_MINUTE(self):
+        # 스케줄러가 분당 시작하는 최대 캡처 수
+        return self._config.getint("SCHEDULE", "RATE_PER_MINUTE", fallback=6)
+
+    @property
+    def RETENTION_ENABLED(self):
+        return self._config.getboolean("RETENTION", "ENABLED", fallback=False)
+
+    @property
+    def RETENTION_KEEP_ALL_DAYS(self):
+        # 이 기간의 캡처는 모두 보관
+        return self._config.getint("RETENTION", "KEEP_ALL_DAYS", fallback=7)
+
+    @property
+    def RETENTION_KEEP_DAILY_DAYS(self):
+        # 이 기간까지는 하루 첫 캡처만 보관
+        return self._config.getint("RETENTION", "KEEP_DAILY_DAYS", fallback=90)
+
+    @property
+    def RETENTION_KEEP_MONTHLY_DAYS(self):
+        # 이 기간까지는 한 달 첫 캡처만 보관 (0이면 영구 보관)
+        return self._config.getint("RETENTION", "KEEP_MONTHLY_DAYS", fallback=0)
+
+    @property
+    def RETENTION_INTERVAL_HOURS(self):
+        return self._config.getint("RETENTION", "INTERVAL_HOURS", fallback=24)
+
+    @property
+    def JOB_CONCURRENCY(self):
+        # 동시에 실행할 비동기 작업 수
+        return self._config.getint("JOB", "CONCURRENCY", fallback=2)
+
+    @property
+    def JOB_DB_PATH(self):
+        return self._config.get("JOB", "DB_PATH", fallback="./data/jobs.sqlite3")
+
+    @property
+    def JOB_HEARTBEAT_INTERVAL(self):
+        # 실행 중인 작업의 heartbeat 갱신 주기 (초)
+        return self._config.getint("JOB", "HEARTBEAT_INTERVAL", fallback=10)
+
+    @property
+    def JOB_STALE_TIMEOUT(self):
+        # heartbeat가 이 시간(초) 동안 없으면 중단된 작업으로 보고 다시 대기열에 넣음
+        return self._config.getint("JOB", "STALE_TIMEOUT", fallback=60)
+
+    def get_section(self, section: str) -> dict[str, str]:
+        """
+        설정 섹션의 키/값 반환 (섹션이 없으면 빈 dict)
+        - 섹션 이름은 대소문자를 구분하지 않음 ([URLS] 키가 소문자로 읽히므로)
+        """
+        for name in self._config.sections():
+            if name.lower() == section.lower():
+                return dict(self._config.items(name))
+        return {}
+
     @property
     def AZURE_AI_FOUNDRY_API_KEY(self):
         return self._config.get("KERNEL", "AZURE_AI_FOUNDRY_API_KEY", fallback="")
@@ -84,7 +294,12 @@ class ConfigManager:
         # Parse the configuration file
         try:
             _config.read(config_file_path, encoding="utf-8")
+            url_index = UrlIndex.build(
+                UrlInfo(name=name, url=url)
+                for name, url in (_config.items("URLS") if "URLS" in _config else ())
+            )
             self._config = _config
+            self._url_index = url_index
             msg = f"Configuration from {config_file_path} loaded successfully."
             logger.info(msg)
         except Exception as e:
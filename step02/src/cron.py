@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+
+# (최소값, 최대값) - 분, 시, 일, 월, 요일(0, 7 = 일요일)
+FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+# 다음 실행 시각을 찾을 때 최대 탐색 기간 (2월 29일 같은 드문 일정 포함)
+MAX_SEARCH_YEARS = 5
+
+
+class CronExpression:
+    """
+    5필드 cron 표현식 (분 시 일 월 요일)
+    - *, 목록(1,15), 범위(1-5), 간격(*/10, 0-30/5)을 지원합니다.
+    - 일과 요일이 모두 지정되면 둘 중 하나만 맞아도 실행합니다. (cron과 동일)
+    """
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: {expression}")
+        self.expression = expression
+        parsed = [
+            _parse_field(field, low, high)
+            for field, (low, high) in zip(fields, FIELD_RANGES)
+        ]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        # 7(일요일)은 0으로 통일하고 datetime.weekday() 기준(월=0)으로 변환
+        self.weekdays = {(day % 7 - 1) % 7 for day in weekdays}
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = moment.weekday() in self.weekdays
+        if self._any_day:
+            return weekday_ok
+        if self._any_weekday:
+            return day_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        지정 시각 이후(같은 분 제외) 첫 실행 시각
+        - param
+            - moment: 기준 시각
+        - return
+            - next_run: 다음 실행 시각 (초 단위는 0)
+        """
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * MAX_SEARCH_YEARS)
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year = candidate.year + candidate.month // 12
+                month = candidate.month % 12 + 1
+                candidate = candidate.replace(
+                    year=year, month=month, day=1, hour=0, minute=0
+                )
+            elif not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+            elif candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Cron expression never matches: {self.expression}")
+
+    def __repr__(self) -> str:
+        return f"CronExpression({self.expression!r})"
+
+
+def _parse_field(field: str, low: int, high: int) -> set[int]:
+    values = set()
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step < 1:
+                raise ValueError(f"Invalid cron step: {field}")
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(part)
+            end = high if step > 1 else start
+        if not low <= start <= end <= high:
+            raise ValueError(f"Cron field out of range ({low}-{high}): {field}")
+        values.update(range(start, end + 1, step))
+    return values
@@ -0,0 +1,229 @@
+import hashlib
+import json
+import os
+import re
+import uuid
+
+import numpy as np
+
+from collections import deque
+from PIL import Image
+from typing import Optional
+from src.config import ConfigManager
+from src.image_encoder import run_in_encoder
+from src.logger import get_logger
+from src.screenshot_archive import local_copy
+from src.screenshot_index import IndexEntry, ScreenshotIndex
+
+_logger = get_logger(__name__)
+_config = ConfigManager()
+
+DIFF_DIR = "diffs"
+# 비교 결과 키: 기준 캡처 해시-대상 캡처 해시-비교 너비
+DIFF_KEY_PATTERN = re.compile(r"[0-9a-f]+-[0-9a-f]+-[0-9]+")
+# 픽셀 밝기 차이가 이 값을 넘으면 변경된 픽셀로 판단 (0~255)
+PIXEL_THRESHOLD = 25
+# 변경 영역을 묶는 격자 크기 (비교 해상도 기준 픽셀)
+REGION_CELL = 16
+MAX_REGIONS = 50
+SSIM_WINDOW = 7
+
+
+def compare_images(
+    base_path: str, target_path: str, heatmap_path: str, width: int
+) -> dict:
+    """
+    두 캡처를 같은 크기로 축소해 비교하고 히트맵 저장 (워커 프로세스에서 실행)
+    - param
+        - base_path: 기준 이미지 경로
+        - target_path: 비교 대상 이미지 경로
+        - heatmap_path: 히트맵 저장 경로
+        - width: 비교 해상도 가로 픽셀
+    - return
+        - scores: changedRatio, ssim, changedRegions (대상 이미지 좌표)
+    """
+    Image.MAX_IMAGE_PIXELS = None
+    base, _ = _load_grayscale(base_path, width)
+    target, target_width = _load_grayscale(target_path, width)
+    base, target = _align(base, target)
+
+    diff = np.abs(base - target)
+    mask = diff > PIXEL_THRESHOLD
+    scale = target_width / target.shape[1]
+    regions = [
+        {
+            "x": round(x * scale),
+            "y": round(y * scale),
+            "width": round(w * scale),
+            "height": round(h * scale),
+        }
+        for x, y, w, h in _changed_regions(mask)
+    ]
+
+    _write_heatmap(target, diff, heatmap_path)
+    return {
+        "changedRatio": float(mask.mean()),
+        "ssim": _ssim(base, target),
+        "changedRegions": regions,
+    }
+
+
+async def diff_captures(
+    screenshot_index: ScreenshotIndex, base: IndexEntry, target: IndexEntry
+) -> dict:
+    """
+    두 캡처의 비교 결과 조회 (캐시 우선)
+    - 같은 이미지 쌍의 결과는 SAVE_PATH/diffs에 저장해 두고 재사용합니다.
+    - param
+        - screenshot_index: 스크린샷 인덱스
+        - base: 기준 캡처
+        - target: 비교 대상 캡처
+    - return
+        - scores: changedRatio, ssim, changedRegions, heatmapKey(heatmap_file 참고)
+    """
+    width = _config.DIFF_WIDTH
+    key = f"{_cache_key(base)}-{_cache_key(target)}-{width}"
+    diff_dir = os.path.join(screenshot_index.save_path, DIFF_DIR)
+    scores_path = os.path.join(diff_dir, f"{key}.json")
+    heatmap_path = heatmap_file(screenshot_index.save_path, key)
+
+    if os.path.exists(scores_path) and os.path.exists(heatmap_path):
+        with open(scores_path, encoding="utf-8") as f:
+            scores = json.load(f)
+    else:
+        os.makedirs(diff_dir, exist_ok=True)
+        with local_copy(screenshot_index, base) as base_path, \
+                local_copy(screenshot_index, target) as target_path:
+            scores = await run_in_encoder(
+                compare_images, base_path, target_path, heatmap_path, width
+            )
+        temp_path = f"{scores_path}.{uuid.uuid4().hex}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(scores, f)
+        os.replace(temp_path, scores_path)
+        _logger.info(f"Screenshot diff computed: {key}")
+
+    scores["heatmapKey"] = key
+    return scores
+
+
+def heatmap_file(save_path: str, key: str) -> Optional[str]:
+    """
+    비교 결과 키에 해당하는 히트맵 파일 경로
+    - return
+        - path: 히트맵 절대 경로, 키 형식이 맞지 않으면 None (파일 존재 여부는 확인하지 않음)
+    """
+    if not DIFF_KEY_PATTERN.fullmatch(key):
+        return None
+    return os.path.join(save_path, DIFF_DIR, f"{key}.webp")
+
+
+def _cache_key(entry: IndexEntry) -> str:
+    if entry.blob_hash:
+        return entry.blob_hash
+    # 내용 주소화 이전 파일은 경로로 식별
+    return hashlib.sha256(entry.image_path.encode("utf-8")).hexdigest()
+
+
+def _load_grayscale(path: str, width: int) -> tuple[np.ndarray, int]:
+    with Image.open(path) as image:
+        original_width = image.width
+        height = max(1, round(image.height * width / image.width))
+        grayscale = image.convert("L").resize((width, height), Image.Resampling.BOX)
+    return np.asarray(grayscale, dtype=np.float64), original_width
+
+
+def _align(base: np.ndarray, target: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # 페이지 길이가 다르면 짧은 쪽 아래를 흰색으로 채워 같은 크기로 맞춤
+    height = max(base.shape[0], target.shape[0])
+
+    def pad(array):
+        return np.pad(
+            array, ((0, height - array.shape[0]), (0, 0)), constant_values=255
+        )
+
+    return pad(base), pad(target)
+
+
+def _box_mean(array: np.ndarray, size: int) -> np.ndarray:
+    # 적분 영상으로 size x size 윈도우 평균을 한 번에 계산
+    half = size // 2
+    padded = np.pad(array, half, mode="edge")
+    integral = np.pad(padded.cumsum(axis=0).cumsum(axis=1), ((1, 0), (1, 0)))
+    window_sum = (
+        integral[size:, size:]
+        - integral[:-size, size:]
+        - integral[size:, :-size]
+        + integral[:-size, :-size]
+    )
+    return window_sum / (size * size)
+
+
+def _ssim(base: np.ndarray, target: np.ndarray) -> float:
+    c1 = (0.01 * 255) ** 2
+    c2 = (0.03 * 255) ** 2
+    mu_base = _box_mean(base, SSIM_WINDOW)
+    mu_target = _box_mean(target, SSIM_WINDOW)
+    var_base = _box_mean(base * base, SSIM_WINDOW) - mu_base ** 2
+    var_target = _box_mean(target * target, SSIM_WINDOW) - mu_target ** 2
+    covariance = _box_mean(base * target, SSIM_WINDOW) - mu_base * mu_target
+    ssim_map = (
+        (2 * mu_base * mu_target + c1) * (2 * covariance + c2)
+    ) / (
+        (mu_base ** 2 + mu_target ** 2 + c1) * (var_base + var_target + c2)
+    )
+    return float(ssim_map.mean())
+
+
+def _changed_regions(mask: np.ndarray) -> list[tuple[int, int, int, int]]:
+    """
+    변경 픽셀을 격자 단위로 묶고, 이웃한 격자를 하나의 영역으로 병합
+    - return
+        - regions: (x, y, width, height) 목록, 큰 영역부터 최대 MAX_REGIONS개
+    """
+    height, width = mask.shape
+    rows = -(-height // REGION_CELL)
+    cols = -(-width // REGION_CELL)
+    padded = np.zeros((rows * REGION_CELL, cols * REGION_CELL), dtype=bool)
+    padded[:height, :width] = mask
+    grid = padded.reshape(rows, REGION_CELL, cols, REGION_CELL).any(axis=(1, 3))
+
+    visited = np.zeros_like(grid)
+    regions = []
+    for row, col in zip(*np.nonzero(grid)):
+        if visited[row, col]:
+            continue
+        visited[row, col] = True
+        queue = deque([(row, col)])
+        top, left, bottom, right = row, col, row, col
+        while queue:
+            r, c = queue.popleft()
+            top, left = min(top, r), min(left, c)
+            bottom, right = max(bottom, r), max(right, c)
+            for nr in range(max(r - 1, 0), min(r + 2, rows)):
+                for nc in range(max(c - 1, 0), min(c + 2, cols)):
+                    if grid[nr, nc] and not visited[nr, nc]:
+                        visited[nr, nc] = True
+                        queue.append((nr, nc))
+        x = int(left) * REGION_CELL
+        y = int(top) * REGION_CELL
+        regions.append((
+            x,
+            y,
+            min((int(right) + 1) * REGION_CELL, width) - x,
+            min((int(bottom) + 1) * REGION_CELL, height) - y,
+        ))
+    regions.sort(key=lambda region: region[2] * region[3], reverse=True)
+    return regions[:MAX_REGIONS]
+
+
+def _write_heatmap(target: np.ndarray, diff: np.ndarray, heatmap_path: str):
+    # 대상 이미지를 흐리게 깔고, 차이가 클수록 붉게 표시
+    background = np.repeat((target * 0.5 + 64)[..., None], 3, axis=2)
+    intensity = np.clip(diff * 3, 0, 255)[..., None] / 255
+    red = np.array([255, 0, 0], dtype=np.float64)
+    heatmap = background * (1 - intensity) + red * intensity
+    image = Image.fromarray(heatmap.astype(np.uint8))
+    temp_path = f"{heatmap_path}.{uuid.uuid4().hex}.tmp"
+    image.save(temp_path, format="WEBP", quality=80)
+    os.replace(temp_path, heatmap_path)
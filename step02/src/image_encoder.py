@@ -0,0 +1,148 @@
+import asyncio
+import io
+import multiprocessing
+import os
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from PIL import Image
+from src.config import ConfigManager
+from src.image_hash import dhash
+from src.logger import get_logger
+from src.screenshot_store import ScreenshotStore, StoredBlob
+
+_logger = get_logger(__name__)
+_config = ConfigManager()
+_executor = None
+
+# WebP 포맷이 허용하는 최대 가로/세로 픽셀
+WEBP_MAX_DIMENSION = 16383
+
+
+@dataclass
+class SavedScreenshot:
+    """
+    저장된 스크린샷 정보
+    """
+    blob: StoredBlob
+    phash: str
+    encode_seconds: float = 0.0
+    write_seconds: float = 0.0
+
+
+def encode_image(png_bytes: bytes, max_width: int, quality: int) -> tuple[bytes, str]:
+    """
+    PNG 스크린샷을 축소하고 WebP로 변환 (워커 프로세스에서 실행)
+    - param
+        - png_bytes: 원본 PNG 바이트
+        - max_width: 최대 가로 픽셀, 초과시 비율을 유지해 축소
+        - quality: WebP 품질 (0~100)
+    - return
+        - image_bytes: 변환된 이미지 바이트
+        - extension: 변환된 이미지 확장자 (webp, 세로가 WebP 한도를 넘으면 png)
+    """
+    return _encode(_decode(png_bytes, max_width), quality)
+
+
+def store_image(
+    png_bytes: bytes, save_path: str, max_width: int, quality: int
+) -> SavedScreenshot:
+    """
+    스크린샷을 변환해 저장소에 저장하고 perceptual hash 계산 (워커 프로세스에서 실행)
+    - param
+        - png_bytes: 원본 PNG 바이트
+        - save_path: 스크린샷 저장 경로
+    - return
+        - saved: 저장된 blob 정보 (같은 내용이 이미 있으면 기존 blob), dHash,
+          변환/저장 소요 시간
+    """
+    started = time.perf_counter()
+    image = _decode(png_bytes, max_width)
+    image_bytes, extension = _encode(image, quality)
+    phash = dhash(image)
+    encoded = time.perf_counter()
+    blob = ScreenshotStore(save_path).put(image_bytes, extension)
+    return SavedScreenshot(
+        blob=blob,
+        phash=phash,
+        encode_seconds=encoded - started,
+        write_seconds=time.perf_counter() - encoded,
+    )
+
+
+def _decode(png_bytes: bytes, max_width: int) -> Image.Image:
+    # 직접 캡처한 이미지이므로 긴 전체 페이지도 디코딩 허용
+    Image.MAX_IMAGE_PIXELS = None
+    with Image.open(io.BytesIO(png_bytes)) as image:
+        image = image.convert("RGB")
+    if max_width > 0 and image.width > max_width:
+        height = max(1, round(image.height * max_width / image.width))
+        image = image.resize((max_width, height), Image.Resampling.LANCZOS)
+    return image
+
+
+def _encode(image: Image.Image, quality: int) -> tuple[bytes, str]:
+    buffer = io.BytesIO()
+    if image.height > WEBP_MAX_DIMENSION:
+        image.save(buffer, format="PNG", optimize=True)
+        return buffer.getvalue(), "png"
+    image.save(buffer, format="WEBP", quality=quality, method=4)
+    return buffer.getvalue(), "webp"
+
+
+async def save_screenshot(png_bytes: bytes, save_path: str) -> SavedScreenshot:
+    """
+    스크린샷을 IMG_MAX_WIDTH로 축소하고 WEBP_QUALITY로 변환해 저장
+    - 변환과 저장은 프로세스 풀에서 실행되어 이벤트 루프를 막지 않습니다.
+    - param
+        - png_bytes: page.screenshot()이 반환한 PNG 바이트
+        - save_path: 스크린샷 저장 경로
+    - return
+        - saved: 저장된 blob 정보와 dHash
+    """
+    return await run_in_encoder(
+        store_image,
+        png_bytes,
+        save_path,
+        _config.IMG_MAX_WIDTH,
+        _config.WEBP_QUALITY,
+    )
+
+
+async def run_in_encoder(func, *args):
+    """
+    인코딩 프로세스 풀에서 CPU 작업 실행
+    - param
+        - func: 워커 프로세스에서 실행할 모듈 수준 함수
+        - args: func 인자 (pickle 가능해야 함)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), func, *args)
+
+
+def shutdown_encoder():
+    """
+    인코딩 프로세스 풀 종료
+    """
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+        _logger.info("Image encoder pool stopped.")
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # 캡처 워커 프로세스마다 인코딩 풀을 띄우므로 코어를 워커 수로 나눠 사용
+        max_workers = _config.ENCODER_WORKERS or max(
+            1, (os.cpu_count() or 1) // max(1, _config.CAPTURE_WORKERS)
+        )
+        # 브라우저/이벤트 루프 스레드를 복제하지 않도록 spawn 사용
+        _executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        _logger.info(f"Image encoder pool started with {max_workers} worker(s).")
+    return _executor
@@ -0,0 +1,37 @@
+import numpy as np
+
+from PIL import Image
+
+# dHash 해상도: (HASH_SIZE + 1) x HASH_SIZE 회색조 이미지에서 HASH_SIZE^2 비트 생성
+HASH_SIZE = 8
+
+
+def dhash(image: Image.Image, hash_size: int = HASH_SIZE) -> str:
+    """
+    difference hash(dHash) 계산
+    - 회색조로 축소한 이미지에서 가로로 이웃한 픽셀의 밝기 비교 결과를 비트로 사용합니다.
+    - 해상도/인코딩 차이에는 둔감하고, 레이아웃/콘텐츠 변경에는 민감합니다.
+    - param
+        - image: PIL 이미지
+        - hash_size: 해시 한 변의 비트 수
+    - return
+        - hash: 16진수 문자열 (hash_size^2 비트)
+    """
+    grayscale = image.convert("L").resize(
+        (hash_size + 1, hash_size), Image.Resampling.BOX
+    )
+    pixels = np.asarray(grayscale, dtype=np.int16)
+    bits = (pixels[:, 1:] > pixels[:, :-1]).flatten()
+    packed = np.packbits(bits)
+    return packed.tobytes().hex()
+
+
+def hamming_distance(hash_a: str, hash_b: str) -> int:
+    """
+    두 해시의 해밍 거리 (서로 다른 비트 수)
+    """
+    if len(hash_a) != len(hash_b):
+        raise ValueError("Hashes must have the same length.")
+    bits_a = np.unpackbits(np.frombuffer(bytes.fromhex(hash_a), dtype=np.uint8))
+    bits_b = np.unpackbits(np.frombuffer(bytes.fromhex(hash_b), dtype=np.uint8))
+    return int(np.count_nonzero(bits_a != bits_b))
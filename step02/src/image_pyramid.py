@@ -0,0 +1,140 @@
+import asyncio
+import io
+import os
+
+from PIL import Image
+from src.config import ConfigManager
+from src.image_encoder import WEBP_MAX_DIMENSION, run_in_encoder
+from src.logger import get_logger
+from src.screenshot_store import write_atomic
+
+_logger = get_logger(__name__)
+_config = ConfigManager()
+_pending = set()
+
+# 이미지 크기 (full은 저장된 원본)
+SIZE_FULL = "full"
+SIZE_MEDIUM = "medium"
+SIZE_THUMBNAIL = "thumbnail"
+IMAGE_SIZES = (SIZE_THUMBNAIL, SIZE_MEDIUM, SIZE_FULL)
+DERIVED_SIZES = (SIZE_THUMBNAIL, SIZE_MEDIUM)
+
+
+def derived_path(image_path: str, size: str) -> str:
+    """
+    원본 옆에 저장할 파생 이미지 경로 (예: {해시}.thumbnail.webp)
+    """
+    if size == SIZE_FULL:
+        return image_path
+    base, _ = os.path.splitext(image_path)
+    return f"{base}.{size}.webp"
+
+
+def is_derived(path: str) -> bool:
+    """
+    파생 이미지 파일 여부
+    """
+    return any(path.endswith(f".{size}.webp") for size in DERIVED_SIZES)
+
+
+def remove_derived(image_path: str):
+    """
+    원본 이미지의 파생 이미지 삭제 (원본을 지울 때 함께 호출)
+    """
+    for size in DERIVED_SIZES:
+        path = derived_path(image_path, size)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def size_specs() -> dict[str, tuple[int, int]]:
+    """
+    파생 이미지 크기별 (가로, 세로 한도)
+    - 썸네일은 페이지 상단을 THUMBNAIL_WIDTH x THUMBNAIL_HEIGHT로 자르고,
+      중간 크기는 MEDIUM_WIDTH로 줄인 전체 페이지입니다. (세로 0이면 자르지 않음)
+    """
+    return {
+        SIZE_THUMBNAIL: (_config.THUMBNAIL_WIDTH, _config.THUMBNAIL_HEIGHT),
+        SIZE_MEDIUM: (_config.MEDIUM_WIDTH, 0),
+    }
+
+
+def build_derived(
+    image_path: str, specs: dict[str, tuple[int, int]], quality: int
+) -> dict[str, str]:
+    """
+    원본 이미지에서 파생 이미지 생성 (워커 프로세스에서 실행)
+    - 이미 있는 파생 이미지는 다시 만들지 않습니다.
+    - param
+        - image_path: 원본 이미지 경로
+        - specs: 크기별 (가로, 세로 한도)
+        - quality: WebP 품질
+    - return
+        - paths: 크기별 파생 이미지 경로
+    """
+    paths = {size: derived_path(image_path, size) for size in specs}
+    missing = [size for size, path in paths.items() if not os.path.exists(path)]
+    if not missing:
+        return paths
+
+    Image.MAX_IMAGE_PIXELS = None
+    with Image.open(image_path) as source:
+        source = source.convert("RGB")
+    for size in missing:
+        width, max_height = specs[size]
+        if not 0 < width < source.width:
+            width = source.width
+        scale = width / source.width
+        height_limit = min(max_height or WEBP_MAX_DIMENSION, WEBP_MAX_DIMENSION)
+        height = min(max(1, round(source.height * scale)), height_limit)
+        # 세로 한도를 넘는 아래쪽은 잘라내고 남은 영역만 축소
+        box = (0, 0, source.width, min(source.height, round(height / scale)))
+        image = source.resize((width, height), Image.Resampling.LANCZOS, box=box)
+        buffer = io.BytesIO()
+        image.save(buffer, format="WEBP", quality=quality, method=4)
+        write_atomic(paths[size], buffer.getvalue())
+    return paths
+
+
+async def ensure_derived(image_path: str, size: str) -> str:
+    """
+    요청한 크기의 이미지 경로 (없으면 인코딩 프로세스 풀에서 바로 생성)
+    - param
+        - image_path: 원본 이미지 경로
+        - size: thumbnail, medium, full
+    """
+    path = derived_path(image_path, size)
+    if size == SIZE_FULL or os.path.exists(path):
+        return path
+    paths = await run_in_encoder(
+        build_derived, image_path, {size: size_specs()[size]}, _config.WEBP_QUALITY
+    )
+    return paths[size]
+
+
+def schedule_pyramid(image_path: str):
+    """
+    캡처 직후 파생 이미지(썸네일, 중간 크기)를 백그라운드에서 생성
+    - 캡처 결과 반환을 기다리게 하지 않으며, 실패하면 조회시 다시 생성합니다.
+    """
+    if all(os.path.exists(derived_path(image_path, s)) for s in DERIVED_SIZES):
+        return
+    task = asyncio.create_task(
+        run_in_encoder(build_derived, image_path, size_specs(), _config.WEBP_QUALITY)
+    )
+    _pending.add(task)
+    task.add_done_callback(_on_pyramid_done)
+
+
+async def wait_pyramids():
+    """
+    백그라운드에서 생성 중인 파생 이미지 완료 대기 (인코딩 풀 종료 전에 호출)
+    """
+    await asyncio.gather(*_pending, return_exceptions=True)
+
+
+def _on_pyramid_done(task: asyncio.Task):
+    _pending.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        _logger.warning(f"Image pyramid generation failed: {task.exception()}")
+
@@ -0,0 +1,429 @@
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+from src.config import ConfigManager
+from src.logger import get_logger
+from src.models import JobStatus
+
+_logger = get_logger(__name__)
+_config = ConfigManager()
+_stores = {}
+_stores_lock = threading.Lock()
+
+SCHEMA_VERSION = 1
+JOB_COLUMNS = (
+    "id, kind, status, payload, total, completed, output, error,"
+    " created_at, started_at, finished_at, worker_id, heartbeat_at"
+)
+# 대기 중인 작업이 없을 때 다른 프로세스가 넣은 작업을 확인하는 주기 (초)
+POLL_INTERVAL = 5.0
+
+JOB_QUEUED = JobStatus.QUEUED.value
+JOB_RUNNING = JobStatus.RUNNING.value
+JOB_SUCCEEDED = JobStatus.SUCCEEDED.value
+JOB_FAILED = JobStatus.FAILED.value
+
+
+@dataclass
+class Job:
+    """
+    비동기 작업
+    """
+    id: str
+    kind: str
+    status: str
+    payload: dict
+    total: int
+    completed: int
+    output: Optional[str]
+    error: Optional[str]
+    created_at: float
+    started_at: Optional[float]
+    finished_at: Optional[float]
+    worker_id: Optional[str]
+    heartbeat_at: Optional[float]
+
+    @classmethod
+    def from_row(cls, row) -> "Job":
+        values = list(row)
+        values[3] = json.loads(values[3])
+        return cls(*values)
+
+
+class JobStore:
+    """
+    작업 저장소 (SQLite)
+    - 작업 상태와 작업별 부분 결과를 저장해 프로세스가 재시작되어도 유지합니다.
+    - 실행 중인 작업에는 가져간 워커 id와 heartbeat 시각을 기록해,
+      여러 프로세스가 같은 DB를 써도 살아 있는 프로세스의 작업은 건드리지 않습니다.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = os.path.abspath(db_path)
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._lock, self._conn:
+            self._migrate()
+
+    def _migrate(self):
+        """
+        스키마 버전(PRAGMA user_version)에 맞춰 테이블 생성/변경
+        """
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+        self._conn.execute("BEGIN")
+        if version < 1:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id TEXT PRIMARY KEY,"
+                " kind TEXT NOT NULL,"
+                " status TEXT NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " total INTEGER NOT NULL DEFAULT 0,"
+                " completed INTEGER NOT NULL DEFAULT 0,"
+                " output TEXT,"
+                " error TEXT,"
+                " created_at REAL NOT NULL,"
+                " started_at REAL,"
+                " finished_at REAL,"
+                " worker_id TEXT,"
+                " heartbeat_at REAL"
+                ")"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_status_created"
+                " ON jobs (status, created_at)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS job_results ("
+                " job_id TEXT NOT NULL,"
+                " seq INTEGER NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " PRIMARY KEY (job_id, seq)"
+                ")"
+            )
+        self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def create(self, kind: str, payload: dict, total: int = 0) -> Job:
+        """
+        작업 등록
+        - param
+            - kind: 작업 종류 (JobRunner에 등록된 핸들러 이름)
+            - payload: 핸들러에 넘길 요청 내용 (JSON 직렬화 가능해야 함)
+            - total: 전체 처리 건수 (진행률 표시용)
+        - return
+            - job: 등록된 작업 (queued)
+        """
+        job_id = uuid.uuid4().hex
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (id, kind, status, payload, total, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, kind, JOB_QUEUED, json.dumps(payload), total, time.time()),
+            )
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        id로 작업 조회
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {JOB_COLUMNS} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return Job.from_row(row) if row else None
+
+    def claim(self, worker_id: str) -> Optional[Job]:
+        """
+        가장 오래된 대기 작업을 실행 중으로 바꾸고 반환
+        - 한 문장(UPDATE ... RETURNING)으로 처리해 여러 프로세스가 같은 DB를 써도
+          같은 작업을 두 번 가져가지 않습니다.
+        - param
+            - worker_id: 작업을 가져가는 워커 id (heartbeat, 결과 기록시 소유 확인에 사용)
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ?,"
+                " worker_id = ?, heartbeat_at = ?"
+                " WHERE id = ("
+                "  SELECT id FROM jobs WHERE status = ?"
+                "  ORDER BY created_at, rowid LIMIT 1"
+                " )"
+                f" RETURNING {JOB_COLUMNS}",
+                (JOB_RUNNING, now, worker_id, now, JOB_QUEUED),
+            ).fetchone()
+        return Job.from_row(row) if row else None
+
+    def heartbeat(self, worker_id: str) -> int:
+        """
+        워커가 실행 중인 작업의 heartbeat 시각 갱신
+        - return
+            - count: 갱신한 작업 수
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET heartbeat_at = ? WHERE status = ? AND worker_id = ?",
+                (time.time(), JOB_RUNNING, worker_id),
+            )
+            return cursor.rowcount
+
+    def add_result(self, job_id: str, result: dict, worker_id: Optional[str] = None):
+        """
+        작업의 부분 결과 추가 (완료 건수 1 증가)
+        - param
+            - worker_id: 있으면 그 워커가 실행 중인 작업일 때만 기록
+        """
+        owner, params = _owner_condition(worker_id)
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET completed = completed + 1"
+                f" WHERE id = ?{owner} RETURNING completed - 1",
+                (job_id, *params),
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return
+            self._conn.execute(
+                "INSERT INTO job_results (job_id, seq, payload) VALUES (?, ?, ?)",
+                (job_id, row[0], json.dumps(result)),
+            )
+
+    def results(self, job_id: str) -> list[dict]:
+        """
+        작업의 부분 결과 목록 (추가된 순서)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT payload FROM job_results WHERE job_id = ? ORDER BY seq",
+                (job_id,),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def finish(
+        self,
+        job_id: str,
+        status: str,
+        output: Optional[str] = None,
+        error: Optional[str] = None,
+        worker_id: Optional[str] = None,
+    ):
+        """
+        작업 종료 처리
+        - 성공한 작업은 완료 건수를 전체 건수로 맞춥니다.
+        - param
+            - status: succeeded, failed
+            - output: 작업 결과 (에이전트 응답 등)
+            - error: 실패 사유
+            - worker_id: 있으면 그 워커가 실행 중인 작업일 때만 기록
+        """
+        owner, params = _owner_condition(worker_id)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, output = ?, error = ?, finished_at = ?,"
+                " completed = CASE WHEN ? = ? THEN MAX(completed, total)"
+                " ELSE completed END"
+                f" WHERE id = ?{owner}",
+                (
+                    status, output, error, time.time(), status, JOB_SUCCEEDED,
+                    job_id, *params,
+                ),
+            )
+
+    def requeue_stale(self, timeout: float) -> int:
+        """
+        heartbeat가 끊긴 실행 중 작업(프로세스 종료로 중단된 작업)을 다시 대기열에 넣음
+        - 다른 프로세스가 heartbeat를 보내고 있는 작업은 그대로 둡니다.
+        - param
+            - timeout: 마지막 heartbeat 이후 이 시간(초)이 지나면 중단된 것으로 판단
+        - return
+            - count: 다시 넣은 작업 수
+        """
+        stale = "status = ? AND (heartbeat_at IS NULL OR heartbeat_at < ?)"
+        params = (JOB_RUNNING, time.time() - timeout)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM job_results WHERE job_id IN"
+                f" (SELECT id FROM jobs WHERE {stale})",
+                params,
+            )
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, completed = 0, started_at = NULL,"
+                f" worker_id = NULL, heartbeat_at = NULL WHERE {stale}",
+                (JOB_QUEUED, *params),
+            )
+            return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _owner_condition(worker_id: Optional[str]) -> tuple[str, tuple]:
+    if worker_id is None:
+        return "", ()
+    return " AND status = ? AND worker_id = ?", (JOB_RUNNING, worker_id)
+
+
+def get_job_store(db_path: Optional[str] = None) -> JobStore:
+    """
+    DB 경로별 작업 저장소 반환
+    - param
+        - db_path: 작업 DB 경로, 없으면 설정값 사용
+    """
+    db_path = os.path.abspath(db_path or _config.JOB_DB_PATH)
+    with _stores_lock:
+        store = _stores.get(db_path)
+        if store is None or not os.path.exists(store.db_path):
+            store = _stores[db_path] = JobStore(db_path)
+        return store
+
+
+# 작업 핸들러: (payload, add_result) -> output
+JobHandler = Callable[[dict, Callable[[dict], None]], Awaitable[Optional[str]]]
+
+
+class JobRunner:
+    """
+    백그라운드 작업 실행기
+    - JOB_CONCURRENCY개의 워커 태스크가 작업 저장소의 대기열을 순서대로 처리합니다.
+    - 작업 종류별 핸들러는 register()로 등록합니다.
+    - JOB_HEARTBEAT_INTERVAL마다 실행 중인 작업의 heartbeat를 갱신하고,
+      JOB_STALE_TIMEOUT 동안 heartbeat가 없는 작업(죽은 프로세스의 작업)을 다시 대기열에 넣습니다.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(JobRunner, cls).__new__(cls)
+            cls._instance._handlers = {}
+            cls._instance._tasks = []
+            cls._instance._loop = None
+            cls._instance._wakeup = None
+            cls._instance._worker_id = None
+        return cls._instance
+
+    @property
+    def is_started(self) -> bool:
+        return bool(self._tasks) and self._loop is _running_loop()
+
+    def register(self, kind: str, handler: JobHandler):
+        """
+        작업 종류별 핸들러 등록
+        - param
+            - kind: 작업 종류
+            - handler: payload와 부분 결과 추가 함수를 받아 작업 결과(output)를 반환하는 코루틴 함수
+        """
+        self._handlers[kind] = handler
+
+    def submit(self, kind: str, payload: dict, total: int = 0) -> Job:
+        """
+        작업 등록 후 바로 반환 (실행은 백그라운드 워커가 담당)
+        """
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        job = get_job_store().create(kind, payload, total)
+        _logger.info(f"Job queued: {job.id} ({kind})")
+        if not self.is_started:
+            self.start()
+        self._wakeup.set()
+        return job
+
+    def start(self):
+        """
+        현재 이벤트 루프에서 워커 태스크 기동
+        - 이전 프로세스에서 실행 중에 중단된 작업은 heartbeat가 끊긴 뒤 다시 대기열에 넣습니다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._tasks:
+            return
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._requeue_stale()
+        concurrency = max(1, _config.JOB_CONCURRENCY)
+        self._tasks = [
+            asyncio.create_task(self._work(index)) for index in range(concurrency)
+        ]
+        self._tasks.append(asyncio.create_task(self._heartbeat()))
+        _logger.info(f"Job runner started with {concurrency} worker(s).")
+
+    async def stop(self):
+        """
+        워커 태스크 종료
+        - 실행 중이던 작업은 running으로 남고 heartbeat가 끊긴 뒤 다시 실행됩니다.
+        """
+        if self._loop is not _running_loop():
+            return
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if tasks:
+            _logger.info("Job runner stopped.")
+
+    def _requeue_stale(self) -> int:
+        requeued = get_job_store().requeue_stale(_config.JOB_STALE_TIMEOUT)
+        if requeued:
+            _logger.warning(f"Requeued {requeued} interrupted job(s).")
+        return requeued
+
+    async def _heartbeat(self):
+        while True:
+            await asyncio.sleep(max(1, _config.JOB_HEARTBEAT_INTERVAL))
+            try:
+                get_job_store().heartbeat(self._worker_id)
+                if self._requeue_stale():
+                    self._wakeup.set()
+            except sqlite3.Error as e:
+                _logger.error(f"Job heartbeat failed: {e}")
+
+    async def _work(self, index: int):
+        while True:
+            job = get_job_store().claim(self._worker_id)
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._run(job)
+
+    async def _run(self, job: Job):
+        store = get_job_store()
+        worker_id = job.worker_id
+        handler = self._handlers.get(job.kind)
+        _logger.info(f"Job started: {job.id} ({job.kind})")
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown job kind: {job.kind}")
+            output = await handler(
+                job.payload, lambda result: store.add_result(job.id, result, worker_id)
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            _logger.error(f"Job failed: {job.id}: {e}")
+            store.finish(job.id, JOB_FAILED, error=str(e), worker_id=worker_id)
+        else:
+            store.finish(job.id, JOB_SUCCEEDED, output=output, worker_id=worker_id)
+            _logger.info(f"Job succeeded: {job.id}")
+
+
+def _running_loop():
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
@@ -14,6 +14,8 @@ from playwright.async_api import async_playwright
 
 from src.config import ConfigManager
 from src.logger import get_logger
+from src.screenshot_index import get_screenshot_index
+from src.screenshot_store import ScreenshotStore
 from semantic_kernel.functions import kernel_function
 
 _logger = get_logger(__name__)
@@ -75,15 +77,16 @@ class WebNavigationPlugin:
         page = self._sessions[session_id]["page"]
         try:
             save_path = _config.SAVE_PATH
-            timestamp = time.strftime("%Y%m%d-%H%M%S")
-            file_path = f"{save_path}/{name}-{timestamp}.png"
+            captured_at = time.time()
             if selector:
                 element = page.locator(selector)
-                await element.screenshot(path=file_path)
+                png_bytes = await element.screenshot()
             else:
-                await page.screenshot(path=file_path, full_page=True)
-            with open(file_path, "rb") as image_file:
-                encoded_string = base64.b64encode(image_file.read()).decode("utf-8")
+                png_bytes = await page.screenshot(full_page=True)
+            # {시스템명}/yyyy/mm/dd/에 임시 파일로 쓴 뒤 rename
+            file_path = ScreenshotStore(save_path).put_capture(name, captured_at, png_bytes, "png")
+            get_screenshot_index(save_path).add(name, file_path, captured_at)
+            encoded_string = base64.b64encode(png_bytes).decode("utf-8")
             # os.remove(file_path)
             # return encoded_string
             return f"Screenshot saved and encoded: {file_path}"
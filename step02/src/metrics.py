@@ -0,0 +1,167 @@
+import time
+
+from contextlib import contextmanager
+from typing import Optional
+from prometheus_client import Counter, Gauge, Histogram
+from src.capture_queue import CaptureQueue
+from src.models import CaptureResult
+
+# 캡처 단계
+PHASE_QUEUE = "queue"
+PHASE_CONTEXT = "context"
+PHASE_GOTO = "goto"
+PHASE_READINESS = "readiness"
+PHASE_SCREENSHOT = "screenshot"
+PHASE_ENCODER_WAIT = "encoder_wait"
+PHASE_ENCODE = "encode"
+PHASE_WRITE = "write"
+PHASE_INDEX = "index"
+PHASE_PROBE = "probe"
+
+# 브라우저 풀 기동 단계 (캡처마다가 아니라 기동/재기동시에만 발생)
+PHASE_DRIVER_START = "driver_start"
+PHASE_BROWSER_LAUNCH = "browser_launch"
+
+OUTCOME_CHANGED = "changed"
+OUTCOME_UNCHANGED = "unchanged"
+OUTCOME_FAILED = "failed"
+
+PHASE_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60
+)
+
+CAPTURE_PHASE_SECONDS = Histogram(
+    "screenshot_capture_phase_seconds",
+    "Time spent in each capture phase",
+    ["system", "phase"],
+    buckets=PHASE_BUCKETS,
+)
+CAPTURE_SECONDS = Histogram(
+    "screenshot_capture_seconds",
+    "End-to-end capture time",
+    ["system"],
+    buckets=PHASE_BUCKETS,
+)
+CAPTURES_TOTAL = Counter(
+    "screenshot_captures_total",
+    "Captures by outcome",
+    ["system", "outcome"],
+)
+CAPTURES_SHARED_TOTAL = Counter(
+    "screenshot_captures_shared_total",
+    "Capture requests served by an in-flight or fresh capture",
+    ["system", "flight"],
+)
+READY_SIGNALS_TOTAL = Counter(
+    "screenshot_ready_signals_total",
+    "Readiness signal that ended the page wait",
+    ["system", "signal"],
+)
+PROBE_SKIPS_TOTAL = Counter(
+    "screenshot_probe_skips_total",
+    "Captures skipped because the pre-capture probe saw no change",
+    ["system", "signal"],
+)
+BROWSER_PHASE_SECONDS = Histogram(
+    "screenshot_browser_phase_seconds",
+    "Playwright driver start and browser launch time",
+    ["phase"],
+    buckets=PHASE_BUCKETS,
+)
+BROWSER_RECYCLES_TOTAL = Counter(
+    "screenshot_browser_recycles_total",
+    "Pooled browsers replaced, by reason",
+    ["reason"],
+)
+RETENTION_CAPTURES_TOTAL = Counter(
+    "screenshot_retention_captures_total",
+    "Captures archived or dropped by the retention policy",
+    ["action"],
+)
+CAPTURE_QUEUE_ACTIVE = Gauge(
+    "screenshot_capture_queue_active", "Captures holding a slot"
+)
+CAPTURE_QUEUE_WAITING = Gauge(
+    "screenshot_capture_queue_waiting", "Captures waiting for a slot"
+)
+CAPTURE_QUEUE_ACTIVE.set_function(lambda: CaptureQueue().active)
+CAPTURE_QUEUE_WAITING.set_function(lambda: CaptureQueue().waiting)
+
+
+class PhaseTimer:
+    """
+    캡처 단계별 소요 시간 측정
+    - lap()은 직전 lap 이후 경과 시간을 해당 단계에 더합니다.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.durations: dict[str, float] = {}
+
+    def lap(self, phase: Optional[str] = None) -> float:
+        """
+        직전 lap 이후 경과 시간 기록
+        - param
+            - phase: 단계명, 없으면 기록하지 않고 기준 시점만 이동
+        - return
+            - elapsed: 경과 시간 (초)
+        """
+        now = time.perf_counter()
+        elapsed = now - self._last
+        self._last = now
+        if phase:
+            self.record(phase, elapsed)
+        return elapsed
+
+    def record(self, phase: str, seconds: float):
+        """
+        단계 소요 시간 직접 기록 (워커 프로세스에서 측정한 시간 등)
+        """
+        self.durations[phase] = self.durations.get(phase, 0.0) + seconds
+
+    @property
+    def total(self) -> float:
+        return time.perf_counter() - self.started
+
+
+def capture_outcome(result: CaptureResult) -> str:
+    """
+    캡처 결과 분류 (changed, unchanged, failed)
+    """
+    if not result.isSuccess:
+        return OUTCOME_FAILED
+    return OUTCOME_CHANGED if result.isChanged else OUTCOME_UNCHANGED
+
+
+def observe_capture(result: CaptureResult):
+    """
+    캡처 한 건의 단계별 시간과 결과를 메트릭에 기록
+    - 캡처 워커 프로세스의 결과도 API 프로세스에서 기록할 수 있도록 CaptureResult를 받습니다.
+    - param
+        - result: phaseTimings, readySignal, probeSignal이 채워진 캡처 결과
+    """
+    system = result.urlinfo.name
+    durations = result.phaseTimings or {}
+    for phase, seconds in durations.items():
+        CAPTURE_PHASE_SECONDS.labels(system=system, phase=phase).observe(seconds)
+    CAPTURE_SECONDS.labels(system=system).observe(sum(durations.values()))
+    CAPTURES_TOTAL.labels(system=system, outcome=capture_outcome(result)).inc()
+    if result.readySignal:
+        READY_SIGNALS_TOTAL.labels(system=system, signal=result.readySignal).inc()
+    if result.probeSignal:
+        PROBE_SKIPS_TOTAL.labels(system=system, signal=result.probeSignal).inc()
+
+
+@contextmanager
+def time_browser_phase(phase: str):
+    """
+    브라우저 풀 기동 단계 시간 측정
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        BROWSER_PHASE_SECONDS.labels(phase=phase).observe(
+            time.perf_counter() - started
+        )
@@ -1,6 +1,6 @@
 from enum import Enum
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 class UrlInfo(BaseModel):
@@ -11,15 +11,83 @@ class UrlInfo(BaseModel):
     url: Optional[str] = Field(None, min_length=1)
 
 
+class ViewportCapture(BaseModel):
+    """
+    Viewport Capture Model
+    """
+    viewport: str
+    width: int
+    height: int
+    # SAVE_PATH 기준 상대 경로 (서버 절대 경로는 응답에 노출하지 않음)
+    imagePath: Optional[str] = None
+    isChanged: Optional[bool] = None
+    hammingDistance: Optional[int] = None
+    readySignal: Optional[str] = None
+
+
+class CaptureResult(BaseModel):
+    """
+    Capture Result Model
+    """
+    urlinfo: UrlInfo
+    isSuccess: bool
+    # SAVE_PATH 기준 상대 경로 (서버 절대 경로는 응답에 노출하지 않음)
+    imagePath: Optional[str] = None
+    errorMsg: Optional[str] = None
+    isChanged: Optional[bool] = None
+    hammingDistance: Optional[int] = None
+    readySignal: Optional[str] = None
+    probeSignal: Optional[str] = None
+    blockedRequests: Optional[int] = None
+    transferredBytes: Optional[int] = None
+    phaseTimings: Optional[Dict[str, float]] = None
+    viewports: Optional[List[ViewportCapture]] = None
+
+
 class ScreenshotGetResultData(BaseModel):
     systemNm: Optional[str] = Field(None, min_length=1)
     imagePath: Optional[str] = Field(None, min_length=1)
+    imageUrl: Optional[str] = Field(None, min_length=1)
+
+
+class ScreenshotHistoryItem(BaseModel):
+    captureId: int
+    capturedAt: float
+    imageUrl: str
+    size: Optional[int] = None
+    blobHash: Optional[str] = None
+    phash: Optional[str] = None
+    isArchived: bool = False
+
+
+class ScreenshotHistoryResultData(BaseModel):
+    systemNm: str
+    items: List[ScreenshotHistoryItem] = []
+    nextCursor: Optional[str] = None
+
+
+class ChangedRegion(BaseModel):
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+class ScreenshotDiffResultData(BaseModel):
+    systemNm: str
+    baseId: int
+    targetId: int
+    heatmapPath: str
+    changedRatio: float
+    ssim: float
+    changedRegions: List[ChangedRegion]
 
 
 class ScreenshotPostResultData(BaseModel):
     requestedUrls: List[UrlInfo]
     passedUrls: List[UrlInfo]
     failedUrls: List[UrlInfo]
+    results: List[CaptureResult] = []
 
     def __init__(self, requestedUrls, passedUrls, failedUrls, **kwargs):
         requestedUrls = (
@@ -41,6 +109,27 @@ class ScreenshotPostResultData(BaseModel):
         )
 
 
+class JobStatus(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobResultData(BaseModel):
+    jobId: str
+    kind: str
+    status: JobStatus
+    total: int = 0
+    completed: int = 0
+    results: List[CaptureResult] = []
+    output: Optional[str] = None
+    errorMsg: Optional[str] = None
+    createdAt: float
+    startedAt: Optional[float] = None
+    finishedAt: Optional[float] = None
+
+
 class ResultCode(Enum):
     SUCCESS = 100
     FAIL = 900
@@ -71,11 +160,34 @@ class ScreenshotGetResponse(BaseResponse):
     data: Optional[ScreenshotGetResultData] = None
 
 
+class ScreenshotDiffResponse(BaseResponse):
+    """
+    Screenshot Diff Response Model
+    """
+    data: Optional[ScreenshotDiffResultData] = None
+
+
+class ScreenshotHistoryResponse(BaseResponse):
+    """
+    Screenshot History Response Model
+    """
+    data: Optional[ScreenshotHistoryResultData] = None
+
+
+class ScreenshotClosestResponse(BaseResponse):
+    """
+    Screenshot Closest Capture Response Model
+    """
+    data: Optional[ScreenshotHistoryItem] = None
+
+
 class ScreenshotPostRequest(BaseRequest):
     """
     Screenshot Request Model
     """
     systemNm: Optional[str] = None
+    stream: bool = False
+    viewportMatrix: bool = False
 
 
 class ScreenshotPostResponse(BaseResponse):
@@ -98,3 +210,10 @@ class MCPScreenshotPostResponse(BaseResponse):
     """
     #data: Optional[AgentResponseItem[ChatMessageContent]] = None
     data: Optional[str] = None
+
+
+class JobResponse(BaseResponse):
+    """
+    Job Response Model
+    """
+    data: Optional[JobResultData] = None
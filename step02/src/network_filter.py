@@ -0,0 +1,124 @@
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import urlparse
+from src.config import ConfigManager
+from src.logger import get_logger
+
+_logger = get_logger(__name__)
+_config = ConfigManager()
+
+BLOCK_SECTION = "BLOCK"
+# 시스템별 규칙 섹션: [BLOCK.{시스템명}]
+SYSTEM_SECTION_PREFIX = f"{BLOCK_SECTION}."
+ABORT_ERROR_CODE = "blockedbyclient"
+FALSE_VALUES = ("false", "no", "off", "0")
+
+
+@dataclass(frozen=True)
+class BlockRule:
+    """
+    요청 차단 규칙
+    - resource_types: Playwright resource type (media, font, script 등)
+    - domains: 차단 도메인 (하위 도메인 포함)
+    """
+    resource_types: frozenset[str] = frozenset()
+    domains: tuple[str, ...] = ()
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.resource_types and not self.domains
+
+    def blocks(self, resource_type: str, url: str) -> bool:
+        """
+        요청 차단 여부
+        - param
+            - resource_type: 요청의 resource type
+            - url: 요청 URL
+        """
+        if resource_type in self.resource_types:
+            return True
+        host = (urlparse(url).hostname or "").lower()
+        return any(
+            host == domain or host.endswith(f".{domain}") for domain in self.domains
+        )
+
+
+@dataclass
+class NetworkStats:
+    """
+    캡처 한 건의 네트워크 통계
+    - blocked_requests: 차단한 요청 수
+    - transferred_bytes: 허용된 응답의 Content-Length 합계 (헤더가 없는 응답 제외)
+    """
+    blocked_requests: int = 0
+    transferred_bytes: int = 0
+
+
+def block_rule_for(name: Optional[str]) -> BlockRule:
+    """
+    시스템에 적용할 차단 규칙
+    - [BLOCK] 전역 규칙에 [BLOCK.{시스템명}] 규칙을 더합니다.
+    - 시스템 섹션에 INHERIT=false가 있으면 전역 규칙을 쓰지 않습니다.
+    - param
+        - name: 시스템명
+    - return
+        - rule: 차단 규칙
+    """
+    sections = [_config.get_section(BLOCK_SECTION)]
+    if name:
+        system = _config.get_section(f"{SYSTEM_SECTION_PREFIX}{name}")
+        if system.get("inherit", "true").strip().lower() in FALSE_VALUES:
+            sections = []
+        sections.append(system)
+
+    resource_types = set()
+    domains = []
+    for section in sections:
+        resource_types.update(_split(section.get("resource_types", "")))
+        domains.extend(
+            domain.lstrip(".") for domain in _split(section.get("domains", ""))
+        )
+    return BlockRule(
+        resource_types=frozenset(resource_types),
+        domains=tuple(dict.fromkeys(domains)),
+    )
+
+
+async def apply_block_rule(context, rule: BlockRule) -> NetworkStats:
+    """
+    브라우저 컨텍스트에 요청 차단 규칙 적용
+    - 광고/분석 스크립트가 networkidle 도달을 막지 않도록 규칙에 맞는 요청을 중단합니다.
+    - param
+        - context: Playwright BrowserContext
+        - rule: 차단 규칙
+    - return
+        - stats: 컨텍스트가 닫힐 때까지 누적되는 네트워크 통계
+    """
+    stats = NetworkStats()
+
+    async def handle(route):
+        request = route.request
+        if rule.blocks(request.resource_type, request.url):
+            stats.blocked_requests += 1
+            await route.abort(ABORT_ERROR_CODE)
+        else:
+            await route.continue_()
+
+    def on_response(response):
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            stats.transferred_bytes += int(length)
+
+    if not rule.is_empty:
+        # 라우팅을 등록하지 않으면 요청마다 핸들러를 거치지 않음
+        await context.route("**/*", handle)
+        _logger.debug(
+            f"Block rule applied: {sorted(rule.resource_types)}, "
+            f"{len(rule.domains)} domain(s)"
+        )
+    context.on("response", on_response)
+    return stats
+
+
+def _split(value: str) -> list[str]:
+    return [item.strip().lower() for item in value.split(",") if item.strip()]
@@ -0,0 +1,159 @@
+import asyncio
+
+from typing import Optional
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from src.logger import get_logger
+from src.metrics import PHASE_GOTO, PHASE_READINESS, PhaseTimer
+
+_logger = get_logger(__name__)
+
+# 캡처 시점을 결정한 신호
+READY_NETWORK_IDLE = "networkidle"
+READY_DOM_QUIET = "dom-quiet"
+READY_DOM_CONTENT_LOADED = "domcontentloaded"
+READY_DEADLINE = "deadline"
+READY_LAYOUT_STABLE = "layout-stable"
+
+# DOM 변경이 quiet_ms 동안 없고, 로딩 중인 이미지가 모두 디코딩되면 resolve
+# (loading=lazy 이미지는 화면 밖에 있으면 로드되지 않으므로 기다리지 않음)
+DOM_QUIET_SCRIPT = """
+(quietMs) => new Promise((resolve) => {
+    let timer = null;
+    const images = () => Array.from(document.images).filter(
+        (img) => img.currentSrc && img.loading !== "lazy"
+    );
+    const check = async () => {
+        const pending = images().filter((img) => !img.complete);
+        if (pending.length) {
+            await Promise.all(pending.map((img) => img.decode().catch(() => null)));
+            arm();
+            return;
+        }
+        observer.disconnect();
+        await Promise.all(images().map((img) => img.decode().catch(() => null)));
+        resolve(true);
+    };
+    const arm = () => {
+        clearTimeout(timer);
+        timer = setTimeout(check, quietMs);
+    };
+    const observer = new MutationObserver(arm);
+    observer.observe(document, {
+        childList: true, subtree: true, attributes: true, characterData: true,
+    });
+    arm();
+})
+"""
+
+# 뷰포트 변경 후 문서 크기가 quiet_ms 동안 그대로이고 로딩 중인 이미지가 없으면 resolve
+# (srcset/미디어 쿼리로 새 이미지를 받는 경우도 기다림)
+LAYOUT_STABLE_SCRIPT = """
+(quietMs) => new Promise((resolve) => {
+    const root = document.documentElement;
+    let last = null;
+    let stableSince = performance.now();
+    const tick = () => {
+        const size = `${root.scrollWidth}x${root.scrollHeight}`;
+        const loading = Array.from(document.images).some(
+            (img) => img.currentSrc && img.loading !== "lazy" && !img.complete
+        );
+        if (loading || size !== last) {
+            last = size;
+            stableSince = performance.now();
+        }
+        if (performance.now() - stableSince >= quietMs) {
+            resolve(true);
+            return;
+        }
+        requestAnimationFrame(tick);
+    };
+    requestAnimationFrame(() => requestAnimationFrame(tick));
+})
+"""
+
+
+async def wait_until_ready(
+    page, url: str, timeout: float, quiet_ms: int, timer: Optional[PhaseTimer] = None
+) -> str:
+    """
+    페이지 이동 후 화면이 안정될 때까지 대기
+    - DOMContentLoaded 이후 networkidle과 DOM 안정(변경 없음 + 이미지 디코딩 완료) 중
+      먼저 도달한 신호에서 멈춥니다.
+    - timeout이 지나면 그 시점의 화면을 캡처하도록 반환합니다. (재이동하지 않음)
+    - param
+        - page: Playwright Page
+        - url: 이동할 URL
+        - timeout: 전체 대기 한도 (초)
+        - quiet_ms: DOM 안정 판단 시간 (ms)
+        - timer: 이동(goto)과 대기(readiness) 시간을 기록할 타이머
+    - return
+        - signal: 대기를 끝낸 신호 (networkidle, dom-quiet, domcontentloaded, deadline)
+    """
+    timer = timer or PhaseTimer()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        await page.goto(url, wait_until="domcontentloaded", timeout=timeout * 1000)
+    except PlaywrightTimeoutError:
+        timer.lap(PHASE_GOTO)
+        _logger.warning(f"DOMContentLoaded not reached for {url} in {timeout}s")
+        return READY_DEADLINE
+    timer.lap(PHASE_GOTO)
+
+    # Playwright는 timeout=0을 무제한으로 해석하므로 최소 1ms
+    remaining_ms = max((deadline - loop.time()) * 1000, 1)
+    signals = {
+        asyncio.create_task(
+            page.wait_for_load_state("networkidle", timeout=remaining_ms)
+        ): READY_NETWORK_IDLE,
+        asyncio.create_task(
+            page.evaluate(DOM_QUIET_SCRIPT, quiet_ms)
+        ): READY_DOM_QUIET,
+    }
+    pending = set(signals)
+    signal = None
+    try:
+        while pending and signal is None:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=max(deadline - loop.time(), 0),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                signal = READY_DEADLINE
+            for task in done:
+                if task.exception() is None:
+                    signal = signals[task]
+                    break
+                _logger.debug(f"{signals[task]} failed for {url}: {task.exception()}")
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        timer.lap(PHASE_READINESS)
+
+    if signal is None:
+        # 모든 신호가 실패하면(페이지 내 이동 등) DOMContentLoaded 시점 화면을 캡처
+        signal = READY_DOM_CONTENT_LOADED
+    if signal == READY_DEADLINE:
+        _logger.warning(f"Page not stable for {url} in {timeout}s")
+    return signal
+
+
+async def wait_for_layout(page, timeout: float, quiet_ms: int) -> str:
+    """
+    이미 로드한 페이지의 뷰포트를 바꾼 뒤 레이아웃이 안정될 때까지 대기
+    - 페이지를 다시 불러오지 않고 문서 크기와 이미지 로딩만 확인합니다.
+    - param
+        - page: 뷰포트를 바꾼 Playwright Page
+        - timeout: 대기 한도 (초)
+        - quiet_ms: 레이아웃 안정 판단 시간 (ms)
+    - return
+        - signal: 대기를 끝낸 신호 (layout-stable, deadline)
+    """
+    try:
+        await asyncio.wait_for(page.evaluate(LAYOUT_STABLE_SCRIPT, quiet_ms), timeout)
+    except asyncio.TimeoutError:
+        _logger.warning(f"Layout not stable for {page.url} in {timeout}s")
+        return READY_DEADLINE
+    return READY_LAYOUT_STABLE
@@ -0,0 +1,224 @@
+import asyncio
+import os
+import time
+
+from dataclasses import dataclass, field
+from typing import Optional
+from src.config import ConfigManager
+from src.logger import get_logger
+from src.metrics import RETENTION_CAPTURES_TOTAL
+from src.screenshot_archive import archive_path_for, member_name, write_archive
+from src.screenshot_index import IndexEntry, ScreenshotIndex, get_screenshot_index
+
+_logger = get_logger(__name__)
+_config = ConfigManager()
+
+# 보관 단계
+TIER_ALL = "all"
+TIER_DAILY = "daily"
+TIER_MONTHLY = "monthly"
+TIER_EXPIRED = "expired"
+
+DAY_SECONDS = 86400
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """
+    캡처 보관 정책
+    - keep_all_days: 이 기간의 캡처는 모두 보관
+    - keep_daily_days: 이 기간까지는 하루 첫 캡처만 보관
+    - keep_monthly_days: 이 기간까지는 한 달 첫 캡처만 보관 (0이면 영구 보관)
+    """
+    keep_all_days: int = 7
+    keep_daily_days: int = 90
+    keep_monthly_days: int = 0
+
+    @classmethod
+    def from_config(cls) -> "RetentionPolicy":
+        return cls(
+            keep_all_days=_config.RETENTION_KEEP_ALL_DAYS,
+            keep_daily_days=_config.RETENTION_KEEP_DAILY_DAYS,
+            keep_monthly_days=_config.RETENTION_KEEP_MONTHLY_DAYS,
+        )
+
+    def tier(self, age_seconds: float) -> str:
+        """
+        캡처 경과 시간에 해당하는 보관 단계
+        """
+        age_days = age_seconds / DAY_SECONDS
+        if age_days <= self.keep_all_days:
+            return TIER_ALL
+        if age_days <= self.keep_daily_days:
+            return TIER_DAILY
+        if self.keep_monthly_days <= 0 or age_days <= self.keep_monthly_days:
+            return TIER_MONTHLY
+        return TIER_EXPIRED
+
+
+@dataclass
+class RetentionPlan:
+    """
+    시스템 하나의 보관 정책 적용 계획
+    - archive: 아카이브로 옮길 캡처 (KEEP_ALL_DAYS가 지났지만 남길 캡처)
+    - drop: 지울 캡처
+    """
+    archive: list[IndexEntry] = field(default_factory=list)
+    drop: list[IndexEntry] = field(default_factory=list)
+
+
+@dataclass
+class RetentionStats:
+    """
+    보관 정책 적용 결과
+    """
+    archived: int = 0
+    dropped: int = 0
+    deleted_files: int = 0
+
+
+def plan_retention(
+    entries: list[IndexEntry], policy: RetentionPolicy, now: float
+) -> RetentionPlan:
+    """
+    보관 정책에 따라 아카이브로 옮길 캡처와 지울 캡처 선정
+    - 하루/한 달 단위에서는 그 기간의 첫 캡처를 남깁니다. (실행할 때마다 바뀌지 않음)
+    - 시스템의 최신 캡처는 오래되었어도 항상 남깁니다.
+    - param
+        - entries: 시스템의 캡처 (오래된 순)
+        - policy: 보관 정책
+        - now: 기준 시각 (epoch seconds)
+    """
+    plan = RetentionPlan()
+    kept_buckets = set()
+    for entry in entries[:-1]:
+        tier = policy.tier(now - entry.captured_at)
+        if tier == TIER_ALL:
+            continue
+        if tier == TIER_EXPIRED:
+            plan.drop.append(entry)
+            continue
+        period = "%Y-%m-%d" if tier == TIER_DAILY else "%Y-%m"
+        bucket = (tier, time.strftime(period, time.localtime(entry.captured_at)))
+        if bucket in kept_buckets:
+            plan.drop.append(entry)
+            continue
+        kept_buckets.add(bucket)
+        if not entry.archive_path:
+            plan.archive.append(entry)
+    return plan
+
+
+def apply_retention(
+    screenshot_index: ScreenshotIndex,
+    policy: RetentionPolicy,
+    now: Optional[float] = None,
+) -> RetentionStats:
+    """
+    보관 정책 적용 (디스크 작업이 많으므로 스레드에서 실행)
+    - 남길 캡처는 시스템별 월 단위 zip으로 옮기고 인덱스에 아카이브 경로를 기록합니다.
+    - 지운 캡처만 가리키던 아카이브 파일은 다시 써서 공간을 회수합니다.
+    - 더 이상 어떤 캡처도 직접 가리키지 않는 blob과 파생 이미지는 삭제합니다.
+    """
+    now = time.time() if now is None else now
+    stats = RetentionStats()
+    for system_nm in screenshot_index.systems():
+        plan = plan_retention(screenshot_index.entries(system_nm), policy, now)
+        if plan.archive or plan.drop:
+            _apply_plan(screenshot_index, system_nm, plan, stats)
+    if stats.archived or stats.dropped:
+        _logger.info(
+            f"Retention applied: {stats.archived} archived, {stats.dropped} dropped, "
+            f"{stats.deleted_files} file(s) deleted."
+        )
+    return stats
+
+
+def _apply_plan(
+    screenshot_index: ScreenshotIndex,
+    system_nm: str,
+    plan: RetentionPlan,
+    stats: RetentionStats,
+):
+    drop_ids = {entry.id for entry in plan.drop}
+    additions: dict[str, list[IndexEntry]] = {}
+    for entry in plan.archive:
+        if os.path.exists(screenshot_index.absolute_path(entry)):
+            target = archive_path_for(system_nm, entry.captured_at)
+            additions.setdefault(target, []).append(entry)
+        else:
+            # 원본이 없어진 캡처는 보관할 수 없음
+            plan.drop.append(entry)
+            drop_ids.add(entry.id)
+    rewrites = set(additions) | {
+        entry.archive_path for entry in plan.drop if entry.archive_path
+    }
+
+    # 아카이브를 먼저 쓰고 인덱스를 바꾼 뒤 원본을 지움 (중간에 실패해도 유실 없음)
+    for archive_path in sorted(rewrites):
+        keep = {
+            member_name(entry)
+            for entry in screenshot_index.archived_entries(archive_path)
+            if entry.id not in drop_ids
+        }
+        add = {
+            member_name(entry): screenshot_index.absolute_path(entry)
+            for entry in additions.get(archive_path, [])
+        }
+        write_archive(os.path.join(screenshot_index.save_path, archive_path), keep, add)
+    for archive_path, entries in additions.items():
+        screenshot_index.set_archived([entry.id for entry in entries], archive_path)
+    screenshot_index.remove_many(sorted(drop_ids))
+
+    archived = [entry for entries in additions.values() for entry in entries]
+    for entry in archived + plan.drop:
+        if entry.archive_path:
+            continue
+        if screenshot_index.remove_unreferenced(screenshot_index.absolute_path(entry)):
+            stats.deleted_files += 1
+    stats.archived += len(archived)
+    stats.dropped += len(plan.drop)
+    RETENTION_CAPTURES_TOTAL.labels(action="archived").inc(len(archived))
+    RETENTION_CAPTURES_TOTAL.labels(action="dropped").inc(len(plan.drop))
+
+
+class RetentionWorker:
+    """
+    주기적으로 보관 정책을 적용하는 백그라운드 작업
+    - 기동 직후 한 번, 이후 RETENTION_INTERVAL_HOURS마다 실행합니다.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(RetentionWorker, cls).__new__(cls)
+            cls._instance._task = None
+        return cls._instance
+
+    @property
+    def is_started(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if self.is_started:
+            return
+        self._task = asyncio.create_task(self._run())
+        _logger.info("Retention worker started.")
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        _logger.info("Retention worker stopped.")
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.to_thread(
+                    apply_retention, get_screenshot_index(), RetentionPolicy.from_config()
+                )
+            except Exception as e:
+                _logger.error(f"Retention failed: {e}")
+            await asyncio.sleep(max(1, _config.RETENTION_INTERVAL_HOURS) * 3600)
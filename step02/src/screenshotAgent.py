@@ -1,30 +1,83 @@
 # uvicorn src.screenshotAgent:app --reload --port 9910
 
+import asyncio
+import base64
+import json
 import os
-import glob
+import time
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Body, Query
+from fastapi import FastAPI, Body, Query, Request
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from typing import Optional
+from urllib.parse import quote
 
 from src.agent_workflow import AgentWorkflow
+from src.browser_pool import BrowserPool
 from src.capture import capture_all, capture_one
+from src.capture_scheduler import CaptureScheduler
+from src.capture_workers import CaptureWorkerPool
+from src.change_probe import ProbeClient
 from src.config import ConfigManager
+from src.image_diff import diff_captures, heatmap_file
+from src.image_encoder import shutdown_encoder
+from src.image_pyramid import IMAGE_SIZES, SIZE_FULL, ensure_derived, wait_pyramids
 from src.logger import get_logger
+from src.jobs import JobRunner, get_job_store
 from src.kernel_agent import KernelAgent
+from src.retention import RetentionWorker
+from src.screenshot_archive import read_archived
+from src.screenshot_index import get_screenshot_index
+from src.viewport import Viewport, configured_viewports
 from src.models import (
+    JobResponse,
+    JobResultData,
+    JobStatus,
+    ScreenshotDiffResponse,
+    ScreenshotDiffResultData,
+    ScreenshotClosestResponse,
     ScreenshotGetResponse,
     ScreenshotGetResultData,
+    ScreenshotHistoryItem,
+    ScreenshotHistoryResponse,
+    ScreenshotHistoryResultData,
     ScreenshotPostRequest,
     ScreenshotPostResponse,
     ScreenshotPostResultData,
     MCPScreenshotPostRequest,
     MCPScreenshotPostResponse,
     ResultCode,
+    UrlInfo,
 )
 
 
 _config = ConfigManager()
 _logger = get_logger(__name__)
+_browser_pool = BrowserPool()
+_capture_workers = CaptureWorkerPool()
+_job_runner = JobRunner()
+_capture_scheduler = CaptureScheduler()
+_retention_worker = RetentionWorker()
+
+# 비동기 작업 종류
+JOB_SCREENSHOT = "screenshot"
+JOB_MCP = "mcp"
+JOB_AGENT = "agent"
+
+STATIC_PREFIX = "/static/screenshots/"
+TIME_FORMAT = "%Y%m%d-%H%M%S"
+IMAGE_PATH = "/api/v1/predefined/screenshot/image"
+HEATMAP_PATH = "/api/v1/predefined/screenshot/diff/heatmap"
+IMAGE_MEDIA_TYPES = {".webp": "image/webp", ".png": "image/png"}
+HISTORY_MAX_LIMIT = 500
+# 가장 가까운 캡처 조회 방향
+CLOSEST_NEAREST = "nearest"
+CLOSEST_BEFORE = "before"
+CLOSEST_AFTER = "after"
+# captureId로 조회한 이미지는 바뀌지 않으므로 오래 캐시, 최신 이미지는 매번 ETag로 재검증
+CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+CACHE_REVALIDATE = "no-cache"
 
 
 @asynccontextmanager
@@ -34,9 +87,34 @@ async def lifespan(app):
     with open(banner_path, encoding="utf-8") as f:
         banner = f.read()
     _logger.info(banner)
+    try:
+        # SAVE_PATH 바로 아래에 쌓인 이전 파일을 시스템/날짜별 디렉터리로 옮김
+        await asyncio.to_thread(get_screenshot_index().migrate_flat_files)
+    except Exception as e:
+        _logger.error(f"Error occurred while migrating screenshot files: {e}")
+    try:
+        await _browser_pool.start()
+    except Exception as e:
+        # 브라우저 풀은 첫 캡처 요청시 다시 기동을 시도함
+        _logger.error(f"Error occurred while starting browser pool: {e}")
+    if _config.CAPTURE_WORKERS > 0:
+        _capture_workers.start()
+    _job_runner.start()
+    if _config.SCHEDULE_ENABLED:
+        _capture_scheduler.start()
+    if _config.RETENTION_ENABLED:
+        _retention_worker.start()
     yield
     # Shutdown logic
     _logger.info("\n\nAutomated Screenshot Agent is shutting down...\n\n")
+    await _capture_scheduler.stop()
+    await _retention_worker.stop()
+    await ProbeClient().close()
+    await _job_runner.stop()
+    _capture_workers.stop()
+    await _browser_pool.stop()
+    await wait_pyramids()
+    shutdown_encoder()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -45,11 +123,12 @@ agent_workflow = AgentWorkflow()
 
 
 @app.get("/api/v1/predefined/screenshot", response_model=ScreenshotGetResponse)
-async def get_screenshot(systemNm: str = Query(None)):
+async def get_screenshot(systemNm: str = Query(None), size: str = Query(SIZE_FULL)):
     """
     Get Screenshot
     - param
         - systemNm: str (query param, required)
+        - size: imageUrl로 받을 이미지 크기 (thumbnail, medium, full)
     - return
         - ScreenshotResponse
     """
@@ -61,9 +140,15 @@ async def get_screenshot(systemNm: str = Query(None)):
             resultMsg="systemNm query parameter is required.",
             data=None
         )
+    if size not in IMAGE_SIZES:
+        return ScreenshotGetResponse(
+            resultCd=ResultCode.INTERNAL_ERROR,
+            resultMsg=f"Invalid size: {size} (expected {', '.join(IMAGE_SIZES)})",
+            data=None
+        )
 
     # config에서 해당 시스템 정보 조회
-    urlinfo = next((u for u in _config.URLS if u.name == systemNm), None)
+    urlinfo = _config.get_url(systemNm)
     if not urlinfo:
         return ScreenshotGetResponse(
             resultCd=ResultCode.INTERNAL_ERROR,
@@ -71,29 +156,28 @@ async def get_screenshot(systemNm: str = Query(None)):
             data=None
         )
 
-    # 스크린샷 파일 경로 탐색
-    save_path = _config.SAVE_PATH
-    pattern = os.path.join(save_path, f"{systemNm}-*.png")
-    files = glob.glob(pattern)
-    if not files:
+    # 스크린샷 인덱스에서 최신 파일 조회
+    screenshot_index = get_screenshot_index()
+    latest = _latest_screenshot(screenshot_index, systemNm)
+    if latest is None and screenshot_index.backfill(systemNm):
+        # 인덱스 도입 이전에 저장된 파일은 시스템별 최초 1회만 스캔해서 등록
+        latest = _latest_screenshot(screenshot_index, systemNm)
+    if latest is None:
         return ScreenshotGetResponse(
             resultCd=ResultCode.INTERNAL_ERROR,
             resultMsg=f"No screenshot found for systemNm={systemNm}",
             data=None
         )
-    # 최신 파일 선택
-    latest_file = max(files, key=os.path.getctime)
 
     # 접근 가능한 경로 반환
     # TODO: 저장경로를 난수화해서 반환하기
-    static_prefix = "/static/screenshots/"
-    image_name = os.path.basename(latest_file)
-    image_path = static_prefix + image_name
+    image_path = _static_path(latest.image_path)
 
     # 결과 데이터 생성
     result_data = ScreenshotGetResultData(
         systemNm=systemNm,
-        imagePath=image_path
+        imagePath=image_path,
+        imageUrl=_image_url(systemNm, latest.id, size),
     )
     return ScreenshotGetResponse(
         resultCd=ResultCode.SUCCESS,
@@ -102,6 +186,406 @@ async def get_screenshot(systemNm: str = Query(None)):
     )
 
 
+@app.get("/api/v1/predefined/screenshot/diff", response_model=ScreenshotDiffResponse)
+async def get_screenshot_diff(
+    systemNm: str = Query(None),
+    baseId: Optional[int] = Query(None),
+    targetId: Optional[int] = Query(None),
+    baseTime: Optional[str] = Query(None),
+    targetTime: Optional[str] = Query(None),
+):
+    """
+    Get Screenshot Diff
+    - param
+        - systemNm: str (query param, required)
+        - baseId/baseTime: 기준 캡처 id 또는 시각(YYYYmmdd-HHMMSS), 없으면 대상 직전 캡처
+        - targetId/targetTime: 대상 캡처 id 또는 시각(YYYYmmdd-HHMMSS), 없으면 최신 캡처
+    - return
+        - ScreenshotDiffResponse (히트맵 URL, 변경 픽셀 비율, SSIM, 변경 영역)
+    """
+    _logger.info(
+        f"GET /screenshot/diff called with systemNm={systemNm}, "
+        f"baseId={baseId}, targetId={targetId}, "
+        f"baseTime={baseTime}, targetTime={targetTime}"
+    )
+    if not systemNm:
+        return ScreenshotDiffResponse(
+            resultCd=ResultCode.INTERNAL_ERROR,
+            resultMsg="systemNm query parameter is required.",
+            data=None
+        )
+
+    screenshot_index = get_screenshot_index()
+    try:
+        target = _resolve_capture(screenshot_index, systemNm, targetId, targetTime)
+        if target is None and targetId is None and targetTime is None:
+            target = _latest_screenshot(screenshot_index, systemNm)
+        base = _resolve_capture(screenshot_index, systemNm, baseId, baseTime)
+        if base is None and baseId is None and baseTime is None and target:
+            base = screenshot_index.previous(target)
+    except ValueError as e:
+        return ScreenshotDiffResponse(
+            resultCd=ResultCode.INTERNAL_ERROR,
+            resultMsg=str(e),
+            data=None
+        )
+    if base is None or target is None:
+        return ScreenshotDiffResponse(
+            resultCd=ResultCode.INTERNAL_ERROR,
+            resultMsg=f"Two screenshots are required for systemNm={systemNm}",
+            data=None
+        )
+
+    scores = await diff_captures(screenshot_index, base, target)
+    result_data = ScreenshotDiffResultData(
+        systemNm=systemNm,
+        baseId=base.id,
+        targetId=target.id,
+        heatmapPath=f"{HEATMAP_PATH}?key={scores['heatmapKey']}",
+        changedRatio=scores["changedRatio"],
+        ssim=scores["ssim"],
+        changedRegions=scores["changedRegions"],
+    )
+    return ScreenshotDiffResponse(
+        resultCd=ResultCode.SUCCESS,
+        resultMsg="Success",
+        data=result_data
+    )
+
+
+@app.get(
+    "/api/v1/predefined/screenshot/history", response_model=ScreenshotHistoryResponse
+)
+async def get_screenshot_history(
+    systemNm: str = Query(None),
+    startTime: Optional[str] = Query(None),
+    endTime: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(50),
+    order: str = Query("desc"),
+):
+    """
+    Get Screenshot History
+    - 인덱스에서 바로 읽으며 (captured_at, id) 커서로 다음 페이지를 이어 읽습니다.
+    - param
+        - systemNm: str (query param, required)
+        - startTime/endTime: 조회 구간 (YYYYmmdd-HHMMSS, 양 끝 포함), 없으면 전체
+        - cursor: 이전 응답의 nextCursor, 없으면 첫 페이지
+        - limit: 페이지 크기 (최대 HISTORY_MAX_LIMIT)
+        - order: desc(최신순, 기본) 또는 asc
+    - return
+        - ScreenshotHistoryResponse (캡처 목록, 다음 페이지 커서)
+    """
+    _logger.info(
+        f"GET /screenshot/history called with systemNm={systemNm}, "
+        f"startTime={startTime}, endTime={endTime}, cursor={cursor}, "
+        f"limit={limit}, order={order}"
+    )
+    try:
+        if not systemNm:
+            raise ValueError("systemNm query parameter is required.")
+        if order not in ("asc", "desc"):
+            raise ValueError(f"Invalid order: {order} (expected asc or desc)")
+        start = _parse_time(startTime) if startTime else None
+        end = _parse_time(endTime) if endTime else None
+        after = _decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        return ScreenshotHistoryResponse(
+            resultCd=ResultCode.INTERNAL_ERROR,
+            resultMsg=str(e),
+            data=None
+        )
+
+    screenshot_index = get_screenshot_index()
+    screenshot_index.backfill(systemNm)
+    limit = min(max(1, limit), HISTORY_MAX_LIMIT)
+    # 한 건 더 읽어서 다음 페이지가 있는지 확인
+    entries = screenshot_index.history(
+        systemNm, start, end, after, limit + 1, descending=order == "desc"
+    )
+    page = entries[:limit]
+    next_cursor = None
+    if len(entries) > limit:
+        next_cursor = _encode_cursor(page[-1].captured_at, page[-1].id)
+    result_data = ScreenshotHistoryResultData(
+        systemNm=systemNm,
+        items=[_history_item(screenshot_index, entry) for entry in page],
+        nextCursor=next_cursor,
+    )
+    return ScreenshotHistoryResponse(
+        resultCd=ResultCode.SUCCESS,
+        resultMsg="Success",
+        data=result_data
+    )
+
+
+@app.get(
+    "/api/v1/predefined/screenshot/history/closest",
+    response_model=ScreenshotClosestResponse,
+)
+async def get_screenshot_closest(
+    systemNm: str = Query(None),
+    time_str: Optional[str] = Query(None, alias="time"),
+    direction: str = Query(CLOSEST_NEAREST),
+):
+    """
+    Get Closest Screenshot
+    - 정렬된 인덱스에서 이진 탐색으로 지정 시각에 가장 가까운 캡처를 찾습니다.
+    - param
+        - systemNm: str (query param, required)
+        - time: 기준 시각 (YYYYmmdd-HHMMSS, required)
+        - direction: nearest(기본), before(이전 캡처), after(이후 캡처)
+    - return
+        - ScreenshotClosestResponse
+    """
+    _logger.info(
+        f"GET /screenshot/history/closest called with systemNm={systemNm}, "
+        f"time={time_str}, direction={direction}"
+    )
+    try:
+        if not systemNm or not time_str:
+            raise ValueError("systemNm and time query parameters are required.")
+        if direction not in (CLOSEST_NEAREST, CLOSEST_BEFORE, CLOSEST_AFTER):
+            raise ValueError(
+                f"Invalid direction: {direction} "
+                f"(expected {CLOSEST_NEAREST}, {CLOSEST_BEFORE} or {CLOSEST_AFTER})"
+            )
+        at = _parse_time(time_str)
+    except ValueError as e:
+        return ScreenshotClosestResponse(
+            resultCd=ResultCode.INTERNAL_ERROR,
+            resultMsg=str(e),
+            data=None
+        )
+
+    screenshot_index = get_screenshot_index()
+    screenshot_index.backfill(systemNm)
+    if direction == CLOSEST_BEFORE:
+        entry = screenshot_index.latest_before(systemNm, at)
+    elif direction == CLOSEST_AFTER:
+        entry = screenshot_index.earliest_after(systemNm, at)
+    else:
+        entry = screenshot_index.closest(systemNm, at)
+    if entry is None:
+        return ScreenshotClosestResponse(
+            resultCd=ResultCode.INTERNAL_ERROR,
+            resultMsg=f"No screenshot found for systemNm={systemNm} {direction} {time_str}",
+            data=None
+        )
+    return ScreenshotClosestResponse(
+        resultCd=ResultCode.SUCCESS,
+        resultMsg="Success",
+        data=_history_item(screenshot_index, entry)
+    )
+
+
+def _history_item(screenshot_index, entry) -> ScreenshotHistoryItem:
+    size = entry.size
+    if size is None and not entry.archive_path:
+        # 크기 기록 이전 항목은 파일에서 확인
+        path = screenshot_index.absolute_path(entry)
+        size = os.path.getsize(path) if os.path.exists(path) else None
+    return ScreenshotHistoryItem(
+        captureId=entry.id,
+        capturedAt=entry.captured_at,
+        imageUrl=_image_url(entry.system_nm, entry.id),
+        size=size,
+        blobHash=entry.blob_hash,
+        phash=entry.phash,
+        isArchived=bool(entry.archive_path),
+    )
+
+
+@app.get(HEATMAP_PATH, response_class=FileResponse)
+async def get_screenshot_diff_heatmap(request: Request, key: str = Query(None)):
+    """
+    Get Screenshot Diff Heatmap
+    - 키는 두 캡처의 내용 해시로 만들어지므로 같은 키의 히트맵은 바뀌지 않아 장기 캐시합니다.
+    - param
+        - key: 히트맵 키 (/screenshot/diff 응답의 heatmapPath에 포함)
+    - return
+        - 히트맵 이미지 바이트 (image/webp)
+    """
+    _logger.info(f"GET /screenshot/diff/heatmap called with key={key}")
+    path = heatmap_file(get_screenshot_index().save_path, key) if key else None
+    if path is None:
+        return _error_response(400, f"Invalid heatmap key: {key}")
+    if not os.path.exists(path):
+        return _error_response(404, f"No heatmap found for key={key}")
+
+    headers = {"Cache-Control": CACHE_IMMUTABLE, "ETag": f'"{key}"'}
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=IMAGE_MEDIA_TYPES[".webp"], headers=headers)
+
+
+def _image_url(systemNm: str, capture_id: int, size: str = SIZE_FULL) -> str:
+    return f"{IMAGE_PATH}?systemNm={quote(systemNm)}&captureId={capture_id}&size={size}"
+
+
+def _encode_cursor(captured_at: float, entry_id: int) -> str:
+    raw = json.dumps([captured_at, entry_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple[float, int]:
+    try:
+        captured_at, entry_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return float(captured_at), int(entry_id)
+    except (ValueError, TypeError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def _parse_time(time_str: str) -> float:
+    try:
+        return time.mktime(time.strptime(time_str, TIME_FORMAT))
+    except ValueError:
+        raise ValueError(f"Invalid time format (expected {TIME_FORMAT}): {time_str}")
+
+
+@app.get(IMAGE_PATH, response_class=FileResponse)
+async def get_screenshot_image(
+    request: Request,
+    systemNm: str = Query(None),
+    captureId: Optional[int] = Query(None),
+    size: str = Query(SIZE_FULL),
+):
+    """
+    Get Screenshot Image
+    - 스크린샷 파일을 디스크에서 바로 스트리밍합니다. (Range 요청 지원)
+    - ETag는 blob 내용 해시이며, If-None-Match가 일치하면 304를 반환합니다.
+    - 썸네일/중간 크기는 원본 옆에 캐시된 파일을 쓰고, 없으면 그 자리에서 생성합니다.
+    - 보관 정책으로 아카이브에 옮긴 캡처는 size와 관계없이 원본을 반환합니다. (Range 미지원)
+    - param
+        - systemNm: str (query param, required)
+        - captureId: 캡처 id, 없으면 최신 캡처 (captureId로 조회하면 장기 캐시)
+        - size: thumbnail, medium, full (기본 full)
+    - return
+        - 이미지 바이트 (image/webp, image/png)
+    """
+    _logger.info(
+        f"GET /screenshot/image called with systemNm={systemNm}, "
+        f"captureId={captureId}, size={size}"
+    )
+    if not systemNm:
+        return _error_response(400, "systemNm query parameter is required.")
+    if size not in IMAGE_SIZES:
+        return _error_response(
+            400, f"Invalid size: {size} (expected {', '.join(IMAGE_SIZES)})"
+        )
+
+    screenshot_index = get_screenshot_index()
+    if captureId is not None:
+        entry = screenshot_index.get(captureId)
+        if entry is not None and entry.system_nm != systemNm:
+            entry = None
+    else:
+        entry = _latest_screenshot(screenshot_index, systemNm)
+    if entry is not None and entry.archive_path:
+        return await _archived_image_response(request, screenshot_index, entry)
+    path = screenshot_index.absolute_path(entry) if entry else None
+    if path is None or not os.path.exists(path):
+        return _error_response(404, f"No screenshot found for systemNm={systemNm}")
+    path = await ensure_derived(path, size)
+
+    headers = {
+        "Cache-Control": CACHE_IMMUTABLE if captureId is not None else CACHE_REVALIDATE
+    }
+    if entry.blob_hash:
+        # 인덱스 도입 이전 파일은 blob 해시가 없어 FileResponse 기본 ETag 사용
+        tag = entry.blob_hash if size == SIZE_FULL else f"{entry.blob_hash}-{size}"
+        headers["ETag"] = f'"{tag}"'
+        if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+    extension = os.path.splitext(path)[1].lower()
+    return FileResponse(
+        path,
+        media_type=IMAGE_MEDIA_TYPES.get(extension, "application/octet-stream"),
+        headers=headers,
+    )
+
+
+async def _archived_image_response(request: Request, screenshot_index, entry):
+    """
+    아카이브에 보관된 캡처 이미지 응답 (아카이브 캡처는 바뀌지 않으므로 장기 캐시)
+    """
+    headers = {"Cache-Control": CACHE_IMMUTABLE}
+    if entry.blob_hash:
+        headers["ETag"] = f'"{entry.blob_hash}"'
+        if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+    data = await asyncio.to_thread(read_archived, screenshot_index, entry)
+    if data is None:
+        return _error_response(404, f"No screenshot found for systemNm={entry.system_nm}")
+    extension = os.path.splitext(entry.image_path)[1].lower()
+    return Response(
+        content=data,
+        media_type=IMAGE_MEDIA_TYPES.get(extension, "application/octet-stream"),
+        headers=headers,
+    )
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더와 ETag 비교 (약한 비교, * 지원)
+    """
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == etag for tag in candidates
+    )
+
+
+def _error_response(status_code: int, message: str) -> JSONResponse:
+    response = ScreenshotGetResponse(
+        resultCd=ResultCode.INTERNAL_ERROR, resultMsg=message, data=None
+    )
+    return JSONResponse(status_code=status_code, content=response.model_dump(mode="json"))
+
+
+def _resolve_capture(
+    screenshot_index, systemNm: str, entry_id: Optional[int], time_str: Optional[str]
+):
+    """
+    캡처 id 또는 시각으로 인덱스 항목 조회
+    - 시각은 YYYYmmdd-HHMMSS 형식이며, 그 시각 이전의 가장 최근 캡처를 반환
+    """
+    if entry_id is not None:
+        entry = screenshot_index.get(entry_id)
+        if entry is None or entry.system_nm != systemNm:
+            raise ValueError(f"No screenshot found for id={entry_id}")
+        return entry
+    if time_str is not None:
+        captured_at = _parse_time(time_str)
+        entry = screenshot_index.latest_before(systemNm, captured_at)
+        if entry is None:
+            raise ValueError(f"No screenshot found before {time_str}")
+        return entry
+    return None
+
+
+def _static_path(relative_path: str) -> str:
+    return STATIC_PREFIX + relative_path.replace(os.sep, "/")
+
+
+def _latest_screenshot(screenshot_index, systemNm: str):
+    """
+    인덱스에서 실제 파일이 남아있는 최신 캡처 조회
+    - 삭제된 파일의 인덱스 항목은 정리하고 다음 최신 항목을 조회
+    - 아카이브에 보관된 항목은 파일이 없어도 남겨 둡니다.
+    """
+    latest = screenshot_index.latest(systemNm)
+    while (
+        latest
+        and not latest.archive_path
+        and not os.path.exists(screenshot_index.absolute_path(latest))
+    ):
+        screenshot_index.remove(latest.id)
+        latest = screenshot_index.latest(systemNm)
+    return latest
+
+
 @app.post("/api/v1/predefined/screenshot", response_model=ScreenshotPostResponse)
 async def post_screenshot(request: ScreenshotPostRequest = Body(...)):
     """
@@ -109,35 +593,39 @@ async def post_screenshot(request: ScreenshotPostRequest = Body(...)):
     - param
         - request: ScreenshotRequest
         - if not provided, all URLs will be processed
+        - if stream is true, each CaptureResult is streamed as NDJSON
+        - if viewportMatrix is true, each page is loaded once and captured
+          at every [VIEWPORTS] breakpoint
     - return
         - ScreenshotResponse
         
     This feature is based on the paper: LLM-Guided Scenario-based GUI Testing (Jun 2025)
     """
     _logger.info(f"POST /screenshot called with request={request}")
+    requested_urlinfos = _requested_urlinfos(request.systemNm)
+    viewports = _requested_viewports(request.viewportMatrix)
 
-    if not request.systemNm:
-        _logger.debug("No systemNm provided, processing all URLs.")
-        requested_urlinfos = _config.URLS
-        passed_urlinfos, failed_urlinfos = await capture_all(
-            requested_urlinfos
-        )
-    else:
-        _logger.debug(f"Processing URLs for systemNm={request.systemNm}.")
-        requested_urlinfo = next(
-            (u for u in _config.URLS if u.name == request.systemNm), None
+    if request.stream:
+        return StreamingResponse(
+            _stream_capture_results(requested_urlinfos, viewports),
+            media_type="application/x-ndjson",
         )
-        if not requested_urlinfo:
-            raise ValueError(f"No URLs found for systemNm={request.systemNm}")
-        is_success = await capture_one(requested_urlinfo)
-        requested_urlinfos = [requested_urlinfo]
-        passed_urlinfos = [requested_urlinfo] if is_success else []
-        failed_urlinfos = [] if is_success else [requested_urlinfo]
+
+    passed_urlinfos = []
+    failed_urlinfos = []
+    capture_results = []
+    async for result in _capture_results(requested_urlinfos, viewports):
+        capture_results.append(result)
+        if result.isSuccess:
+            passed_urlinfos.append(result.urlinfo)
+        else:
+            failed_urlinfos.append(result.urlinfo)
 
     result_data = ScreenshotPostResultData(
         requestedUrls=requested_urlinfos,
         passedUrls=passed_urlinfos,
-        failedUrls=failed_urlinfos
+        failedUrls=failed_urlinfos,
+        results=capture_results
     )
     return ScreenshotPostResponse(
         resultCd=ResultCode.SUCCESS,
@@ -146,6 +634,68 @@ async def post_screenshot(request: ScreenshotPostRequest = Body(...)):
     )
 
 
+def _requested_urlinfos(systemNm: Optional[str]) -> list[UrlInfo]:
+    """
+    캡처 대상 조회 (systemNm이 없으면 전체)
+    """
+    if not systemNm:
+        _logger.debug("No systemNm provided, processing all URLs.")
+        # 응답 모델이 list만 그대로 받으므로 공유 목록(tuple)의 얕은 복사본 반환
+        return list(_config.URLS)
+    _logger.debug(f"Processing URLs for systemNm={systemNm}.")
+    requested_urlinfo = _config.get_url(systemNm)
+    if not requested_urlinfo:
+        raise ValueError(f"No URLs found for systemNm={systemNm}")
+    return [requested_urlinfo]
+
+
+def _requested_viewports(viewport_matrix: bool) -> Optional[list[Viewport]]:
+    """
+    뷰포트 매트릭스 캡처 대상 뷰포트 조회 (요청하지 않으면 None)
+    """
+    if not viewport_matrix:
+        return None
+    viewports = configured_viewports()
+    if not viewports:
+        raise ValueError("No viewports configured in [VIEWPORTS].")
+    return viewports
+
+
+async def _capture_results(
+    urlinfos: list[UrlInfo], viewports: Optional[list[Viewport]] = None
+):
+    """
+    캡처 대상 수에 맞춰 capture_one 또는 capture_all 결과를 순서대로 반환
+    - CAPTURE_WORKERS가 1 이상이면 여러 건 캡처는 워커 프로세스에 나눠 실행
+    """
+    if len(urlinfos) == 1:
+        yield await capture_one(urlinfos[0], viewports=viewports)
+    elif _config.CAPTURE_WORKERS > 0:
+        async for result in _capture_workers.capture(urlinfos, viewports):
+            yield result
+    else:
+        async for result in capture_all(urlinfos, viewports):
+            yield result
+
+
+async def _stream_capture_results(
+    urlinfos: list[UrlInfo], viewports: Optional[list[Viewport]] = None
+):
+    """
+    캡처 결과를 완료되는 즉시 NDJSON 한 줄씩 내보냄
+    """
+    async for result in _capture_results(urlinfos, viewports):
+        yield result.model_dump_json() + "\n"
+
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """
+    Prometheus 메트릭 (캡처 단계별 소요 시간, 시스템별 결과 수, 캡처 대기열)
+    """
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.post("/api/v1/mcp/screenshot", response_model=MCPScreenshotPostResponse)
 async def post_mcp_screenshot(request: MCPScreenshotPostRequest = Body(...)):
     """
@@ -198,3 +748,145 @@ async def post_mcp_screenshot(request: MCPScreenshotPostRequest = Body(...)):
         resultMsg="Success",
         data=result_data
     )
+
+
+@app.post(
+    "/api/v1/predefined/screenshot/jobs",
+    response_model=JobResponse,
+    status_code=202,
+)
+async def post_screenshot_job(request: ScreenshotPostRequest = Body(...)):
+    """
+    Post Screenshot Job
+    - 캡처를 백그라운드 작업으로 등록하고 바로 작업 id를 반환합니다.
+    - 진행 상황과 부분 결과는 GET /api/v1/jobs/{jobId}로 조회합니다.
+    - param
+        - request: ScreenshotPostRequest (stream은 무시)
+    - return
+        - JobResponse
+    """
+    _logger.info(f"POST /screenshot/jobs called with request={request}")
+    requested_urlinfos = _requested_urlinfos(request.systemNm)
+    _requested_viewports(request.viewportMatrix)
+    job = _job_runner.submit(
+        JOB_SCREENSHOT,
+        {
+            "urlinfos": [u.model_dump() for u in requested_urlinfos],
+            "viewportMatrix": request.viewportMatrix,
+        },
+        total=len(requested_urlinfos),
+    )
+    return JobResponse(
+        resultCd=ResultCode.SUCCESS,
+        resultMsg="Accepted",
+        data=_job_result_data(job.id)
+    )
+
+
+@app.post("/api/v1/mcp/screenshot/jobs", response_model=JobResponse, status_code=202)
+async def post_mcp_screenshot_job(request: MCPScreenshotPostRequest = Body(...)):
+    """
+    Post MCP Screenshot Job
+    - param
+        - request: MCPScreenshotPostRequest
+    - return
+        - JobResponse
+    """
+    _logger.info(f"POST /mcp/screenshot/jobs called with request={request}")
+    if not request.prompt:
+        raise ValueError("Prompt is required for MCP screenshot request.")
+    job = _job_runner.submit(JOB_MCP, {"prompt": request.prompt}, total=1)
+    return JobResponse(
+        resultCd=ResultCode.SUCCESS,
+        resultMsg="Accepted",
+        data=_job_result_data(job.id)
+    )
+
+
+@app.post("/api/v1/agents/screenshot/jobs", response_model=JobResponse, status_code=202)
+async def post_agent_screenshot_job(request: MCPScreenshotPostRequest = Body(...)):
+    """
+    Post Agents Screenshot Job
+    - param
+        - request: MCPScreenshotPostRequest
+    - return
+        - JobResponse
+    """
+    _logger.info(f"POST /agents/screenshot/jobs called with request={request}")
+    if not request.prompt:
+        raise ValueError("Prompt is required for MCP screenshot request.")
+    job = _job_runner.submit(JOB_AGENT, {"prompt": request.prompt}, total=1)
+    return JobResponse(
+        resultCd=ResultCode.SUCCESS,
+        resultMsg="Accepted",
+        data=_job_result_data(job.id)
+    )
+
+
+@app.get("/api/v1/jobs/{jobId}", response_model=JobResponse)
+async def get_job(jobId: str):
+    """
+    Get Job
+    - param
+        - jobId: 작업 id
+    - return
+        - JobResponse (상태, 진행 건수, 부분 결과)
+    """
+    _logger.info(f"GET /jobs called with jobId={jobId}")
+    result_data = _job_result_data(jobId)
+    if result_data is None:
+        return JobResponse(
+            resultCd=ResultCode.INTERNAL_ERROR,
+            resultMsg=f"No job found for jobId={jobId}",
+            data=None
+        )
+    return JobResponse(
+        resultCd=ResultCode.SUCCESS,
+        resultMsg="Success",
+        data=result_data
+    )
+
+
+def _job_result_data(job_id: str) -> Optional[JobResultData]:
+    """
+    작업 상태와 부분 결과 조회
+    """
+    store = get_job_store()
+    job = store.get(job_id)
+    if job is None:
+        return None
+    return JobResultData(
+        jobId=job.id,
+        kind=job.kind,
+        status=JobStatus(job.status),
+        total=job.total,
+        completed=job.completed,
+        results=store.results(job.id) if job.kind == JOB_SCREENSHOT else [],
+        output=job.output,
+        errorMsg=job.error,
+        createdAt=job.created_at,
+        startedAt=job.started_at,
+        finishedAt=job.finished_at,
+    )
+
+
+async def _run_screenshot_job(payload: dict, add_result) -> None:
+    urlinfos = [UrlInfo.model_validate(u) for u in payload["urlinfos"]]
+    viewports = _requested_viewports(payload.get("viewportMatrix", False))
+    async for result in _capture_results(urlinfos, viewports):
+        add_result(result.model_dump())
+
+
+async def _run_mcp_job(payload: dict, add_result) -> str:
+    response = await agent.get_response(messages=payload["prompt"])
+    return str(getattr(response, "content", response))
+
+
+async def _run_agent_job(payload: dict, add_result) -> str:
+    response = await agent_workflow.get_response(user_prompt=payload["prompt"])
+    return str(getattr(response, "content", response))
+
+
+_job_runner.register(JOB_SCREENSHOT, _run_screenshot_job)
+_job_runner.register(JOB_MCP, _run_mcp_job)
+_job_runner.register(JOB_AGENT, _run_agent_job)
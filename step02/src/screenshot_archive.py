@@ -0,0 +1,105 @@
+import os
+import time
+import uuid
+import zipfile
+
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from src.logger import get_logger
+from src.screenshot_index import IndexEntry, ScreenshotIndex
+from src.screenshot_store import safe_name
+
+_logger = get_logger(__name__)
+
+ARCHIVE_DIR = "archives"
+
+
+def archive_path_for(system_nm: str, captured_at: float) -> str:
+    """
+    캡처를 보관할 아카이브 경로 (SAVE_PATH 기준, 시스템별 월 단위 zip)
+    - 예: archives/네이버/2026-03.zip
+    """
+    month = time.strftime("%Y-%m", time.localtime(captured_at))
+    return os.path.join(ARCHIVE_DIR, safe_name(system_nm), f"{month}.zip")
+
+
+def member_name(entry: IndexEntry) -> str:
+    """
+    아카이브 안의 파일명 (같은 blob을 가리키는 캡처는 한 번만 저장)
+    """
+    return os.path.basename(entry.image_path)
+
+
+def read_archived(screenshot_index: ScreenshotIndex, entry: IndexEntry) -> Optional[bytes]:
+    """
+    아카이브에 보관된 캡처의 이미지 바이트
+    - return
+        - data: 이미지 바이트, 아카이브나 파일이 없으면 None
+    """
+    path = os.path.join(screenshot_index.save_path, entry.archive_path)
+    try:
+        with zipfile.ZipFile(path) as archive:
+            return archive.read(member_name(entry))
+    except (OSError, KeyError, zipfile.BadZipFile) as e:
+        _logger.warning(f"Archived screenshot not readable: {entry.archive_path}: {e}")
+        return None
+
+
+def write_archive(path: str, keep: set[str], add: dict[str, str]) -> int:
+    """
+    아카이브 재작성 (기존 파일은 새 파일로 교체하므로 읽는 쪽은 항상 완전한 zip을 봄)
+    - 이미지는 이미 압축된 포맷이므로 zip 압축 없이 저장합니다.
+    - param
+        - path: 아카이브 절대 경로
+        - keep: 기존 아카이브에서 남길 파일명
+        - add: 새로 넣을 파일명 → 원본 파일 경로
+    - return
+        - count: 아카이브에 남은 파일 수 (0이면 아카이브 삭제)
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    written = set()
+    try:
+        with zipfile.ZipFile(temp_path, "w", zipfile.ZIP_STORED) as archive:
+            if os.path.exists(path):
+                with zipfile.ZipFile(path) as previous:
+                    for info in previous.infolist():
+                        if info.filename in keep and info.filename not in written:
+                            archive.writestr(info, previous.read(info))
+                            written.add(info.filename)
+            for name, source in add.items():
+                if name not in written:
+                    archive.write(source, name)
+                    written.add(name)
+        if written:
+            os.replace(temp_path, path)
+        elif os.path.exists(path):
+            os.remove(path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return len(written)
+
+
+@contextmanager
+def local_copy(screenshot_index: ScreenshotIndex, entry: IndexEntry) -> Iterator[str]:
+    """
+    캡처 이미지의 파일 경로 (아카이브에 보관된 캡처는 블록 동안만 임시 파일로 꺼냄)
+    """
+    if not entry.archive_path:
+        yield screenshot_index.absolute_path(entry)
+        return
+    data = read_archived(screenshot_index, entry)
+    if data is None:
+        raise FileNotFoundError(f"Archived screenshot not found: {entry.archive_path}")
+    extension = os.path.splitext(entry.image_path)[1]
+    temp_path = os.path.join(
+        screenshot_index.save_path, f".archived-{uuid.uuid4().hex}{extension}"
+    )
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        yield temp_path
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
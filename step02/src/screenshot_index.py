@@ -0,0 +1,525 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from dataclasses import dataclass
+from typing import Optional
+from src.config import ConfigManager
+from src.image_pyramid import is_derived, remove_derived
+from src.logger import get_logger
+from src.screenshot_store import FILE_TIME_FORMAT, ScreenshotStore
+
+_logger = get_logger(__name__)
+_config = ConfigManager()
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+INDEX_FILE = "index.sqlite3"
+SCHEMA_VERSION = 6
+ENTRY_COLUMNS = (
+    "id, system_nm, captured_at, image_path, blob_hash, phash, archive_path, size"
+)
+PROBE_COLUMNS = "url, etag, last_modified, dom_hash"
+SCREENSHOT_EXTENSIONS = ("webp", "png")
+# SAVE_PATH 바로 아래에 저장하던 이전 파일명 ({시스템명}-{yyyymmdd-HHMMSS}.{확장자})
+FLAT_FILE = re.compile(
+    r"^(?P<system_nm>.+)-(?P<stamp>\d{8}-\d{6})\.(?:%s)$" % "|".join(SCREENSHOT_EXTENSIONS)
+)
+
+
+@dataclass
+class IndexEntry:
+    """
+    스크린샷 인덱스 항목
+    """
+    id: int
+    system_nm: str
+    captured_at: float
+    image_path: str  # SAVE_PATH 기준 상대 경로
+    blob_hash: Optional[str] = None
+    phash: Optional[str] = None
+    archive_path: Optional[str] = None  # 보관 아카이브 (SAVE_PATH 기준), 없으면 image_path에 있음
+    size: Optional[int] = None  # 이미지 파일 크기 (바이트)
+
+
+@dataclass
+class ProbeValidators:
+    """
+    직전 캡처 시점의 HTTP 검증값 (사전 변경 확인용)
+    """
+    url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    dom_hash: Optional[str] = None
+
+
+class ScreenshotIndex:
+    """
+    스크린샷 인덱스 (SQLite)
+    - 시스템별 캡처를 시간순으로 정렬해 보관합니다.
+    - (system_nm, captured_at) 인덱스로 최신 캡처를 O(log n)에 조회합니다.
+    - 이력은 (captured_at, id) 커서로 페이지를 나눠 OFFSET 없이 인덱스를 이어서 읽습니다.
+    """
+
+    def __init__(self, save_path: str):
+        self.save_path = os.path.abspath(save_path)
+        self.db_path = os.path.join(self.save_path, INDEX_FILE)
+        self._lock = threading.Lock()
+        self._backfilled = set()
+        os.makedirs(self.save_path, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._lock, self._conn:
+            self._migrate()
+
+    def _migrate(self):
+        """
+        스키마 버전(PRAGMA user_version)에 맞춰 테이블 생성/변경
+        """
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+        self._conn.execute("BEGIN")
+        if version < 1:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS captures ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " system_nm TEXT NOT NULL,"
+                " captured_at REAL NOT NULL,"
+                " image_path TEXT NOT NULL UNIQUE"
+                ")"
+            )
+        if version < 2:
+            # 같은 blob을 여러 캡처가 가리킬 수 있도록 image_path UNIQUE 제거
+            self._conn.execute("ALTER TABLE captures RENAME TO captures_v1")
+            self._conn.execute(
+                "CREATE TABLE captures ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " system_nm TEXT NOT NULL,"
+                " captured_at REAL NOT NULL,"
+                " image_path TEXT NOT NULL,"
+                " blob_hash TEXT"
+                ")"
+            )
+            self._conn.execute(
+                "INSERT INTO captures (id, system_nm, captured_at, image_path)"
+                " SELECT id, system_nm, captured_at, image_path FROM captures_v1"
+            )
+            self._conn.execute("DROP TABLE captures_v1")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_captures_system_time"
+                " ON captures (system_nm, captured_at)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_captures_image_path"
+                " ON captures (image_path)"
+            )
+        if version < 3:
+            self._conn.execute("ALTER TABLE captures ADD COLUMN phash TEXT")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_captures_blob_hash"
+                " ON captures (blob_hash)"
+            )
+        if version < 4:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS probes ("
+                " system_nm TEXT PRIMARY KEY,"
+                " url TEXT NOT NULL,"
+                " etag TEXT,"
+                " last_modified TEXT,"
+                " dom_hash TEXT"
+                ")"
+            )
+        if version < 5:
+            self._conn.execute("ALTER TABLE captures ADD COLUMN archive_path TEXT")
+        if version < 6:
+            # 기존 항목의 크기는 조회시 파일에서 확인
+            self._conn.execute("ALTER TABLE captures ADD COLUMN size INTEGER")
+        self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def add(
+        self,
+        system_nm: str,
+        image_path: str,
+        captured_at: float,
+        blob_hash: Optional[str] = None,
+        phash: Optional[str] = None,
+        size: Optional[int] = None,
+        require_file: bool = False,
+    ) -> Optional[int]:
+        """
+        캡처 등록
+        - param
+            - system_nm: 시스템명
+            - image_path: 저장된 이미지 경로
+            - captured_at: 캡처 시각 (epoch seconds)
+            - blob_hash: 내용 주소화 저장소의 blob 해시
+            - phash: 이미지 perceptual hash (dHash)
+            - size: 이미지 파일 크기, 없으면 파일에서 확인
+            - require_file: 파일이 남아 있을 때만 등록 (보존 정책의 파일 삭제와 직렬화)
+        - return
+            - id: 인덱스 항목 id, require_file인데 파일이 없으면 None
+        """
+        if size is None and os.path.exists(image_path):
+            size = os.path.getsize(image_path)
+        with self._lock, self._conn:
+            if require_file:
+                # 쓰기 잠금을 먼저 잡아 다른 프로세스의 remove_unreferenced와 겹치지 않게 함
+                self._conn.execute("BEGIN IMMEDIATE")
+                if not os.path.exists(image_path):
+                    return None
+            cursor = self._conn.execute(
+                "INSERT INTO captures"
+                " (system_nm, captured_at, image_path, blob_hash, phash, size)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    system_nm,
+                    captured_at,
+                    self.relative_path(image_path),
+                    blob_hash,
+                    phash,
+                    size,
+                ),
+            )
+            return cursor.lastrowid
+
+    def latest(self, system_nm: str) -> Optional[IndexEntry]:
+        """
+        시스템의 최신 캡처 조회
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {ENTRY_COLUMNS} FROM captures"
+                " WHERE system_nm = ? ORDER BY captured_at DESC, id DESC LIMIT 1",
+                (system_nm,),
+            ).fetchone()
+        return IndexEntry(*row) if row else None
+
+    def get(self, entry_id: int) -> Optional[IndexEntry]:
+        """
+        id로 캡처 조회
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {ENTRY_COLUMNS} FROM captures WHERE id = ?",
+                (entry_id,),
+            ).fetchone()
+        return IndexEntry(*row) if row else None
+
+    def latest_before(self, system_nm: str, captured_at: float) -> Optional[IndexEntry]:
+        """
+        지정 시각 이전(같은 시각 포함)의 가장 최근 캡처 조회
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {ENTRY_COLUMNS} FROM captures"
+                " WHERE system_nm = ? AND captured_at <= ?"
+                " ORDER BY captured_at DESC, id DESC LIMIT 1",
+                (system_nm, captured_at),
+            ).fetchone()
+        return IndexEntry(*row) if row else None
+
+    def earliest_after(self, system_nm: str, captured_at: float) -> Optional[IndexEntry]:
+        """
+        지정 시각 이후(같은 시각 포함)의 가장 이른 캡처 조회
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {ENTRY_COLUMNS} FROM captures"
+                " WHERE system_nm = ? AND captured_at >= ?"
+                " ORDER BY captured_at, id LIMIT 1",
+                (system_nm, captured_at),
+            ).fetchone()
+        return IndexEntry(*row) if row else None
+
+    def closest(self, system_nm: str, captured_at: float) -> Optional[IndexEntry]:
+        """
+        지정 시각에 가장 가까운 캡처 조회
+        - 정렬된 인덱스에서 시각 앞뒤를 한 번씩 탐색(B-tree 이진 탐색)해 가까운 쪽을 고릅니다.
+        - 앞뒤 간격이 같으면 이전 캡처를 반환합니다.
+        """
+        before = self.latest_before(system_nm, captured_at)
+        after = self.earliest_after(system_nm, captured_at)
+        if before is None or after is None:
+            return before or after
+        if after.captured_at - captured_at < captured_at - before.captured_at:
+            return after
+        return before
+
+    def history(
+        self,
+        system_nm: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        cursor: Optional[tuple[float, int]] = None,
+        limit: int = 50,
+        descending: bool = True,
+    ) -> list[IndexEntry]:
+        """
+        시스템의 캡처 이력 조회 (커서 페이지네이션)
+        - param
+            - start, end: 캡처 시각 범위 (epoch seconds, 양 끝 포함)
+            - cursor: 이전 페이지 마지막 항목의 (captured_at, id), 없으면 첫 페이지
+            - limit: 페이지 크기
+            - descending: True면 최신순, False면 오래된 순
+        - return
+            - entries: 캡처 목록
+        """
+        conditions = ["system_nm = ?"]
+        params: list = [system_nm]
+        if start is not None:
+            conditions.append("captured_at >= ?")
+            params.append(start)
+        if end is not None:
+            conditions.append("captured_at <= ?")
+            params.append(end)
+        if cursor is not None:
+            # 행 값 비교여야 (system_nm, captured_at) 인덱스를 범위로 탐색함
+            op = "<" if descending else ">"
+            conditions.append(f"(captured_at, id) {op} (?, ?)")
+            params.extend(cursor)
+        order = "DESC" if descending else "ASC"
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {ENTRY_COLUMNS} FROM captures"
+                f" WHERE {' AND '.join(conditions)}"
+                f" ORDER BY captured_at {order}, id {order} LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+        return [IndexEntry(*row) for row in rows]
+
+    def previous(self, entry: IndexEntry) -> Optional[IndexEntry]:
+        """
+        같은 시스템에서 지정 캡처 바로 이전의 캡처 조회
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {ENTRY_COLUMNS} FROM captures"
+                " WHERE system_nm = ?"
+                " AND (captured_at, id) < (?, ?)"
+                " ORDER BY captured_at DESC, id DESC LIMIT 1",
+                (entry.system_nm, entry.captured_at, entry.id),
+            ).fetchone()
+        return IndexEntry(*row) if row else None
+
+    def relative_path(self, image_path: str) -> str:
+        """
+        이미지 경로를 SAVE_PATH 기준 상대 경로로 변환
+        """
+        return os.path.relpath(os.path.abspath(image_path), self.save_path)
+
+    def absolute_path(self, entry: IndexEntry) -> str:
+        """
+        인덱스 항목의 이미지 절대 경로
+        """
+        return os.path.join(self.save_path, entry.image_path)
+
+    def remove_unreferenced(self, image_path: str) -> bool:
+        """
+        파일을 직접 가리키는 인덱스 항목이 없으면 파일과 파생 이미지 삭제
+        - 참조 수 확인과 삭제를 하나의 쓰기 트랜잭션에서 하므로 그 사이에
+          require_file로 등록하는 캡처가 지워질 파일을 가리킬 수 없습니다.
+        - param
+            - image_path: 이미지 경로
+        - return
+            - deleted: 파일을 지웠는지 여부
+        """
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            refs = self._conn.execute(
+                "SELECT COUNT(*) FROM captures"
+                " WHERE image_path = ? AND archive_path IS NULL",
+                (self.relative_path(image_path),),
+            ).fetchone()[0]
+            if refs:
+                return False
+            deleted = os.path.exists(image_path)
+            if deleted:
+                os.remove(image_path)
+            remove_derived(image_path)
+            return deleted
+
+    def systems(self) -> list[str]:
+        """
+        캡처가 있는 시스템명 목록
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT system_nm FROM captures ORDER BY system_nm"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def entries(self, system_nm: str) -> list[IndexEntry]:
+        """
+        시스템의 전체 캡처 (오래된 순)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {ENTRY_COLUMNS} FROM captures"
+                " WHERE system_nm = ? ORDER BY captured_at, id",
+                (system_nm,),
+            ).fetchall()
+        return [IndexEntry(*row) for row in rows]
+
+    def archived_entries(self, archive_path: str) -> list[IndexEntry]:
+        """
+        아카이브에 보관된 캡처
+        - param
+            - archive_path: SAVE_PATH 기준 아카이브 경로
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {ENTRY_COLUMNS} FROM captures WHERE archive_path = ?",
+                (archive_path,),
+            ).fetchall()
+        return [IndexEntry(*row) for row in rows]
+
+    def set_archived(self, entry_ids: list[int], archive_path: str):
+        """
+        캡처를 아카이브에 보관된 것으로 표시
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE captures SET archive_path = ? WHERE id = ?",
+                [(archive_path, entry_id) for entry_id in entry_ids],
+            )
+
+    def remove(self, entry_id: int):
+        """
+        인덱스 항목 삭제
+        """
+        self.remove_many([entry_id])
+
+    def remove_many(self, entry_ids: list[int]):
+        """
+        인덱스 항목 여러 개 삭제
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM captures WHERE id = ?",
+                [(entry_id,) for entry_id in entry_ids],
+            )
+
+    def get_probe(self, system_nm: str) -> Optional[ProbeValidators]:
+        """
+        시스템의 직전 캡처 검증값 조회
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {PROBE_COLUMNS} FROM probes WHERE system_nm = ?",
+                (system_nm,),
+            ).fetchone()
+        return ProbeValidators(*row) if row else None
+
+    def save_probe(self, system_nm: str, validators: ProbeValidators):
+        """
+        시스템의 캡처 검증값 저장 (기존 값은 덮어씀)
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO probes (system_nm, {PROBE_COLUMNS})"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    system_nm,
+                    validators.url,
+                    validators.etag,
+                    validators.last_modified,
+                    validators.dom_hash,
+                ),
+            )
+
+    def backfill(self, system_nm: str) -> int:
+        """
+        SAVE_PATH 바로 아래에 남아 있는 시스템의 이전 파일을 날짜별 디렉터리로 옮기고 인덱스에 등록
+        - 시스템별로 프로세스당 최초 1회만 디렉터리를 스캔합니다.
+        - return
+            - count: 옮긴 파일 수
+        """
+        if system_nm in self._backfilled:
+            return 0
+        self._backfilled.add(system_nm)
+        return self.migrate_flat_files(system_nm)
+
+    def migrate_flat_files(self, system_nm: Optional[str] = None) -> int:
+        """
+        SAVE_PATH 바로 아래의 {시스템명}-{시각}.{webp,png} 파일을 {시스템명}/yyyy/mm/dd/로 이동
+        - 같은 파일시스템 안의 rename이므로 파일 단위로 원자적입니다.
+        - 인덱스에 있는 파일은 경로만 바꾸고, 없는 파일은 새로 등록합니다.
+        - 이전 위치에 만들어 둔 파생 이미지는 지우고 조회시 다시 생성합니다.
+        - param
+            - system_nm: 옮길 시스템, 없으면 전체
+        - return
+            - count: 옮긴 파일 수
+        """
+        store = ScreenshotStore(self.save_path)
+        with os.scandir(self.save_path) as scanned:
+            names = sorted(entry.name for entry in scanned if entry.is_file())
+        count = 0
+        for name in names:
+            match = FLAT_FILE.match(name)
+            if not match or is_derived(name):
+                continue
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT system_nm, captured_at FROM captures"
+                    " WHERE image_path = ? ORDER BY id LIMIT 1",
+                    (name,),
+                ).fetchone()
+            owner = row[0] if row else match["system_nm"]
+            if system_nm is not None and owner != system_nm:
+                continue
+            old_path = os.path.join(self.save_path, name)
+            captured_at = row[1] if row else _flat_file_time(old_path, match["stamp"])
+            new_path = store.shard_path(owner, captured_at, name)
+            os.makedirs(os.path.dirname(new_path), exist_ok=True)
+            os.replace(old_path, new_path)
+            remove_derived(old_path)
+            with self._lock, self._conn:
+                if row:
+                    self._conn.execute(
+                        "UPDATE captures SET image_path = ? WHERE image_path = ?",
+                        (self.relative_path(new_path), name),
+                    )
+                else:
+                    self._conn.execute(
+                        "INSERT INTO captures"
+                        " (system_nm, captured_at, image_path, size) VALUES (?, ?, ?, ?)",
+                        (
+                            owner,
+                            captured_at,
+                            self.relative_path(new_path),
+                            os.path.getsize(new_path),
+                        ),
+                    )
+            count += 1
+        if count:
+            _logger.info(f"Migrated {count} flat screenshot file(s) into dated directories.")
+        return count
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _flat_file_time(path: str, stamp: str) -> float:
+    try:
+        return time.mktime(time.strptime(stamp, FILE_TIME_FORMAT))
+    except ValueError:
+        return os.path.getctime(path)
+
+
+def get_screenshot_index(save_path: Optional[str] = None) -> ScreenshotIndex:
+    """
+    SAVE_PATH별 스크린샷 인덱스 반환
+    - param
+        - save_path: 스크린샷 저장 경로, 없으면 설정값 사용
+    """
+    save_path = os.path.abspath(save_path or _config.SAVE_PATH)
+    with _indexes_lock:
+        index = _indexes.get(save_path)
+        if index is None or not os.path.exists(index.db_path):
+            # 저장 경로가 삭제된 뒤 다시 만들어진 경우 인덱스도 새로 생성
+            index = _indexes[save_path] = ScreenshotIndex(save_path)
+        return index
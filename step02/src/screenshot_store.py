@@ -0,0 +1,112 @@
+import hashlib
+import os
+import re
+import time
+import uuid
+
+from dataclasses import dataclass
+
+BLOB_DIR = "blobs"
+# 시스템별 캡처 파일명의 시각 형식 ({시스템명}-{시각}-{밀리초}.{확장자})
+FILE_TIME_FORMAT = "%Y%m%d-%H%M%S"
+# 파일/디렉터리 이름에 쓸 수 없는 문자
+_UNSAFE_NAME = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+
+
+def safe_name(system_nm: str) -> str:
+    """
+    시스템명을 파일/디렉터리 이름으로 쓸 수 있게 변환 (경로 구분자 등은 _로 치환)
+    """
+    return _UNSAFE_NAME.sub("_", system_nm).strip(". ") or "_"
+
+
+def write_atomic(path: str, data: bytes):
+    """
+    임시 파일에 쓴 뒤 rename (읽는 쪽에서 쓰다 만 파일을 볼 수 없음)
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+@dataclass
+class StoredBlob:
+    """
+    저장된 이미지 blob 정보
+    """
+    digest: str
+    path: str
+    size: int
+    is_new: bool
+
+
+class ScreenshotStore:
+    """
+    내용 주소화(content-addressed) 스크린샷 저장소
+    - 이미지 바이트의 SHA-256 해시를 키로 blobs/{해시 앞 2자리}/{해시}.{확장자}에 저장합니다.
+    - 같은 내용의 캡처는 파일을 새로 쓰지 않고 기존 blob을 가리킵니다.
+    - 시스템별 캡처 시각과 blob의 연결(manifest)은 ScreenshotIndex가 관리합니다.
+    - 내용 주소화하지 않는 캡처(에이전트 도구 등)는 {시스템명}/yyyy/mm/dd/에 저장합니다.
+    """
+
+    def __init__(self, save_path: str):
+        self.save_path = os.path.abspath(save_path)
+        self.blob_dir = os.path.join(self.save_path, BLOB_DIR)
+
+    def blob_path(self, digest: str, extension: str) -> str:
+        """
+        해시에 해당하는 blob 경로
+        """
+        return os.path.join(self.blob_dir, digest[:2], f"{digest}.{extension}")
+
+    def put(self, data: bytes, extension: str) -> StoredBlob:
+        """
+        blob 저장
+        - 같은 해시의 blob이 이미 있으면 쓰지 않습니다.
+        - 임시 파일에 쓴 뒤 rename하므로 읽는 쪽에서 쓰다 만 파일을 볼 수 없습니다.
+        - param
+            - data: 이미지 바이트
+            - extension: 이미지 확장자
+        - return
+            - blob: 저장된 blob 정보
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(digest, extension)
+        if os.path.exists(path):
+            return StoredBlob(digest=digest, path=path, size=len(data), is_new=False)
+
+        write_atomic(path, data)
+        return StoredBlob(digest=digest, path=path, size=len(data), is_new=True)
+
+    def shard_path(self, system_nm: str, captured_at: float, filename: str) -> str:
+        """
+        시스템/캡처 날짜별 디렉터리의 파일 경로 ({시스템명}/yyyy/mm/dd/{filename})
+        """
+        day = time.strftime("%Y/%m/%d", time.localtime(captured_at))
+        return os.path.join(self.save_path, safe_name(system_nm), *day.split("/"), filename)
+
+    def put_capture(
+        self, system_nm: str, captured_at: float, data: bytes, extension: str
+    ) -> str:
+        """
+        캡처를 시스템/날짜별 디렉터리에 저장
+        - param
+            - system_nm: 시스템명
+            - captured_at: 캡처 시각 (epoch seconds)
+            - data: 이미지 바이트
+            - extension: 이미지 확장자
+        - return
+            - path: 저장된 파일 경로
+        """
+        stamp = time.strftime(FILE_TIME_FORMAT, time.localtime(captured_at))
+        millis = int(captured_at * 1000) % 1000
+        filename = f"{safe_name(system_nm)}-{stamp}-{millis:03d}.{extension}"
+        path = self.shard_path(system_nm, captured_at, filename)
+        write_atomic(path, data)
+        return path
@@ -0,0 +1,87 @@
+import asyncio
+import time
+
+from typing import Any, Awaitable, Callable, Hashable, Optional
+from src.logger import get_logger
+
+_logger = get_logger(__name__)
+
+# 결과를 받은 방식
+FLIGHT_LEADER = "leader"
+FLIGHT_INFLIGHT = "inflight"
+FLIGHT_FRESH = "fresh"
+
+
+class SingleFlight:
+    """
+    같은 키의 동시 호출을 하나의 실행으로 합침
+    - 실행 중인 키로 호출하면 새로 실행하지 않고 진행 중인 실행의 결과를 함께 받습니다.
+    - fresh_seconds 안에 끝난 성공 결과가 있으면 실행하지 않고 그 결과를 돌려줍니다.
+    - 실행은 별도 태스크에서 돌기 때문에 먼저 호출한 쪽이 취소되어도 다른 호출자는
+      결과를 받고, 모든 호출자가 취소되면 실행도 취소합니다.
+    """
+
+    def __init__(self):
+        self._loop = None
+        self._flights: dict[Hashable, tuple[asyncio.Task, list[int]]] = {}
+        self._results: dict[Hashable, tuple[float, Any]] = {}
+
+    async def run(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[Any]],
+        fresh_seconds: float = 0,
+        is_reusable: Optional[Callable[[Any], bool]] = None,
+    ) -> tuple[Any, str]:
+        """
+        키 단위로 합쳐서 실행
+        - param
+            - key: 합칠 호출을 구분하는 키
+            - func: 실제 실행할 코루틴 함수
+            - fresh_seconds: 끝난 결과를 재사용할 시간 (초, 0이면 재사용하지 않음)
+            - is_reusable: 재사용 가능한 결과인지 판단 (없으면 모든 결과 재사용)
+        - return
+            - (result, flight): 결과와 받은 방식 (leader, inflight, fresh)
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 다른 이벤트 루프의 태스크는 기다릴 수 없음
+            self._loop = loop
+            self._flights = {}
+            self._results = {}
+
+        if fresh_seconds > 0:
+            cached = self._results.get(key)
+            if cached and time.monotonic() - cached[0] <= fresh_seconds:
+                return cached[1], FLIGHT_FRESH
+
+        flight = self._flights.get(key)
+        if flight is None:
+            task = asyncio.create_task(func())
+            flight = self._flights[key] = (task, [0])
+            task.add_done_callback(
+                lambda done: self._finish(key, done, is_reusable)
+            )
+            kind = FLIGHT_LEADER
+        else:
+            kind = FLIGHT_INFLIGHT
+
+        task, waiters = flight
+        waiters[0] += 1
+        try:
+            return await asyncio.shield(task), kind
+        except asyncio.CancelledError:
+            if not task.done() and waiters[0] == 1:
+                task.cancel()
+            raise
+        finally:
+            waiters[0] -= 1
+
+    def _finish(self, key: Hashable, task: asyncio.Task, is_reusable):
+        if self._flights.get(key, (None,))[0] is task:
+            del self._flights[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if is_reusable is None or is_reusable(result):
+            self._results[key] = (time.monotonic(), result)
@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from typing import Optional
+from src.config import ConfigManager
+
+_config = ConfigManager()
+
+# 뷰포트 섹션: 이름=가로x세로 (예: mobile=375x812), 적힌 순서대로 캡처
+VIEWPORTS_SECTION = "VIEWPORTS"
+# 뷰포트별 캡처를 인덱스에 등록할 때 시스템명과 뷰포트 이름 구분자
+VIEWPORT_SEPARATOR = "@"
+
+
+@dataclass(frozen=True)
+class Viewport:
+    """
+    캡처 뷰포트 (브레이크포인트)
+    """
+    name: str
+    width: int
+    height: int
+
+    @property
+    def size(self) -> dict[str, int]:
+        """
+        Playwright viewport 옵션 형식
+        """
+        return {"width": self.width, "height": self.height}
+
+
+def parse_viewport(name: str, value: str) -> Viewport:
+    """
+    "가로x세로" 형식의 뷰포트 설정값 해석
+    """
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise ValueError(f"Invalid viewport (expected WIDTHxHEIGHT): {name}={value}")
+    if width < 1 or height < 1:
+        raise ValueError(f"Invalid viewport size: {name}={value}")
+    return Viewport(name=name, width=width, height=height)
+
+
+def configured_viewports(names: Optional[list[str]] = None) -> list[Viewport]:
+    """
+    설정 파일의 뷰포트 목록
+    - param
+        - names: 캡처할 뷰포트 이름, 없으면 설정된 전체
+    - return
+        - viewports: 뷰포트 목록 (설정 순서)
+    """
+    viewports = [
+        parse_viewport(name, value)
+        for name, value in _config.get_section(VIEWPORTS_SECTION).items()
+    ]
+    if names is None:
+        return viewports
+    wanted = {name.lower() for name in names}
+    unknown = wanted - {viewport.name for viewport in viewports}
+    if unknown:
+        raise ValueError(f"Unknown viewport(s): {', '.join(sorted(unknown))}")
+    return [viewport for viewport in viewports if viewport.name in wanted]
+
+
+def viewport_system_name(system_nm: str, viewport: Viewport) -> str:
+    """
+    뷰포트별 캡처를 인덱스에 등록할 시스템명 (예: 네이버@mobile)
+    """
+    return f"{system_nm}{VIEWPORT_SEPARATOR}{viewport.name}"
@@ -0,0 +1,180 @@
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.browser_pool import BrowserPool, browser_rss
+from src.config import ConfigManager
+
+
+def test_given_browser_pool_when_created_twice_then_should_return_same_instance():
+    assert BrowserPool() is BrowserPool()
+
+
+def test_given_no_running_loop_when_is_started_accessed_then_should_return_false():
+    pool = BrowserPool()
+    assert pool.is_started is False
+
+
+@pytest.mark.asyncio
+async def test_given_browser_pool_when_new_context_invoked_then_should_reuse_browser():
+    pool = BrowserPool()
+    await pool.start()
+    try:
+        async with pool.new_context() as context:
+            page = await context.new_page()
+            assert page is not None
+        async with pool.new_context() as context:
+            assert context.browser.is_connected()
+        assert pool.is_started
+    finally:
+        await pool.stop()
+    assert not pool.is_started
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+        self.handlers = []
+
+    def on(self, event, handler):
+        self.handlers.append(handler)
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **kwargs):
+        return FakeContext(self)
+
+    async def close(self):
+        self.closed = True
+        self.connected = False
+
+    def crash(self):
+        self.connected = False
+        for handler in self.handlers:
+            handler(self)
+
+
+@pytest.fixture
+def fake_playwright(monkeypatch):
+    """
+    Chromium 없이 브라우저 교체를 확인하기 위한 가짜 Playwright (띄운 브라우저를 기록)
+    """
+    launched = []
+
+    async def launch(**kwargs):
+        await asyncio.sleep(0)
+        launched.append(FakeBrowser())
+        return launched[-1]
+
+    playwright = MagicMock()
+    playwright.chromium.launch = launch
+    playwright.stop = AsyncMock()
+    starter = MagicMock()
+    starter.start = AsyncMock(return_value=playwright)
+    monkeypatch.setattr("src.browser_pool.async_playwright", lambda: starter)
+    monkeypatch.setattr(ConfigManager, "BROWSER_POOL_SIZE", 1)
+    monkeypatch.setattr(ConfigManager, "BROWSER_MAX_CONTEXTS", 2)
+    monkeypatch.setattr(ConfigManager, "BROWSER_MAX_RSS_MB", 0)
+    return launched
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_given_context_limit_when_reached_then_should_swap_in_warm_browser(
+    fake_playwright,
+):
+    pool = BrowserPool()
+    await pool.start()
+    try:
+        async with pool.new_context() as first:
+            async with pool.new_context() as second:
+                await _settle()
+                # 두 번째 컨텍스트에서 교체 브라우저를 미리 띄움
+                assert len(fake_playwright) == 2
+            async with pool.new_context() as third:
+                assert third.browser is fake_playwright[1]
+            # 열린 컨텍스트가 있는 동안 기존 브라우저는 닫지 않음
+            assert not fake_playwright[0].closed
+        assert first.browser is second.browser is fake_playwright[0]
+        assert fake_playwright[0].closed
+    finally:
+        await pool.stop()
+    assert fake_playwright[1].closed
+
+
+@pytest.mark.asyncio
+async def test_given_crashed_browser_when_new_context_invoked_then_should_use_replacement(
+    fake_playwright, monkeypatch,
+):
+    monkeypatch.setattr(ConfigManager, "BROWSER_MAX_CONTEXTS", 0)
+    pool = BrowserPool()
+    await pool.start()
+    try:
+        fake_playwright[0].crash()
+        # 연결이 끊기면 다음 캡처를 기다리지 않고 바로 교체 브라우저를 띄움
+        assert len(pool._warming) == 1
+        async with pool.new_context() as context:
+            assert context.browser is fake_playwright[1]
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_given_crashed_browser_when_other_slot_connected_then_should_not_wait(
+    fake_playwright, monkeypatch,
+):
+    monkeypatch.setattr(ConfigManager, "BROWSER_POOL_SIZE", 2)
+    monkeypatch.setattr(ConfigManager, "BROWSER_MAX_CONTEXTS", 0)
+    pool = BrowserPool()
+    await pool.start()
+    try:
+        fake_playwright[0].crash()
+        # 교체 브라우저를 기다리지 않고 연결된 다른 슬롯을 사용
+        async with pool.new_context() as context:
+            assert context.browser is fake_playwright[1]
+        assert len(pool._warming) == 1
+    finally:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_given_rss_over_limit_when_new_context_invoked_then_should_warm_replacement(
+    fake_playwright, monkeypatch,
+):
+    monkeypatch.setattr(ConfigManager, "BROWSER_MAX_CONTEXTS", 0)
+    monkeypatch.setattr(ConfigManager, "BROWSER_MAX_RSS_MB", 1)
+    monkeypatch.setattr("src.browser_pool.RSS_SAMPLE_INTERVAL", 0.01)
+    monkeypatch.setattr("src.browser_pool.browser_rss", lambda pid: 2 * 1024 * 1024)
+    pool = BrowserPool()
+    await pool.start()
+    try:
+        # RSS는 캡처 때가 아니라 백그라운드에서 주기적으로 확인
+        for _ in range(100):
+            if len(fake_playwright) == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert len(fake_playwright) == 2
+        async with pool.new_context() as context:
+            assert context.browser is fake_playwright[1]
+    finally:
+        await pool.stop()
+
+
+def test_given_current_process_when_browser_rss_invoked_then_should_return_bytes():
+    assert browser_rss(os.getpid()) > 0
+    assert browser_rss(None) is None
@@ -0,0 +1,53 @@
+import urllib.request
+
+from benchmarks.capture_benchmark import compare, percentile, summarize
+from benchmarks.synthetic_server import (
+    IMAGE_COUNT, PAGE_IMAGES, PAGE_KINDS, SyntheticSiteServer
+)
+from src.models import CaptureResult, UrlInfo
+
+
+def _result(is_success, timings, signal=None):
+    return CaptureResult(
+        urlinfo=UrlInfo(name="bench", url="http://127.0.0.1/"),
+        isSuccess=is_success,
+        phaseTimings=timings,
+        readySignal=signal,
+    )
+
+
+def test_given_synthetic_server_when_pages_requested_then_should_serve_each_kind():
+    with SyntheticSiteServer() as server:
+        for kind in PAGE_KINDS:
+            with urllib.request.urlopen(server.url(kind, 1)) as response:
+                assert response.status == 200
+                assert b"<html" in response.read()
+        with urllib.request.urlopen(server.url(PAGE_IMAGES, 1)) as response:
+            assert response.read().count(b"<img") == IMAGE_COUNT
+        with urllib.request.urlopen(f"{server.base_url}/image/3.png") as response:
+            assert response.headers["Content-Type"] == "image/png"
+
+
+def test_given_values_when_percentile_invoked_then_should_use_nearest_rank():
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 0.50) == 50.0
+    assert percentile(values, 0.95) == 95.0
+    assert percentile([3.0], 0.95) == 3.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_given_results_when_summarize_invoked_then_should_report_throughput_and_latency():
+    results = [
+        _result(True, {"goto": 1.0, "encode": 0.5}, "dom-quiet"),
+        _result(True, {"goto": 2.0, "encode": 0.5}, "networkidle"),
+        _result(False, {"queue": 0.1}),
+    ]
+    run = summarize(3, results, wall_seconds=2.0, peak_rss=100 * 1024 * 1024)
+    assert run["succeeded"] == 2
+    assert run["failed"] == 1
+    assert run["throughput"] == 1.0
+    assert run["latencyP95"] == 2.5
+    assert run["phaseP50"]["encode"] == 0.5
+    assert run["readySignals"] == {"dom-quiet": 1, "networkidle": 1}
+    assert run["peakRssMb"] == 100.0
+    assert compare(run, dict(run, throughput=0.5))["throughputRatio"] == 2.0
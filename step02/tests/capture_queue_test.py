@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+from src.capture_queue import CaptureQueue
+from src.config import ConfigManager
+
+HOST_A_URL = "https://a.example.com/"
+HOST_B_URL = "https://b.example.com/"
+
+
+async def _hold_slot(queue, url, peaks, host):
+    async with queue.slot(url):
+        peaks["total"] = max(peaks["total"], queue.active)
+        peaks[host] = peaks.get(host, 0) + 1
+        peaks[f"{host}_max"] = max(peaks.get(f"{host}_max", 0), peaks[host])
+        await asyncio.sleep(0.01)
+        peaks[host] -= 1
+
+
+def test_given_capture_queue_when_created_twice_then_should_return_same_instance():
+    assert CaptureQueue() is CaptureQueue()
+
+
+@pytest.mark.asyncio
+async def test_given_global_limit_when_many_slots_requested_then_should_not_exceed_limit(
+    monkeypatch
+):
+    monkeypatch.setattr(ConfigManager, "MAX_CONCURRENCY", 3)
+    monkeypatch.setattr(ConfigManager, "MAX_CONCURRENCY_PER_HOST", 100)
+    queue = CaptureQueue()
+    peaks = {"total": 0}
+    await asyncio.gather(
+        *[_hold_slot(queue, HOST_A_URL, peaks, "a") for _ in range(10)]
+    )
+    assert peaks["total"] == 3
+    assert queue.active == 0
+    assert queue.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_given_host_limit_when_slots_requested_then_should_not_block_other_hosts(
+    monkeypatch
+):
+    monkeypatch.setattr(ConfigManager, "MAX_CONCURRENCY", 4)
+    monkeypatch.setattr(ConfigManager, "MAX_CONCURRENCY_PER_HOST", 1)
+    queue = CaptureQueue()
+    peaks = {"total": 0}
+    await asyncio.gather(
+        *[_hold_slot(queue, HOST_A_URL, peaks, "a") for _ in range(5)],
+        *[_hold_slot(queue, HOST_B_URL, peaks, "b") for _ in range(5)],
+    )
+    assert peaks["a_max"] == 1
+    assert peaks["b_max"] == 1
+    assert peaks["total"] == 2
@@ -0,0 +1,87 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from src.capture_scheduler import CaptureScheduler, ScheduleEntry, build_schedule
+from src.config import ConfigManager
+from src.cron import CronExpression
+from src.models import CaptureResult, UrlInfo
+
+NOW = datetime(2026, 1, 1, 7, 59)
+
+
+def _urlinfos(*names):
+    return [UrlInfo(name=name, url=f"https://{name}.example.com") for name in names]
+
+
+@pytest.fixture
+def schedule_config(monkeypatch):
+    monkeypatch.setattr(ConfigManager, "SCHEDULE_DEFAULT", "0 8 * * *")
+    monkeypatch.setattr(ConfigManager, "SCHEDULE_STAGGER_SECONDS", 600)
+    monkeypatch.setattr(ConfigManager, "SCHEDULE_JITTER_SECONDS", 0)
+    monkeypatch.setattr(ConfigManager, "SCHEDULE_RATE_PER_MINUTE", 6)
+    monkeypatch.setattr(
+        ConfigManager, "get_section", lambda self, section: {"c": "*/5 * * * *"}
+    )
+
+
+def test_given_shared_cron_when_build_schedule_invoked_then_should_stagger_evenly(
+    schedule_config,
+):
+    entries = build_schedule(_urlinfos("b", "a", "c"))
+    offsets = {entry.urlinfo.name: entry.offset for entry in entries}
+    # a, b는 DEFAULT를 공유하고 c는 자체 일정
+    assert offsets == {"a": 0.0, "b": 300.0, "c": 0.0}
+    fire_at = {entry.urlinfo.name: entry.next_fire(NOW) for entry in entries}
+    assert fire_at["a"] == datetime(2026, 1, 1, 8, 0)
+    assert fire_at["b"] == datetime(2026, 1, 1, 8, 5)
+    assert fire_at["c"] == datetime(2026, 1, 1, 8, 0)
+
+
+def test_given_no_default_when_build_schedule_invoked_then_should_skip_unscheduled(
+    schedule_config, monkeypatch,
+):
+    monkeypatch.setattr(ConfigManager, "SCHEDULE_DEFAULT", "")
+    entries = build_schedule(_urlinfos("a", "c"))
+    assert [entry.urlinfo.name for entry in entries] == ["c"]
+
+
+def test_given_jitter_when_next_fire_invoked_then_should_stay_within_jitter():
+    entry = ScheduleEntry(
+        urlinfo=_urlinfos("a")[0], cron=CronExpression("0 8 * * *"), offset=60, jitter=30
+    )
+    base = datetime(2026, 1, 1, 8, 1)
+    for _ in range(20):
+        assert base <= entry.next_fire(NOW) <= base + timedelta(seconds=30)
+
+
+@pytest.mark.asyncio
+async def test_given_simultaneous_entries_when_dispatch_due_invoked_then_should_throttle(
+    schedule_config, monkeypatch,
+):
+    capture = AsyncMock(
+        side_effect=lambda urlinfo, **kwargs: CaptureResult(
+            urlinfo=urlinfo, isSuccess=True
+        )
+    )
+    monkeypatch.setattr("src.capture_scheduler.capture_one", capture)
+    cron = CronExpression("0 8 * * *")
+    scheduler = CaptureScheduler()
+    scheduler._last_dispatch = None
+    scheduler.load([ScheduleEntry(urlinfo=u, cron=cron) for u in _urlinfos("a", "b")], NOW)
+
+    at_eight = datetime(2026, 1, 1, 8, 0)
+    assert scheduler.dispatch_due(NOW) == 60
+    assert scheduler.dispatch_due(at_eight) == 10
+    # 분당 6건 -> 10초 안에는 다음 캡처를 시작하지 않음
+    assert scheduler.dispatch_due(at_eight + timedelta(seconds=4)) == pytest.approx(6)
+    scheduler.dispatch_due(at_eight + timedelta(seconds=10))
+    await asyncio.sleep(0)
+    await scheduler.stop()
+
+    assert [call.args[0].name for call in capture.call_args_list] == ["a", "b"]
+    # 두 시스템 모두 다음 날로 다시 예약됨
+    assert sorted(fire_at for fire_at, _, _ in scheduler._queue) == [
+        datetime(2026, 1, 2, 8, 0)
+    ] * 2
@@ -1,6 +1,23 @@
+import io
 import pytest
-from src.capture import is_valid_url, capture_one, capture_all
+from unittest.mock import AsyncMock, MagicMock
+from PIL import Image
+from src.capture import (
+    is_valid_url,
+    capture_one,
+    capture_all,
+    _record_capture,
+    _save_viewports,
+    _screenshot_viewports,
+)
+from src.image_encoder import SavedScreenshot, shutdown_encoder
+from src.image_pyramid import SIZE_THUMBNAIL, derived_path, wait_pyramids
+from src.metrics import PhaseTimer
 from src.models import UrlInfo
+from src.readiness import READY_DOM_QUIET, READY_LAYOUT_STABLE
+from src.viewport import Viewport
+from src.screenshot_index import get_screenshot_index
+from src.screenshot_store import ScreenshotStore
 import tempfile
 import os
 from src.config import ConfigManager
@@ -13,6 +30,10 @@ INVALID_URLS = [
 ]
 VALID_NAME = "Test"
 INVALID_NAME = "Invalid"
+VIEWPORTS = [
+    Viewport(name="desktop", width=1280, height=800),
+    Viewport(name="mobile", width=375, height=812),
+]
 
 
 @pytest.mark.parametrize("url", INVALID_URLS)
@@ -49,9 +70,10 @@ async def test_given_invalid_urlinfos_when_capture_all_invoked_then_should_throw
     # 나머지 invalid url들은 객체 생성 후 capture_all에서 실패하는지 검증
     filtered_invalids = [url for url in INVALID_URLS if url != ""]
     urlinfos = [UrlInfo(name=INVALID_NAME, url=url) for url in filtered_invalids]
-    passed, failed = await capture_all(urlinfos)
-    assert len(passed) == 0
-    assert len(failed) == len(filtered_invalids)
+    results = [result async for result in capture_all(urlinfos)]
+    assert len(results) == len(filtered_invalids)
+    assert not any(result.isSuccess for result in results)
+    assert all(result.errorMsg for result in results)
 
 
 @pytest.mark.asyncio
@@ -63,10 +85,13 @@ async def test_given_valid_urlinfo_when_capture_one_invoked_then_should_succeed(
         config._config["SCREENSHOT"] = {"SAVE_PATH": tmpdir}
         urlinfo = UrlInfo(name=VALID_NAME, url=VALID_URL)
         result = await capture_one(urlinfo)
-        assert result is True
+        assert result.isSuccess is True
+        assert result.urlinfo == urlinfo
+        assert not os.path.isabs(result.imagePath)
+        assert os.path.exists(os.path.join(tmpdir, result.imagePath))
         # 파일 생성 확인
-        files = os.listdir(tmpdir)
-        assert any(f.endswith(".png") for f in files)
+        files = [f for _, _, names in os.walk(tmpdir) for f in names]
+        assert any(f.endswith(".webp") for f in files)
 
 
 @pytest.mark.asyncio
@@ -78,6 +103,125 @@ async def test_given_mixed_urlinfos_when_capture_all_invoked_then_should_return_
         valid = UrlInfo(name=VALID_NAME, url=VALID_URL)
         invalid = UrlInfo(name=INVALID_NAME, url="invalid-url")
         urlinfos = [valid, invalid]
-        passed, failed = await capture_all(urlinfos)
+        results = [result async for result in capture_all(urlinfos)]
+        passed = [r.urlinfo for r in results if r.isSuccess]
+        failed = [r.urlinfo for r in results if not r.isSuccess]
         assert valid in passed
         assert invalid in failed
+
+
+def _saved(save_path, data, phash):
+    blob = ScreenshotStore(save_path).put(data, "webp")
+    return SavedScreenshot(blob=blob, phash=phash)
+
+
+def test_given_first_capture_when_recorded_then_should_be_changed(tmp_path):
+    urlinfo = UrlInfo(name=VALID_NAME, url=VALID_URL)
+    saved = _saved(str(tmp_path), b"first", "00" * 8)
+    result = _record_capture(urlinfo, saved, 100.0, str(tmp_path))
+    assert result.isChanged is True
+    assert result.hammingDistance is None
+    assert get_screenshot_index(str(tmp_path)).latest(VALID_NAME).phash == "00" * 8
+
+
+def test_given_similar_capture_when_recorded_then_should_be_unchanged(tmp_path):
+    urlinfo = UrlInfo(name=VALID_NAME, url=VALID_URL)
+    _record_capture(urlinfo, _saved(str(tmp_path), b"a", "00" * 8), 100.0, str(tmp_path))
+    result = _record_capture(
+        urlinfo, _saved(str(tmp_path), b"b", "00" * 7 + "01"), 200.0, str(tmp_path)
+    )
+    assert result.isChanged is False
+    assert result.hammingDistance == 1
+
+
+def test_given_unchanged_capture_and_keep_unchanged_false_when_recorded_then_should_discard_blob(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(ConfigManager, "KEEP_UNCHANGED", False)
+    urlinfo = UrlInfo(name=VALID_NAME, url=VALID_URL)
+    first = _record_capture(
+        urlinfo, _saved(str(tmp_path), b"a", "00" * 8), 100.0, str(tmp_path)
+    )
+    second_saved = _saved(str(tmp_path), b"b", "00" * 8)
+    second = _record_capture(urlinfo, second_saved, 200.0, str(tmp_path))
+    assert second.isChanged is False
+    assert second.imagePath == first.imagePath
+    assert not os.path.isabs(first.imagePath)
+    assert not os.path.exists(second_saved.blob.path)
+    latest = get_screenshot_index(str(tmp_path)).latest(VALID_NAME)
+    assert latest.captured_at == 200.0
+
+
+def test_given_blob_removed_by_retention_when_recorded_then_should_not_index(tmp_path):
+    urlinfo = UrlInfo(name=VALID_NAME, url=VALID_URL)
+    saved = _saved(str(tmp_path), b"a", "00" * 8)
+    # 같은 내용의 blob을 찾은 직후 보존 정책이 파일을 지운 경우
+    get_screenshot_index(str(tmp_path)).remove_unreferenced(saved.blob.path)
+    assert _record_capture(urlinfo, saved, 100.0, str(tmp_path)) is None
+    assert get_screenshot_index(str(tmp_path)).latest(VALID_NAME) is None
+
+
+def test_given_changed_capture_when_recorded_then_should_report_distance(tmp_path):
+    urlinfo = UrlInfo(name=VALID_NAME, url=VALID_URL)
+    _record_capture(urlinfo, _saved(str(tmp_path), b"a", "00" * 8), 100.0, str(tmp_path))
+    result = _record_capture(
+        urlinfo, _saved(str(tmp_path), b"b", "ff" * 8), 200.0, str(tmp_path)
+    )
+    assert result.isChanged is True
+    assert result.hammingDistance == 64
+
+
+def _png_bytes(width, color):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, 100), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_given_viewports_when_screenshot_viewports_invoked_then_should_resize_without_reload():
+    page = MagicMock()
+    page.goto = AsyncMock()
+    page.set_viewport_size = AsyncMock()
+    page.evaluate = AsyncMock(return_value=True)
+    page.screenshot = AsyncMock(side_effect=[b"desktop", b"mobile"])
+    shots = await _screenshot_viewports(page, VIEWPORTS, PhaseTimer())
+    assert shots == [
+        (VIEWPORTS[0], None, b"desktop"),
+        (VIEWPORTS[1], READY_LAYOUT_STABLE, b"mobile"),
+    ]
+    # 첫 뷰포트는 페이지를 불러온 크기 그대로 캡처
+    page.set_viewport_size.assert_awaited_once_with({"width": 375, "height": 812})
+    page.goto.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_given_viewport_shots_when_saved_then_should_index_each_viewport(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(ConfigManager, "ENCODER_WORKERS", 1)
+    urlinfo = UrlInfo(name=VALID_NAME, url=VALID_URL)
+    shots = [
+        (VIEWPORTS[0], None, _png_bytes(1280, (200, 30, 30))),
+        (VIEWPORTS[1], READY_LAYOUT_STABLE, _png_bytes(375, (30, 30, 200))),
+    ]
+    try:
+        result = await _save_viewports(
+            urlinfo, shots, READY_DOM_QUIET, 100.0, str(tmp_path), PhaseTimer()
+        )
+        await wait_pyramids()
+    finally:
+        shutdown_encoder()
+    assert result.isSuccess is True
+    assert result.isChanged is True
+    assert [v.viewport for v in result.viewports] == ["desktop", "mobile"]
+    assert [v.readySignal for v in result.viewports] == [
+        READY_DOM_QUIET, READY_LAYOUT_STABLE
+    ]
+    assert result.imagePath == result.viewports[0].imagePath
+    index = get_screenshot_index(str(tmp_path))
+    assert index.latest(VALID_NAME) is None
+    for viewport in result.viewports:
+        latest = index.latest(f"{VALID_NAME}@{viewport.viewport}")
+        assert latest.image_path == viewport.imagePath
+        # 캡처 직후 백그라운드에서 썸네일 생성
+        assert os.path.exists(derived_path(index.absolute_path(latest), SIZE_THUMBNAIL))
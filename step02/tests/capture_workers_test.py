@@ -0,0 +1,73 @@
+import pytest
+from src.capture_workers import CaptureWorkerPool, shard_urlinfos
+from src.models import UrlInfo
+
+# 연결이 즉시 거부되는 주소 (브라우저 유무와 관계없이 빠르게 실패)
+REFUSED_URL = "http://127.0.0.1:9/"
+
+
+def test_given_capture_worker_pool_when_created_twice_then_should_return_same_instance():
+    assert CaptureWorkerPool() is CaptureWorkerPool()
+
+
+def test_given_urlinfos_when_shard_urlinfos_invoked_then_should_keep_hosts_together():
+    urlinfos = [
+        UrlInfo(name="a1", url="https://a.example.com/1"),
+        UrlInfo(name="a2", url="https://a.example.com/2"),
+        UrlInfo(name="a3", url="https://A.example.com/3"),
+        UrlInfo(name="b1", url="https://b.example.com/"),
+        UrlInfo(name="c1", url="https://c.example.com/"),
+        UrlInfo(name="d1", url="https://d.example.com/"),
+    ]
+    shards = shard_urlinfos(urlinfos, 2)
+    assert len(shards) == 2
+    assert sorted(len(shard) for shard in shards) == [3, 3]
+    a_shard = next(shard for shard in shards if urlinfos[0] in shard)
+    assert {u.name for u in a_shard} == {"a1", "a2", "a3"}
+
+
+def test_given_more_workers_than_hosts_when_shard_urlinfos_invoked_then_should_leave_empty_shards():
+    urlinfos = [UrlInfo(name="a", url="https://a.example.com/")]
+    shards = shard_urlinfos(urlinfos, 3)
+    assert [len(shard) for shard in shards] == [1, 0, 0]
+
+
+@pytest.mark.asyncio
+async def test_given_worker_pool_when_capture_invoked_then_should_return_results_from_workers():
+    urlinfos = [
+        UrlInfo(name="Refused1", url=REFUSED_URL),
+        UrlInfo(name="Refused2", url="http://127.0.0.2:9/"),
+        UrlInfo(name="Invalid", url="invalid-url"),
+    ]
+    pool = CaptureWorkerPool()
+    pool.start(workers=2)
+    try:
+        assert pool.size == 2
+        results = [result async for result in pool.capture(urlinfos)]
+    finally:
+        pool.stop()
+    assert not pool.is_started
+    assert sorted(r.urlinfo.name for r in results) == ["Invalid", "Refused1", "Refused2"]
+    assert all(not r.isSuccess and r.errorMsg for r in results)
+
+
+@pytest.mark.asyncio
+async def test_given_dead_worker_when_capture_invoked_then_should_fail_shard_and_restart_worker():
+    urlinfos = [UrlInfo(name="Refused1", url=REFUSED_URL)]
+    pool = CaptureWorkerPool()
+    pool.start(workers=1)
+    try:
+        dead = pool._workers[0][0]
+        dead.kill()
+        dead.join()
+        results = [result async for result in pool.capture(urlinfos)]
+        restarted = pool._workers[0][0]
+        retried = [result async for result in pool.capture(urlinfos)]
+    finally:
+        pool.stop()
+    assert [r.urlinfo.name for r in results] == ["Refused1"]
+    assert not results[0].isSuccess
+    assert "exited" in results[0].errorMsg
+    assert restarted is not dead
+    assert [r.urlinfo.name for r in retried] == ["Refused1"]
+    assert "exited" not in retried[0].errorMsg
@@ -0,0 +1,126 @@
+import httpx
+import pytest
+from src.capture import capture_one
+from src.change_probe import (
+    PROBE_DOM_HASH,
+    PROBE_NOT_MODIFIED,
+    ProbeClient,
+    dom_hash,
+    normalize_html,
+    probe_change,
+)
+from src.config import ConfigManager
+from src.models import UrlInfo
+from src.screenshot_index import ProbeValidators, get_screenshot_index
+
+URLINFO = UrlInfo(name="Test", url="https://example.com/")
+ETAG = '"v1"'
+LAST_MODIFIED = "Wed, 01 Jan 2026 00:00:00 GMT"
+PAGE = "<html><body><h1>Hello</h1></body></html>"
+
+
+@pytest.fixture
+def probe_server(monkeypatch):
+    """
+    ETag가 ETAG인 PAGE를 돌려주는 가짜 서버 (받은 요청 헤더를 기록)
+    """
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == ETAG:
+            return httpx.Response(304)
+        return httpx.Response(
+            200, text=PAGE, headers={"ETag": ETAG, "Last-Modified": LAST_MODIFIED}
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(ProbeClient, "get", lambda self: client)
+    monkeypatch.setattr(ConfigManager, "PROBE_DOM_HASH", True)
+    return requests
+
+
+def test_given_volatile_markup_when_dom_hash_invoked_then_should_ignore_it():
+    first = "<html>\n  <body><script>var t = 1;</script><p>Hi</p><!-- 1 --></body></html>"
+    second = "<html><body>\n<script>var t = 2;</script>\n<p>Hi</p><!-- 2 --></body></html>"
+    assert normalize_html(first) == "<html><body><p>Hi</p></body></html>"
+    assert dom_hash(first) == dom_hash(second)
+    assert dom_hash(first) != dom_hash(first.replace("Hi", "Bye"))
+
+
+@pytest.mark.asyncio
+async def test_given_no_validators_when_probe_change_invoked_then_should_return_validators(
+    probe_server,
+):
+    outcome = await probe_change(URLINFO, None)
+    assert outcome.unchanged_by is None
+    assert outcome.validators == ProbeValidators(
+        url=URLINFO.url, etag=ETAG, last_modified=LAST_MODIFIED, dom_hash=dom_hash(PAGE)
+    )
+    assert "If-None-Match" not in probe_server[0].headers
+
+
+@pytest.mark.asyncio
+async def test_given_matching_etag_when_probe_change_invoked_then_should_be_not_modified(
+    probe_server,
+):
+    previous = ProbeValidators(url=URLINFO.url, etag=ETAG, last_modified=LAST_MODIFIED)
+    outcome = await probe_change(URLINFO, previous)
+    assert outcome.unchanged_by == PROBE_NOT_MODIFIED
+    assert probe_server[0].headers["If-Modified-Since"] == LAST_MODIFIED
+
+
+@pytest.mark.asyncio
+async def test_given_same_dom_when_probe_change_invoked_then_should_be_unchanged(
+    probe_server,
+):
+    previous = ProbeValidators(url=URLINFO.url, etag='"old"', dom_hash=dom_hash(PAGE))
+    outcome = await probe_change(URLINFO, previous)
+    assert outcome.unchanged_by == PROBE_DOM_HASH
+    assert outcome.validators.etag == ETAG
+
+
+@pytest.mark.asyncio
+async def test_given_changed_url_when_probe_change_invoked_then_should_ignore_validators(
+    probe_server,
+):
+    previous = ProbeValidators(url="https://example.com/old", etag=ETAG)
+    outcome = await probe_change(URLINFO, previous)
+    assert outcome.unchanged_by is None
+    assert "If-None-Match" not in probe_server[0].headers
+
+
+@pytest.mark.asyncio
+async def test_given_unreachable_url_when_probe_change_invoked_then_should_not_decide(
+    monkeypatch,
+):
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(ProbeClient, "get", lambda self: client)
+    outcome = await probe_change(URLINFO, ProbeValidators(url=URLINFO.url, etag=ETAG))
+    assert outcome.unchanged_by is None
+    assert outcome.validators is None
+
+
+@pytest.mark.asyncio
+async def test_given_not_modified_page_when_capture_one_invoked_then_should_skip_render(
+    probe_server, tmp_path, monkeypatch,
+):
+    monkeypatch.setattr(ConfigManager, "SAVE_PATH", str(tmp_path))
+    image_path = tmp_path / "previous.webp"
+    image_path.write_bytes(b"fake image data")
+    index = get_screenshot_index(str(tmp_path))
+    index.add(URLINFO.name, str(image_path), 100.0, blob_hash="abc", phash="0" * 16)
+    index.save_probe(URLINFO.name, ProbeValidators(url=URLINFO.url, etag=ETAG))
+
+    result = await capture_one(URLINFO, probe=True)
+
+    assert result.isSuccess
+    assert result.isChanged is False
+    assert result.probeSignal == PROBE_NOT_MODIFIED
+    assert result.imagePath == "previous.webp"
+    latest = index.latest(URLINFO.name)
+    assert latest.captured_at > 100.0
+    assert latest.blob_hash == "abc"
@@ -4,7 +4,40 @@ from src.config import ConfigManager
 DEFAULT_SAVE_PATH = "./data/screenshots/"
 DEFAULT_WEBP_QUALITY = 60
 DEFAULT_IMG_MAX_WIDTH = 1280
+DEFAULT_THUMBNAIL_WIDTH = 320
+DEFAULT_THUMBNAIL_HEIGHT = 200
+DEFAULT_MEDIUM_WIDTH = 640
 DEFAULT_TIMEOUT = 30
+DEFAULT_BROWSER_POOL_SIZE = 2
+DEFAULT_BROWSER_MAX_CONTEXTS = 200
+DEFAULT_BROWSER_MAX_RSS_MB = 1024
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_CONCURRENCY_PER_HOST = 2
+DEFAULT_CAPTURE_WORKERS = 0
+DEFAULT_ENCODER_WORKERS = 0
+DEFAULT_CHANGE_THRESHOLD = 4
+DEFAULT_KEEP_UNCHANGED = True
+DEFAULT_DIFF_WIDTH = 320
+DEFAULT_READY_QUIET_MS = 500
+DEFAULT_LAYOUT_QUIET_MS = 200
+DEFAULT_FRESH_SECONDS = 0
+DEFAULT_PROBE_ENABLED = True
+DEFAULT_PROBE_DOM_HASH = False
+DEFAULT_PROBE_TIMEOUT = 10
+DEFAULT_SCHEDULE_ENABLED = False
+DEFAULT_SCHEDULE_DEFAULT = ""
+DEFAULT_SCHEDULE_STAGGER_SECONDS = 600
+DEFAULT_SCHEDULE_JITTER_SECONDS = 30
+DEFAULT_SCHEDULE_RATE_PER_MINUTE = 6
+DEFAULT_RETENTION_ENABLED = False
+DEFAULT_RETENTION_KEEP_ALL_DAYS = 7
+DEFAULT_RETENTION_KEEP_DAILY_DAYS = 90
+DEFAULT_RETENTION_KEEP_MONTHLY_DAYS = 0
+DEFAULT_RETENTION_INTERVAL_HOURS = 24
+DEFAULT_JOB_CONCURRENCY = 2
+DEFAULT_JOB_DB_PATH = "./data/jobs.sqlite3"
+DEFAULT_JOB_HEARTBEAT_INTERVAL = 10
+DEFAULT_JOB_STALE_TIMEOUT = 60
 
 
 def test_given_missing_config_when_configmanager_created_then_should_create_from_sample(
@@ -57,7 +90,62 @@ def test_given_invalid_config_when_property_accessed_then_should_fallback(
     assert manager.SAVE_PATH == DEFAULT_SAVE_PATH
     assert manager.WEBP_QUALITY == DEFAULT_WEBP_QUALITY
     assert manager.IMG_MAX_WIDTH == DEFAULT_IMG_MAX_WIDTH
+    assert manager.THUMBNAIL_WIDTH == DEFAULT_THUMBNAIL_WIDTH
+    assert manager.THUMBNAIL_HEIGHT == DEFAULT_THUMBNAIL_HEIGHT
+    assert manager.MEDIUM_WIDTH == DEFAULT_MEDIUM_WIDTH
     assert manager.TIMEOUT == DEFAULT_TIMEOUT
+    assert manager.BROWSER_POOL_SIZE == DEFAULT_BROWSER_POOL_SIZE
+    assert manager.BROWSER_MAX_CONTEXTS == DEFAULT_BROWSER_MAX_CONTEXTS
+    assert manager.BROWSER_MAX_RSS_MB == DEFAULT_BROWSER_MAX_RSS_MB
+    assert manager.MAX_CONCURRENCY == DEFAULT_MAX_CONCURRENCY
+    assert manager.MAX_CONCURRENCY_PER_HOST == DEFAULT_MAX_CONCURRENCY_PER_HOST
+    assert manager.CAPTURE_WORKERS == DEFAULT_CAPTURE_WORKERS
+    assert manager.ENCODER_WORKERS == DEFAULT_ENCODER_WORKERS
+    assert manager.CHANGE_THRESHOLD == DEFAULT_CHANGE_THRESHOLD
+    assert manager.KEEP_UNCHANGED == DEFAULT_KEEP_UNCHANGED
+    assert manager.DIFF_WIDTH == DEFAULT_DIFF_WIDTH
+    assert manager.READY_QUIET_MS == DEFAULT_READY_QUIET_MS
+    assert manager.LAYOUT_QUIET_MS == DEFAULT_LAYOUT_QUIET_MS
+    assert manager.FRESH_SECONDS == DEFAULT_FRESH_SECONDS
+    assert manager.PROBE_ENABLED == DEFAULT_PROBE_ENABLED
+    assert manager.PROBE_DOM_HASH == DEFAULT_PROBE_DOM_HASH
+    assert manager.PROBE_TIMEOUT == DEFAULT_PROBE_TIMEOUT
+    assert manager.SCHEDULE_ENABLED == DEFAULT_SCHEDULE_ENABLED
+    assert manager.SCHEDULE_DEFAULT == DEFAULT_SCHEDULE_DEFAULT
+    assert manager.SCHEDULE_STAGGER_SECONDS == DEFAULT_SCHEDULE_STAGGER_SECONDS
+    assert manager.SCHEDULE_JITTER_SECONDS == DEFAULT_SCHEDULE_JITTER_SECONDS
+    assert manager.SCHEDULE_RATE_PER_MINUTE == DEFAULT_SCHEDULE_RATE_PER_MINUTE
+    assert manager.RETENTION_ENABLED == DEFAULT_RETENTION_ENABLED
+    assert manager.RETENTION_KEEP_ALL_DAYS == DEFAULT_RETENTION_KEEP_ALL_DAYS
+    assert manager.RETENTION_KEEP_DAILY_DAYS == DEFAULT_RETENTION_KEEP_DAILY_DAYS
+    assert manager.RETENTION_KEEP_MONTHLY_DAYS == DEFAULT_RETENTION_KEEP_MONTHLY_DAYS
+    assert manager.RETENTION_INTERVAL_HOURS == DEFAULT_RETENTION_INTERVAL_HOURS
+    assert manager.JOB_CONCURRENCY == DEFAULT_JOB_CONCURRENCY
+    assert manager.JOB_DB_PATH == DEFAULT_JOB_DB_PATH
+    assert manager.JOB_HEARTBEAT_INTERVAL == DEFAULT_JOB_HEARTBEAT_INTERVAL
+    assert manager.JOB_STALE_TIMEOUT == DEFAULT_JOB_STALE_TIMEOUT
+
+
+def test_given_section_when_get_section_invoked_then_should_return_items(tmp_path):
+    import src.config
+    src.config.ConfigManager._instance = None  # 싱글턴 초기화
+    config_file = tmp_path / "config.ini"
+    config_file.write_text("[BLOCK]\nRESOURCE_TYPES=media,font\n")
+    src.config.ConfigManager.CONFIG_FILE = str(config_file)
+    manager = src.config.ConfigManager()
+    assert manager.get_section("BLOCK") == {"resource_types": "media,font"}
+    assert manager.get_section("MISSING") == {}
+
+
+def test_given_mixed_case_section_when_get_section_invoked_then_should_match_ignoring_case(tmp_path):
+    import src.config
+    src.config.ConfigManager._instance = None  # 싱글턴 초기화
+    config_file = tmp_path / "config.ini"
+    config_file.write_text("[URLS]\nMySite=https://example.com\n\n[BLOCK.MySite]\nDOMAINS=ads.example.com\n")
+    src.config.ConfigManager.CONFIG_FILE = str(config_file)
+    manager = src.config.ConfigManager()
+    assert manager.get_section("BLOCK.mysite") == {"domains": "ads.example.com"}
+    assert manager.get_section("block.MYSITE") == {"domains": "ads.example.com"}
 
 
 def test_given_valid_config_when_properties_accessed_then_should_return_expected(
@@ -66,4 +154,71 @@ def test_given_valid_config_when_properties_accessed_then_should_return_expected
     assert isinstance(manager.SAVE_PATH, str)
     assert isinstance(manager.WEBP_QUALITY, int)
     assert isinstance(manager.IMG_MAX_WIDTH, int)
+    assert isinstance(manager.THUMBNAIL_WIDTH, int)
+    assert isinstance(manager.THUMBNAIL_HEIGHT, int)
+    assert isinstance(manager.MEDIUM_WIDTH, int)
     assert isinstance(manager.TIMEOUT, int)
+    assert isinstance(manager.BROWSER_POOL_SIZE, int)
+    assert isinstance(manager.BROWSER_MAX_CONTEXTS, int)
+    assert isinstance(manager.BROWSER_MAX_RSS_MB, int)
+    assert isinstance(manager.MAX_CONCURRENCY, int)
+    assert isinstance(manager.MAX_CONCURRENCY_PER_HOST, int)
+    assert isinstance(manager.CAPTURE_WORKERS, int)
+    assert isinstance(manager.ENCODER_WORKERS, int)
+    assert isinstance(manager.CHANGE_THRESHOLD, int)
+    assert isinstance(manager.KEEP_UNCHANGED, bool)
+    assert isinstance(manager.DIFF_WIDTH, int)
+    assert isinstance(manager.READY_QUIET_MS, int)
+    assert isinstance(manager.LAYOUT_QUIET_MS, int)
+    assert isinstance(manager.FRESH_SECONDS, int)
+    assert isinstance(manager.PROBE_ENABLED, bool)
+    assert isinstance(manager.PROBE_DOM_HASH, bool)
+    assert isinstance(manager.PROBE_TIMEOUT, int)
+    assert isinstance(manager.SCHEDULE_ENABLED, bool)
+    assert isinstance(manager.SCHEDULE_DEFAULT, str)
+    assert isinstance(manager.SCHEDULE_STAGGER_SECONDS, int)
+    assert isinstance(manager.SCHEDULE_JITTER_SECONDS, int)
+    assert isinstance(manager.SCHEDULE_RATE_PER_MINUTE, int)
+    assert isinstance(manager.RETENTION_ENABLED, bool)
+    assert isinstance(manager.RETENTION_KEEP_ALL_DAYS, int)
+    assert isinstance(manager.RETENTION_KEEP_DAILY_DAYS, int)
+    assert isinstance(manager.RETENTION_KEEP_MONTHLY_DAYS, int)
+    assert isinstance(manager.RETENTION_INTERVAL_HOURS, int)
+    assert isinstance(manager.JOB_CONCURRENCY, int)
+    assert isinstance(manager.JOB_DB_PATH, str)
+    assert isinstance(manager.JOB_HEARTBEAT_INTERVAL, int)
+    assert isinstance(manager.JOB_STALE_TIMEOUT, int)
+
+
+def test_given_urls_when_get_url_invoked_then_should_return_cached_urlinfo(tmp_path):
+    import src.config
+    src.config.ConfigManager._instance = None  # 싱글턴 초기화
+    config_file = tmp_path / "config.ini"
+    config_file.write_text(
+        "[URLS]\n" + "".join(f"system{i}=https://example.com/{i}\n" for i in range(1000))
+    )
+    src.config.ConfigManager.CONFIG_FILE = str(config_file)
+    manager = src.config.ConfigManager()
+    assert len(manager.URLS) == 1000
+    # 접근할 때마다 새로 만들지 않음
+    assert manager.URLS is manager.URLS
+    assert manager.get_url("system999") is manager.URLS[-1]
+    assert manager.get_url("system999").url == "https://example.com/999"
+    assert manager.get_url("missing") is None
+
+
+def test_given_changed_file_when_reload_invoked_then_should_swap_url_index(tmp_path):
+    import src.config
+    src.config.ConfigManager._instance = None  # 싱글턴 초기화
+    config_file = tmp_path / "config.ini"
+    config_file.write_text("[URLS]\nold=https://old.example.com\n")
+    src.config.ConfigManager.CONFIG_FILE = str(config_file)
+    manager = src.config.ConfigManager()
+    previous = manager.URL_INDEX
+    config_file.write_text("[URLS]\nnew=https://new.example.com\n")
+    manager.reload()
+    assert manager.get_url("old") is None
+    assert manager.get_url("new").url == "https://new.example.com"
+    # 이전 목록을 들고 있던 쪽은 바뀌지 않은 목록을 계속 봄
+    assert [urlinfo.name for urlinfo in previous.urls] == ["old"]
+    assert isinstance(previous.urls, tuple)
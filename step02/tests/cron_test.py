@@ -0,0 +1,52 @@
+import pytest
+from datetime import datetime
+from src.cron import CronExpression
+
+INVALID_EXPRESSIONS = ["", "* * * *", "60 * * * *", "* 24 * * *", "*/0 * * * *", "a * * * *"]
+
+
+def test_given_step_expression_when_next_after_invoked_then_should_return_next_step():
+    cron = CronExpression("*/15 * * * *")
+    assert cron.next_after(datetime(2026, 1, 1, 10, 7, 30)) == datetime(2026, 1, 1, 10, 15)
+    assert cron.next_after(datetime(2026, 1, 1, 10, 45)) == datetime(2026, 1, 1, 11, 0)
+
+
+def test_given_daily_expression_when_next_after_invoked_then_should_roll_over_day():
+    cron = CronExpression("30 8 * * *")
+    assert cron.next_after(datetime(2026, 1, 1, 8, 29)) == datetime(2026, 1, 1, 8, 30)
+    assert cron.next_after(datetime(2026, 1, 1, 8, 30)) == datetime(2026, 1, 2, 8, 30)
+    assert cron.next_after(datetime(2026, 12, 31, 9, 0)) == datetime(2027, 1, 1, 8, 30)
+
+
+def test_given_weekday_range_when_next_after_invoked_then_should_skip_weekend():
+    cron = CronExpression("0 9 * * 1-5")
+    # 2026-01-02 금요일 -> 2026-01-05 월요일
+    assert cron.next_after(datetime(2026, 1, 2, 10, 0)) == datetime(2026, 1, 5, 9, 0)
+
+
+def test_given_sunday_as_seven_when_next_after_invoked_then_should_match_sunday():
+    assert CronExpression("0 0 * * 7").next_after(datetime(2026, 1, 1)) == datetime(2026, 1, 4)
+    assert CronExpression("0 0 * * 0").next_after(datetime(2026, 1, 1)) == datetime(2026, 1, 4)
+
+
+def test_given_day_and_weekday_when_next_after_invoked_then_should_match_either():
+    cron = CronExpression("0 0 15 * 1")
+    # 2026-01-05 월요일이 15일보다 먼저
+    assert cron.next_after(datetime(2026, 1, 1)) == datetime(2026, 1, 5)
+    assert cron.next_after(datetime(2026, 1, 14)) == datetime(2026, 1, 15)
+
+
+def test_given_leap_day_expression_when_next_after_invoked_then_should_find_leap_year():
+    cron = CronExpression("0 0 29 2 *")
+    assert cron.next_after(datetime(2026, 3, 1)) == datetime(2028, 2, 29)
+
+
+@pytest.mark.parametrize("expression", INVALID_EXPRESSIONS)
+def test_given_invalid_expression_when_parsed_then_should_raise(expression):
+    with pytest.raises(ValueError):
+        CronExpression(expression)
+
+
+def test_given_impossible_date_when_next_after_invoked_then_should_raise():
+    with pytest.raises(ValueError):
+        CronExpression("0 0 31 2 *").next_after(datetime(2026, 1, 1))
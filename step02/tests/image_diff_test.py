@@ -0,0 +1,88 @@
+import os
+
+import pytest
+from PIL import Image, ImageDraw
+from src import image_diff
+from src.image_diff import compare_images, diff_captures, heatmap_file
+from src.screenshot_index import ScreenshotIndex
+
+SYSTEM_NM = "TestSystem"
+WIDTH = 320
+
+
+def _save_image(path, box=None):
+    image = Image.new("RGB", (640, 480), "white")
+    if box:
+        ImageDraw.Draw(image).rectangle(box, fill="black")
+    image.save(path, format="WEBP", lossless=True)
+    return str(path)
+
+
+def test_given_identical_images_when_compare_images_invoked_then_should_report_no_change(
+    tmp_path
+):
+    base = _save_image(tmp_path / "base.webp")
+    target = _save_image(tmp_path / "target.webp")
+    scores = compare_images(base, target, str(tmp_path / "heatmap.webp"), WIDTH)
+    assert scores["changedRatio"] == 0
+    assert scores["ssim"] == pytest.approx(1.0)
+    assert scores["changedRegions"] == []
+    assert os.path.exists(tmp_path / "heatmap.webp")
+
+
+def test_given_changed_block_when_compare_images_invoked_then_should_locate_region(
+    tmp_path
+):
+    base = _save_image(tmp_path / "base.webp")
+    target = _save_image(tmp_path / "target.webp", box=(320, 160, 479, 319))
+    scores = compare_images(base, target, str(tmp_path / "heatmap.webp"), WIDTH)
+    assert 0 < scores["changedRatio"] < 0.2
+    assert scores["ssim"] < 1.0
+    assert len(scores["changedRegions"]) == 1
+    region = scores["changedRegions"][0]
+    # 격자(REGION_CELL) 단위로 묶이므로 실제 영역을 포함하는지만 확인
+    assert region["x"] <= 320 and region["x"] + region["width"] >= 480
+    assert region["y"] <= 160 and region["y"] + region["height"] >= 320
+
+
+def test_given_different_heights_when_compare_images_invoked_then_should_align(
+    tmp_path
+):
+    base = _save_image(tmp_path / "base.webp")
+    target_path = tmp_path / "target.webp"
+    Image.new("RGB", (640, 960), "white").save(target_path, format="WEBP", lossless=True)
+    scores = compare_images(base, str(target_path), str(tmp_path / "heatmap.webp"), WIDTH)
+    assert scores["changedRatio"] == 0
+
+
+@pytest.mark.asyncio
+async def test_given_same_pair_when_diff_captures_invoked_twice_then_should_use_cache(
+    tmp_path, monkeypatch
+):
+    calls = []
+
+    async def run_inline(func, *args):
+        calls.append(func)
+        return func(*args)
+
+    monkeypatch.setattr(image_diff, "run_in_encoder", run_inline)
+    index = ScreenshotIndex(str(tmp_path))
+    index.add(SYSTEM_NM, _save_image(tmp_path / "base.webp"), 100.0, blob_hash="a")
+    index.add(
+        SYSTEM_NM,
+        _save_image(tmp_path / "target.webp", box=(0, 0, 100, 100)),
+        200.0,
+        blob_hash="b",
+    )
+    target = index.latest(SYSTEM_NM)
+    base = index.previous(target)
+    first = await diff_captures(index, base, target)
+    second = await diff_captures(index, base, target)
+    assert len(calls) == 1
+    assert first == second
+    assert os.path.exists(heatmap_file(index.save_path, first["heatmapKey"]))
+
+
+def test_given_unsafe_key_when_heatmap_file_invoked_then_should_return_none(tmp_path):
+    assert heatmap_file(str(tmp_path), "../config") is None
+    assert heatmap_file(str(tmp_path), "ab-cd-800").endswith("ab-cd-800.webp")
@@ -0,0 +1,62 @@
+import io
+import os
+
+import pytest
+from PIL import Image
+from src.config import ConfigManager
+from src.image_encoder import (
+    WEBP_MAX_DIMENSION, encode_image, save_screenshot, shutdown_encoder
+)
+
+MAX_WIDTH = 320
+QUALITY = 60
+
+
+def _png_bytes(width, height):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 30, 30)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_given_wide_png_when_encode_image_invoked_then_should_downscale_to_webp():
+    image_bytes, extension = encode_image(_png_bytes(1280, 800), MAX_WIDTH, QUALITY)
+    assert extension == "webp"
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        assert image.format == "WEBP"
+        assert image.size == (MAX_WIDTH, 200)
+
+
+def test_given_narrow_png_when_encode_image_invoked_then_should_keep_size():
+    image_bytes, _ = encode_image(_png_bytes(100, 50), MAX_WIDTH, QUALITY)
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        assert image.size == (100, 50)
+
+
+def test_given_too_tall_png_when_encode_image_invoked_then_should_fallback_to_png():
+    png_bytes = _png_bytes(10, WEBP_MAX_DIMENSION + 1)
+    image_bytes, extension = encode_image(png_bytes, MAX_WIDTH, QUALITY)
+    assert extension == "png"
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        assert image.format == "PNG"
+
+
+@pytest.mark.asyncio
+async def test_given_same_png_when_save_screenshot_invoked_twice_then_should_reuse_blob(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(ConfigManager, "ENCODER_WORKERS", 1)
+    monkeypatch.setattr(ConfigManager, "IMG_MAX_WIDTH", MAX_WIDTH)
+    png_bytes = _png_bytes(640, 480)
+    try:
+        saved = await save_screenshot(png_bytes, str(tmp_path))
+        second = (await save_screenshot(png_bytes, str(tmp_path))).blob
+    finally:
+        shutdown_encoder()
+    first = saved.blob
+    assert saved.encode_seconds > 0
+    assert saved.write_seconds > 0
+    assert first.path.endswith(".webp")
+    assert os.path.exists(first.path)
+    assert first.is_new is True
+    assert second.is_new is False
+    assert second.path == first.path
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from PIL import Image
+from src.image_hash import HASH_SIZE, dhash, hamming_distance
+
+
+def _gradient_image(width=640, height=480, reverse=False):
+    row = np.linspace(0, 255, width, dtype=np.uint8)
+    if reverse:
+        row = row[::-1]
+    return Image.fromarray(np.tile(row, (height, 1))).convert("RGB")
+
+
+def test_given_image_when_dhash_invoked_then_should_return_fixed_length_hex():
+    image_hash = dhash(_gradient_image())
+    assert len(image_hash) == HASH_SIZE * HASH_SIZE // 4
+    int(image_hash, 16)
+
+
+def test_given_resized_image_when_dhash_invoked_then_should_be_similar():
+    original = dhash(_gradient_image(1280, 960))
+    resized = dhash(_gradient_image(320, 240))
+    assert hamming_distance(original, resized) <= 4
+
+
+def test_given_different_images_when_dhash_invoked_then_should_be_far():
+    forward = dhash(_gradient_image())
+    backward = dhash(_gradient_image(reverse=True))
+    assert hamming_distance(forward, backward) > HASH_SIZE * HASH_SIZE // 2
+
+
+@pytest.mark.parametrize("hash_a,hash_b,expected", [
+    ("00", "00", 0),
+    ("00", "ff", 8),
+    ("0f", "f0", 8),
+    ("01", "03", 1),
+])
+def test_given_hashes_when_hamming_distance_invoked_then_should_count_bits(
+    hash_a, hash_b, expected
+):
+    assert hamming_distance(hash_a, hash_b) == expected
+
+
+def test_given_different_length_hashes_when_hamming_distance_invoked_then_should_throw():
+    with pytest.raises(ValueError):
+        hamming_distance("00", "0000")
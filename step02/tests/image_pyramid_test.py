@@ -0,0 +1,86 @@
+import os
+import pytest
+from PIL import Image
+from src.config import ConfigManager
+from src.image_encoder import shutdown_encoder
+from src.image_pyramid import (
+    SIZE_FULL,
+    SIZE_MEDIUM,
+    SIZE_THUMBNAIL,
+    build_derived,
+    derived_path,
+    ensure_derived,
+    is_derived,
+)
+
+QUALITY = 60
+SPECS = {SIZE_THUMBNAIL: (320, 200), SIZE_MEDIUM: (640, 0)}
+
+
+def _source(tmp_path, width: int, height: int) -> str:
+    path = str(tmp_path / "blob.webp")
+    image = Image.new("RGB", (width, height), (255, 255, 255))
+    # 상단 절반은 빨강, 하단은 파랑
+    image.paste((255, 0, 0), (0, 0, width, height // 2))
+    image.paste((0, 0, 255), (0, height // 2, width, height))
+    image.save(path, format="WEBP", quality=90)
+    return path
+
+
+def test_given_image_path_when_derived_path_invoked_then_should_sit_beside_original():
+    assert derived_path("/data/ab/cd.webp", SIZE_THUMBNAIL) == "/data/ab/cd.thumbnail.webp"
+    assert derived_path("/data/ab/cd.png", SIZE_MEDIUM) == "/data/ab/cd.medium.webp"
+    assert derived_path("/data/ab/cd.webp", SIZE_FULL) == "/data/ab/cd.webp"
+    assert is_derived("/data/ab/cd.thumbnail.webp")
+    assert not is_derived("/data/ab/cd.webp")
+
+
+def test_given_full_page_when_build_derived_invoked_then_should_crop_thumbnail_to_top(
+    tmp_path
+):
+    source = _source(tmp_path, 1280, 4000)
+    paths = build_derived(source, SPECS, QUALITY)
+    with Image.open(paths[SIZE_THUMBNAIL]) as thumbnail:
+        assert thumbnail.size == (320, 200)
+        # 페이지 상단만 잘랐으므로 전부 빨강
+        assert thumbnail.convert("RGB").getpixel((160, 190))[0] > 200
+    with Image.open(paths[SIZE_MEDIUM]) as medium:
+        assert medium.size == (640, 2000)
+        assert medium.convert("RGB").getpixel((320, 1900))[2] > 200
+
+
+def test_given_narrow_image_when_build_derived_invoked_then_should_not_upscale(tmp_path):
+    source = _source(tmp_path, 200, 100)
+    paths = build_derived(source, SPECS, QUALITY)
+    with Image.open(paths[SIZE_THUMBNAIL]) as thumbnail:
+        assert thumbnail.size == (200, 100)
+    with Image.open(paths[SIZE_MEDIUM]) as medium:
+        assert medium.size == (200, 100)
+
+
+def test_given_existing_derived_when_build_derived_invoked_then_should_skip(tmp_path):
+    source = _source(tmp_path, 1280, 800)
+    thumbnail_path = derived_path(source, SIZE_THUMBNAIL)
+    with open(thumbnail_path, "wb") as f:
+        f.write(b"cached")
+    build_derived(source, SPECS, QUALITY)
+    with open(thumbnail_path, "rb") as f:
+        assert f.read() == b"cached"
+    assert os.path.exists(derived_path(source, SIZE_MEDIUM))
+
+
+@pytest.mark.asyncio
+async def test_given_missing_derived_when_ensure_derived_invoked_then_should_build_on_demand(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(ConfigManager, "ENCODER_WORKERS", 1)
+    source = _source(tmp_path, 1280, 800)
+    try:
+        path = await ensure_derived(source, SIZE_MEDIUM)
+    finally:
+        shutdown_encoder()
+    assert path == derived_path(source, SIZE_MEDIUM)
+    with Image.open(path) as medium:
+        assert medium.size == (640, 400)
+    assert not os.path.exists(derived_path(source, SIZE_THUMBNAIL))
+    assert await ensure_derived(source, SIZE_FULL) == source
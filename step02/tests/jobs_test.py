@@ -0,0 +1,153 @@
+import asyncio
+
+import pytest
+from src.config import ConfigManager
+from src.jobs import (
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    JobRunner,
+    JobStore,
+    get_job_store,
+)
+
+KIND = "test"
+WORKER_ID = "worker-1"
+
+
+@pytest.fixture
+def job_db(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "jobs.sqlite3")
+    monkeypatch.setattr(ConfigManager, "JOB_DB_PATH", db_path)
+    monkeypatch.setattr(ConfigManager, "JOB_CONCURRENCY", 2)
+    return db_path
+
+
+async def _wait_for(store, job_id, status, timeout=5):
+    for _ in range(int(timeout / 0.01)):
+        job = store.get(job_id)
+        if job.status == status:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not reach {status}: {job.status}")
+
+
+def test_given_jobs_when_claim_invoked_then_should_return_oldest_once(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    first = store.create(KIND, {"n": 1}, total=2)
+    second = store.create(KIND, {"n": 2})
+    assert first.status == JOB_QUEUED
+    claimed = store.claim(WORKER_ID)
+    assert claimed.id == first.id
+    assert claimed.status == JOB_RUNNING
+    assert claimed.payload == {"n": 1}
+    assert store.claim(WORKER_ID).id == second.id
+    assert store.claim(WORKER_ID) is None
+
+
+def test_given_running_job_when_add_result_and_finish_invoked_then_should_track_progress(
+    tmp_path
+):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    job = store.create(KIND, {}, total=3)
+    store.claim(WORKER_ID)
+    store.add_result(job.id, {"n": 1})
+    store.add_result(job.id, {"n": 2})
+    assert store.get(job.id).completed == 2
+    assert store.results(job.id) == [{"n": 1}, {"n": 2}]
+    store.finish(job.id, JOB_SUCCEEDED, output="done")
+    finished = store.get(job.id)
+    assert finished.status == JOB_SUCCEEDED
+    assert finished.completed == 3
+    assert finished.output == "done"
+    assert finished.finished_at is not None
+
+
+def test_given_interrupted_job_when_requeue_stale_invoked_then_should_reset_progress(
+    tmp_path
+):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    job = store.create(KIND, {}, total=2)
+    store.claim(WORKER_ID)
+    store.add_result(job.id, {"n": 1})
+    assert store.requeue_stale(-1) == 1
+    requeued = store.get(job.id)
+    assert requeued.status == JOB_QUEUED
+    assert requeued.completed == 0
+    assert requeued.worker_id is None
+    assert store.results(job.id) == []
+
+
+def test_given_live_job_when_requeue_stale_invoked_then_should_keep_running(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    job = store.create(KIND, {}, total=2)
+    store.claim(WORKER_ID)
+    assert store.heartbeat(WORKER_ID) == 1
+    assert store.requeue_stale(60) == 0
+    running = store.get(job.id)
+    assert running.status == JOB_RUNNING
+    assert running.worker_id == WORKER_ID
+
+
+def test_given_requeued_job_when_previous_owner_writes_then_should_be_ignored(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    job = store.create(KIND, {}, total=1)
+    store.claim(WORKER_ID)
+    store.requeue_stale(-1)
+    store.claim("worker-2")
+    store.add_result(job.id, {"n": 1}, WORKER_ID)
+    store.finish(job.id, JOB_SUCCEEDED, worker_id=WORKER_ID)
+    current = store.get(job.id)
+    assert current.status == JOB_RUNNING
+    assert current.completed == 0
+    assert store.results(job.id) == []
+
+
+@pytest.mark.asyncio
+async def test_given_registered_handler_when_submit_invoked_then_should_run_in_background(
+    job_db
+):
+    runner = JobRunner()
+    release = asyncio.Event()
+
+    async def handler(payload, add_result):
+        for n in range(payload["count"]):
+            add_result({"n": n})
+        await release.wait()
+        return "finished"
+
+    runner.register(KIND, handler)
+    try:
+        job = runner.submit(KIND, {"count": 2}, total=2)
+        store = get_job_store()
+        running = await _wait_for(store, job.id, JOB_RUNNING)
+        assert running.status == JOB_RUNNING
+        release.set()
+        done = await _wait_for(store, job.id, JOB_SUCCEEDED)
+        assert done.output == "finished"
+        assert store.results(job.id) == [{"n": 0}, {"n": 1}]
+    finally:
+        await runner.stop()
+    assert not runner.is_started
+
+
+@pytest.mark.asyncio
+async def test_given_failing_handler_when_job_runs_then_should_mark_failed(job_db):
+    runner = JobRunner()
+
+    async def handler(payload, add_result):
+        raise RuntimeError("boom")
+
+    runner.register("failing", handler)
+    try:
+        job = runner.submit("failing", {})
+        failed = await _wait_for(get_job_store(), job.id, JOB_FAILED)
+        assert failed.error == "boom"
+    finally:
+        await runner.stop()
+
+
+def test_given_unknown_kind_when_submit_invoked_then_should_raise(job_db):
+    with pytest.raises(ValueError):
+        JobRunner().submit("unknown", {})
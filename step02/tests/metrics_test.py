@@ -0,0 +1,78 @@
+from prometheus_client import REGISTRY
+from src.metrics import (
+    OUTCOME_CHANGED,
+    OUTCOME_FAILED,
+    OUTCOME_UNCHANGED,
+    PHASE_BROWSER_LAUNCH,
+    PHASE_GOTO,
+    PhaseTimer,
+    capture_outcome,
+    observe_capture,
+    time_browser_phase,
+)
+from src.models import CaptureResult, UrlInfo
+
+SYSTEM_NM = "MetricsSystem"
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_given_phase_timer_when_lap_invoked_then_should_accumulate_per_phase():
+    timer = PhaseTimer()
+    timer.lap(PHASE_GOTO)
+    timer.lap()
+    timer.lap(PHASE_GOTO)
+    timer.record("encode", 0.5)
+    timer.record("encode", 0.25)
+    assert set(timer.durations) == {PHASE_GOTO, "encode"}
+    assert timer.durations["encode"] == 0.75
+    assert timer.total >= timer.durations[PHASE_GOTO]
+
+
+def test_given_result_when_observe_capture_invoked_then_should_update_metrics():
+    before_count = _sample(
+        "screenshot_capture_phase_seconds_count", system=SYSTEM_NM, phase="encode"
+    )
+    before_total = _sample(
+        "screenshot_captures_total", system=SYSTEM_NM, outcome=OUTCOME_CHANGED
+    )
+    result = CaptureResult(
+        urlinfo=UrlInfo(name=SYSTEM_NM, url="https://example.com"),
+        isSuccess=True,
+        isChanged=True,
+        readySignal="dom-quiet",
+        phaseTimings={"encode": 0.1},
+    )
+    observe_capture(result)
+    assert _sample(
+        "screenshot_capture_phase_seconds_count", system=SYSTEM_NM, phase="encode"
+    ) == before_count + 1
+    assert _sample(
+        "screenshot_captures_total", system=SYSTEM_NM, outcome=OUTCOME_CHANGED
+    ) == before_total + 1
+    assert _sample(
+        "screenshot_ready_signals_total", system=SYSTEM_NM, signal="dom-quiet"
+    ) >= 1
+
+
+def test_given_results_when_capture_outcome_invoked_then_should_classify():
+    urlinfo = UrlInfo(name=SYSTEM_NM, url="https://example.com")
+    assert capture_outcome(
+        CaptureResult(urlinfo=urlinfo, isSuccess=False)
+    ) == OUTCOME_FAILED
+    assert capture_outcome(
+        CaptureResult(urlinfo=urlinfo, isSuccess=True, isChanged=False)
+    ) == OUTCOME_UNCHANGED
+
+
+def test_given_browser_phase_when_time_browser_phase_used_then_should_observe():
+    before = _sample(
+        "screenshot_browser_phase_seconds_count", phase=PHASE_BROWSER_LAUNCH
+    )
+    with time_browser_phase(PHASE_BROWSER_LAUNCH):
+        pass
+    assert _sample(
+        "screenshot_browser_phase_seconds_count", phase=PHASE_BROWSER_LAUNCH
+    ) == before + 1
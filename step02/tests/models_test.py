@@ -1,7 +1,8 @@
 import pytest
 from pydantic import ValidationError
 from src.models import (
-    UrlInfo, ScreenshotGetResultData, ScreenshotPostResultData, ResultCode
+    UrlInfo, ScreenshotGetResultData, ScreenshotPostResultData, ResultCode,
+    CaptureResult,
 )
 
 VALID_NAME = "Google"
@@ -174,3 +175,11 @@ def test_given_resultcode_enum_when_accessed_then_should_return_expected_values(
     assert ResultCode.FAIL.value == 900
     assert ResultCode.INTERNAL_ERROR.value == 910
     assert ResultCode.EXTERNAL_ERROR.value == 920
+
+
+def test_given_failed_captureresult_when_created_then_should_keep_error():
+    urlinfo = UrlInfo(name=VALID_NAME, url=VALID_URL)
+    result = CaptureResult(urlinfo=urlinfo, isSuccess=False, errorMsg="boom")
+    assert result.isSuccess is False
+    assert result.imagePath is None
+    assert result.errorMsg == "boom"
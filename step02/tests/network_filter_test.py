@@ -0,0 +1,92 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.config import ConfigManager
+from src.network_filter import (
+    ABORT_ERROR_CODE, BlockRule, apply_block_rule, block_rule_for
+)
+
+SYSTEM_NM = "TestSystem"
+SECTIONS = {
+    "BLOCK": {"resource_types": "media, font", "domains": "ads.example.com"},
+    "BLOCK.TestSystem": {"domains": ".tracker.example.net"},
+    "BLOCK.Standalone": {"inherit": "false", "resource_types": "media"},
+}
+
+
+@pytest.fixture
+def sections(monkeypatch):
+    monkeypatch.setattr(
+        ConfigManager, "get_section", lambda self, name: SECTIONS.get(name, {})
+    )
+
+
+def _route(resource_type, url):
+    route = MagicMock()
+    route.request.resource_type = resource_type
+    route.request.url = url
+    route.abort = AsyncMock()
+    route.continue_ = AsyncMock()
+    return route
+
+
+def test_given_block_rule_when_blocks_invoked_then_should_match_type_and_subdomain():
+    rule = BlockRule(resource_types=frozenset({"font"}), domains=("ads.example.com",))
+    assert rule.blocks("font", "https://www.example.com/a.woff2")
+    assert rule.blocks("script", "https://ads.example.com/ad.js")
+    assert rule.blocks("image", "https://cdn.ads.example.com/banner.png")
+    assert not rule.blocks("script", "https://badads.example.com/ad.js")
+    assert not rule.blocks("document", "https://www.example.com/")
+
+
+def test_given_system_section_when_block_rule_for_invoked_then_should_merge_global(
+    sections
+):
+    rule = block_rule_for(SYSTEM_NM)
+    assert rule.resource_types == {"media", "font"}
+    assert rule.domains == ("ads.example.com", "tracker.example.net")
+
+
+def test_given_inherit_false_when_block_rule_for_invoked_then_should_skip_global(
+    sections
+):
+    rule = block_rule_for("Standalone")
+    assert rule.resource_types == {"media"}
+    assert rule.domains == ()
+
+
+def test_given_no_sections_when_block_rule_for_invoked_then_should_be_empty(
+    monkeypatch
+):
+    monkeypatch.setattr(ConfigManager, "get_section", lambda self, name: {})
+    assert block_rule_for(SYSTEM_NM).is_empty
+
+
+@pytest.mark.asyncio
+async def test_given_block_rule_when_requests_routed_then_should_abort_and_count():
+    context = MagicMock()
+    context.route = AsyncMock()
+    rule = BlockRule(resource_types=frozenset({"media"}), domains=("ads.example.com",))
+    stats = await apply_block_rule(context, rule)
+    handle = context.route.await_args.args[1]
+    on_response = context.on.call_args.args[1]
+
+    blocked = _route("script", "https://ads.example.com/ad.js")
+    allowed = _route("document", "https://www.example.com/")
+    await handle(blocked)
+    await handle(allowed)
+    on_response(MagicMock(headers={"content-length": "1024"}))
+    on_response(MagicMock(headers={}))
+
+    blocked.abort.assert_awaited_once_with(ABORT_ERROR_CODE)
+    allowed.continue_.assert_awaited_once()
+    assert stats.blocked_requests == 1
+    assert stats.transferred_bytes == 1024
+
+
+@pytest.mark.asyncio
+async def test_given_empty_rule_when_apply_block_rule_invoked_then_should_not_route():
+    context = MagicMock()
+    context.route = AsyncMock()
+    await apply_block_rule(context, BlockRule())
+    context.route.assert_not_awaited()
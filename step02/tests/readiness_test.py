@@ -0,0 +1,96 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from src.readiness import (
+    READY_DEADLINE,
+    READY_DOM_CONTENT_LOADED,
+    READY_DOM_QUIET,
+    READY_LAYOUT_STABLE,
+    READY_NETWORK_IDLE,
+    wait_for_layout,
+    wait_until_ready,
+)
+
+URL = "https://www.example.com/"
+QUIET_MS = 10
+
+
+async def _forever(*args, **kwargs):
+    await asyncio.sleep(3600)
+
+
+async def _fail(*args, **kwargs):
+    raise RuntimeError("Execution context was destroyed")
+
+
+def _page(load_state=_forever, evaluate=_forever):
+    page = MagicMock()
+    page.goto = AsyncMock()
+    page.wait_for_load_state = load_state
+    page.evaluate = evaluate
+    return page
+
+
+@pytest.mark.asyncio
+async def test_given_dom_quiet_first_when_wait_until_ready_invoked_then_should_return_dom_quiet():
+    page = _page(evaluate=AsyncMock(return_value=True))
+    signal = await wait_until_ready(page, URL, timeout=5, quiet_ms=QUIET_MS)
+    assert signal == READY_DOM_QUIET
+    page.goto.assert_awaited_once_with(
+        URL, wait_until="domcontentloaded", timeout=5000
+    )
+
+
+@pytest.mark.asyncio
+async def test_given_network_idle_first_when_wait_until_ready_invoked_then_should_return_networkidle():
+    page = _page(load_state=AsyncMock())
+    signal = await wait_until_ready(page, URL, timeout=5, quiet_ms=QUIET_MS)
+    assert signal == READY_NETWORK_IDLE
+
+
+@pytest.mark.asyncio
+async def test_given_unstable_page_when_wait_until_ready_invoked_then_should_stop_at_deadline():
+    page = _page()
+    signal = await wait_until_ready(page, URL, timeout=0.05, quiet_ms=QUIET_MS)
+    assert signal == READY_DEADLINE
+    page.goto.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_given_goto_timeout_when_wait_until_ready_invoked_then_should_return_deadline():
+    page = _page()
+    page.goto = AsyncMock(side_effect=PlaywrightTimeoutError("timeout"))
+    signal = await wait_until_ready(page, URL, timeout=1, quiet_ms=QUIET_MS)
+    assert signal == READY_DEADLINE
+
+
+@pytest.mark.asyncio
+async def test_given_failing_signals_when_wait_until_ready_invoked_then_should_fall_back_to_dom_content_loaded():
+    page = _page(load_state=_fail, evaluate=_fail)
+    signal = await wait_until_ready(page, URL, timeout=5, quiet_ms=QUIET_MS)
+    assert signal == READY_DOM_CONTENT_LOADED
+
+
+@pytest.mark.asyncio
+async def test_given_navigation_error_when_wait_until_ready_invoked_then_should_raise():
+    page = _page()
+    page.goto = AsyncMock(side_effect=RuntimeError("net::ERR_NAME_NOT_RESOLVED"))
+    with pytest.raises(RuntimeError):
+        await wait_until_ready(page, URL, timeout=1, quiet_ms=QUIET_MS)
+
+
+@pytest.mark.asyncio
+async def test_given_stable_layout_when_wait_for_layout_invoked_then_should_return_layout_stable():
+    page = _page(evaluate=AsyncMock(return_value=True))
+    signal = await wait_for_layout(page, timeout=5, quiet_ms=QUIET_MS)
+    assert signal == READY_LAYOUT_STABLE
+    page.goto.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_given_unstable_layout_when_wait_for_layout_invoked_then_should_return_deadline():
+    page = _page()
+    signal = await wait_for_layout(page, timeout=0.05, quiet_ms=QUIET_MS)
+    assert signal == READY_DEADLINE
@@ -0,0 +1,127 @@
+import os
+import time
+import zipfile
+
+from src.image_pyramid import SIZE_THUMBNAIL, derived_path
+from src.retention import (
+    DAY_SECONDS,
+    TIER_ALL,
+    TIER_DAILY,
+    TIER_EXPIRED,
+    TIER_MONTHLY,
+    RetentionPolicy,
+    apply_retention,
+    plan_retention,
+)
+from src.screenshot_archive import archive_path_for, local_copy, read_archived
+from src.screenshot_index import IndexEntry, ScreenshotIndex
+
+SYSTEM_NM = "TestSystem"
+POLICY = RetentionPolicy(keep_all_days=7, keep_daily_days=90, keep_monthly_days=0)
+# 자정 근처에서 하루 경계가 흔들리지 않도록 정오 기준
+NOW = time.mktime((2026, 6, 30, 12, 0, 0, 0, 0, -1))
+
+
+def _entry(entry_id: int, days_ago: float, hours: float = 0) -> IndexEntry:
+    return IndexEntry(
+        id=entry_id,
+        system_nm=SYSTEM_NM,
+        captured_at=NOW - days_ago * DAY_SECONDS + hours * 3600,
+        image_path=f"{entry_id}.webp",
+    )
+
+
+def _blob(tmp_path, name: str, data: bytes) -> str:
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_given_ages_when_tier_invoked_then_should_follow_policy():
+    assert POLICY.tier(1 * DAY_SECONDS) == TIER_ALL
+    assert POLICY.tier(30 * DAY_SECONDS) == TIER_DAILY
+    assert POLICY.tier(400 * DAY_SECONDS) == TIER_MONTHLY
+    limited = RetentionPolicy(keep_all_days=7, keep_daily_days=90, keep_monthly_days=365)
+    assert limited.tier(400 * DAY_SECONDS) == TIER_EXPIRED
+
+
+def test_given_history_when_plan_retention_invoked_then_should_keep_first_per_period():
+    entries = [
+        _entry(1, 400),             # 오래된 한 달의 첫 캡처
+        _entry(2, 399),             # 같은 달 → 삭제
+        _entry(3, 30),              # 하루의 첫 캡처
+        _entry(4, 30, hours=2),     # 같은 날 → 삭제
+        _entry(5, 1),               # 최근 → 유지
+        _entry(6, 0),
+    ]
+    plan = plan_retention(entries, POLICY, NOW)
+    assert [entry.id for entry in plan.archive] == [1, 3]
+    assert [entry.id for entry in plan.drop] == [2, 4]
+
+
+def test_given_only_old_capture_when_plan_retention_invoked_then_should_keep_latest():
+    plan = plan_retention([_entry(1, 400)], POLICY, NOW)
+    assert plan.archive == []
+    assert plan.drop == []
+
+
+def test_given_old_captures_when_apply_retention_invoked_then_should_archive_and_drop(
+    tmp_path
+):
+    index = ScreenshotIndex(str(tmp_path))
+    kept = _blob(tmp_path, "kept.webp", b"kept")
+    dropped = _blob(tmp_path, "dropped.webp", b"dropped")
+    latest = _blob(tmp_path, "latest.webp", b"latest")
+    _blob(tmp_path, os.path.basename(derived_path(kept, SIZE_THUMBNAIL)), b"thumb")
+    kept_id = index.add(SYSTEM_NM, kept, NOW - 30 * DAY_SECONDS, blob_hash="kept")
+    dropped_id = index.add(SYSTEM_NM, dropped, NOW - 30 * DAY_SECONDS + 3600)
+    index.add(SYSTEM_NM, latest, NOW)
+
+    stats = apply_retention(index, POLICY, NOW)
+
+    assert (stats.archived, stats.dropped, stats.deleted_files) == (1, 1, 2)
+    assert not os.path.exists(kept)
+    assert not os.path.exists(derived_path(kept, SIZE_THUMBNAIL))
+    assert not os.path.exists(dropped)
+    assert os.path.exists(latest)
+    assert index.get(dropped_id) is None
+    entry = index.get(kept_id)
+    assert entry.archive_path == archive_path_for(SYSTEM_NM, entry.captured_at)
+    assert read_archived(index, entry) == b"kept"
+    with local_copy(index, entry) as path:
+        with open(path, "rb") as f:
+            assert f.read() == b"kept"
+    assert not os.path.exists(path)
+
+
+def test_given_shared_blob_when_apply_retention_invoked_then_should_keep_live_file(
+    tmp_path
+):
+    index = ScreenshotIndex(str(tmp_path))
+    shared = _blob(tmp_path, "shared.webp", b"shared")
+    index.add(SYSTEM_NM, shared, NOW - 30 * DAY_SECONDS)
+    index.add("OtherSystem", shared, NOW - 1 * DAY_SECONDS)
+    index.add(SYSTEM_NM, _blob(tmp_path, "latest.webp", b"latest"), NOW)
+    apply_retention(index, POLICY, NOW)
+    # 다른 시스템이 아직 직접 가리키는 blob은 지우지 않음
+    assert os.path.exists(shared)
+
+
+def test_given_archived_daily_when_it_becomes_monthly_then_should_compact_archive(
+    tmp_path
+):
+    index = ScreenshotIndex(str(tmp_path))
+    first = index.add(SYSTEM_NM, _blob(tmp_path, "a.webp", b"a"), NOW - 80 * DAY_SECONDS)
+    second = index.add(SYSTEM_NM, _blob(tmp_path, "b.webp", b"b"), NOW - 79 * DAY_SECONDS)
+    index.add(SYSTEM_NM, _blob(tmp_path, "latest.webp", b"latest"), NOW)
+    apply_retention(index, POLICY, NOW)
+    archive_path = index.get(first).archive_path
+    assert index.get(second).archive_path == archive_path
+
+    # 두 캡처가 같은 달의 월 단위 보관 기간으로 넘어가면 첫 캡처만 남김
+    later = NOW + 30 * DAY_SECONDS
+    stats = apply_retention(index, POLICY, later)
+    assert (stats.archived, stats.dropped) == (0, 1)
+    assert index.get(second) is None
+    with zipfile.ZipFile(os.path.join(str(tmp_path), archive_path)) as archive:
+        assert archive.namelist() == ["a.webp"]
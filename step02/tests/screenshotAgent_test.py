@@ -3,10 +3,17 @@ from unittest.mock import patch, AsyncMock
 import pytest
 from fastapi.testclient import TestClient
 from src.screenshotAgent import app
+import io
+import json
 import tempfile
+import time
 import os
-from src.models import UrlInfo
-from src.config import ConfigManager
+from src.models import CaptureResult, UrlInfo
+from src.config import ConfigManager, UrlIndex
+from src.image_encoder import shutdown_encoder
+from src.retention import RetentionPolicy, apply_retention
+from src.screenshot_index import get_screenshot_index
+from PIL import Image
 import httpx
 
 # 테스트용 상수
@@ -65,14 +72,212 @@ def test_given_valid_systemNm_when_get_screenshot_invoked_then_should_return_suc
         # monkeypatch로 URLS, SAVE_PATH 주입
         monkeypatch.setattr(
             ConfigManager,
-            "URLS",
-            [UrlInfo(name=systemNm, url="http://example.com")],
+            "URL_INDEX",
+            UrlIndex.build([UrlInfo(name=systemNm, url="http://example.com")]),
         )
         monkeypatch.setattr(ConfigManager, "SAVE_PATH", tmpdir)
         response = client.get(f"/api/v1/predefined/screenshot?systemNm={systemNm}")
         assert response.status_code == 200
         assert response.json()["resultCd"] == SUCCESS_RESULT_CD
-        assert "imagePath" in response.json()["data"]
+        # 이전 파일은 조회시 시스템/날짜별 디렉터리로 옮겨서 반환
+        assert response.json()["data"]["imagePath"].endswith(
+            f"/{systemNm}/2025/10/26/{image_name}"
+        )
+        assert not os.path.exists(image_path)
+
+
+def test_given_two_captures_when_get_screenshot_diff_invoked_then_should_return_scores(
+    monkeypatch
+):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        systemNm = "DiffSystem"
+        index = get_screenshot_index(tmpdir)
+        for captured_at, color in ((100.0, "white"), (200.0, "black")):
+            image_path = os.path.join(tmpdir, f"{systemNm}-{int(captured_at)}.webp")
+            Image.new("RGB", (64, 48), color).save(image_path, format="WEBP")
+            index.add(systemNm, image_path, captured_at)
+        monkeypatch.setattr(ConfigManager, "SAVE_PATH", tmpdir)
+        monkeypatch.setattr(ConfigManager, "ENCODER_WORKERS", 1)
+        try:
+            response = client.get(
+                f"/api/v1/predefined/screenshot/diff?systemNm={systemNm}"
+            )
+        finally:
+            shutdown_encoder()
+        assert response.status_code == 200
+        assert response.json()["resultCd"] == SUCCESS_RESULT_CD
+        data = response.json()["data"]
+        assert data["changedRatio"] == 1.0
+        assert data["heatmapPath"].startswith("/api/v1/predefined/screenshot/diff/heatmap?key=")
+        heatmap = client.get(data["heatmapPath"])
+        assert heatmap.status_code == 200
+        assert heatmap.headers["content-type"] == "image/webp"
+        assert heatmap.headers["cache-control"] == "public, max-age=31536000, immutable"
+        cached = client.get(
+            data["heatmapPath"], headers={"If-None-Match": heatmap.headers["etag"]}
+        )
+        assert cached.status_code == 304
+
+
+def test_given_unsafe_key_when_get_screenshot_diff_heatmap_invoked_then_should_return_400():
+    response = client.get("/api/v1/predefined/screenshot/diff/heatmap?key=../config")
+    assert response.status_code == 400
+
+
+@pytest.fixture
+def indexed_image(tmp_path, monkeypatch):
+    """
+    blob 해시가 있는 캡처 하나를 인덱스에 등록
+    """
+    systemNm = "ImageSystem"
+    image_path = tmp_path / "image.webp"
+    image_path.write_bytes(b"0123456789")
+    monkeypatch.setattr(ConfigManager, "SAVE_PATH", str(tmp_path))
+    monkeypatch.setattr(
+        ConfigManager,
+        "URL_INDEX",
+        UrlIndex.build([UrlInfo(name=systemNm, url="https://example.com")]),
+    )
+    entry_id = get_screenshot_index(str(tmp_path)).add(
+        systemNm, str(image_path), 100.0, blob_hash="abc123"
+    )
+    return systemNm, entry_id
+
+
+def test_given_capture_when_get_screenshot_image_invoked_then_should_stream_bytes(
+    indexed_image
+):
+    systemNm, entry_id = indexed_image
+    url = client.get(
+        f"/api/v1/predefined/screenshot?systemNm={systemNm}"
+    ).json()["data"]["imageUrl"]
+    assert url.endswith(f"captureId={entry_id}&size=full")
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.content == b"0123456789"
+    assert response.headers["content-type"] == "image/webp"
+    assert response.headers["etag"] == '"abc123"'
+    assert "immutable" in response.headers["cache-control"]
+    latest = client.get(f"/api/v1/predefined/screenshot/image?systemNm={systemNm}")
+    assert latest.headers["cache-control"] == "no-cache"
+
+
+def test_given_matching_etag_when_get_screenshot_image_invoked_then_should_return_304(
+    indexed_image
+):
+    systemNm, _ = indexed_image
+    response = client.get(
+        f"/api/v1/predefined/screenshot/image?systemNm={systemNm}",
+        headers={"If-None-Match": 'W/"other", "abc123"'},
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == '"abc123"'
+
+
+def test_given_range_when_get_screenshot_image_invoked_then_should_return_partial(
+    indexed_image
+):
+    systemNm, _ = indexed_image
+    response = client.get(
+        f"/api/v1/predefined/screenshot/image?systemNm={systemNm}",
+        headers={"Range": "bytes=2-5"},
+    )
+    assert response.status_code == 206
+    assert response.content == b"2345"
+    assert response.headers["content-range"] == "bytes 2-5/10"
+
+
+def test_given_thumbnail_size_when_get_screenshot_image_invoked_then_should_serve_derived(
+    tmp_path, monkeypatch
+):
+    systemNm = "ThumbnailSystem"
+    image_path = tmp_path / "image.webp"
+    Image.new("RGB", (1280, 4000), (200, 30, 30)).save(image_path, format="WEBP")
+    monkeypatch.setattr(ConfigManager, "SAVE_PATH", str(tmp_path))
+    monkeypatch.setattr(ConfigManager, "ENCODER_WORKERS", 1)
+    monkeypatch.setattr(
+        ConfigManager,
+        "URL_INDEX",
+        UrlIndex.build([UrlInfo(name=systemNm, url="https://example.com")]),
+    )
+    get_screenshot_index(str(tmp_path)).add(
+        systemNm, str(image_path), 100.0, blob_hash="abc123"
+    )
+    url = client.get(
+        f"/api/v1/predefined/screenshot?systemNm={systemNm}&size=thumbnail"
+    ).json()["data"]["imageUrl"]
+    assert url.endswith("&size=thumbnail")
+    try:
+        response = client.get(url)
+    finally:
+        shutdown_encoder()
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/webp"
+    assert response.headers["etag"] == '"abc123-thumbnail"'
+    with Image.open(io.BytesIO(response.content)) as image:
+        assert image.size == (320, 200)
+    assert (tmp_path / "image.thumbnail.webp").exists()
+
+
+def test_given_archived_capture_when_get_screenshot_image_invoked_then_should_read_archive(
+    indexed_image, tmp_path
+):
+    systemNm, entry_id = indexed_image
+    index = get_screenshot_index(str(tmp_path))
+    index.add(systemNm, str(tmp_path / "image.webp"), 200.0)
+    apply_retention(index, RetentionPolicy(keep_all_days=0), now=100.0 + 86400)
+    assert index.get(entry_id).archive_path is not None
+    response = client.get(
+        f"/api/v1/predefined/screenshot/image?systemNm={systemNm}&captureId={entry_id}"
+    )
+    assert response.status_code == 200
+    assert response.content == b"0123456789"
+    assert response.headers["etag"] == '"abc123"'
+    assert "immutable" in response.headers["cache-control"]
+
+
+def test_given_invalid_size_when_get_screenshot_image_invoked_then_should_return_400(
+    indexed_image
+):
+    systemNm, _ = indexed_image
+    response = client.get(
+        f"/api/v1/predefined/screenshot/image?systemNm={systemNm}&size=huge"
+    )
+    assert response.status_code == 400
+    assert response.json()["data"] is None
+
+
+@pytest.mark.parametrize(
+    "query,expected_status",
+    [
+        ("", 400),
+        ("?systemNm=NotExist", 404),
+        ("?systemNm=ImageSystem&captureId=999", 404),
+    ]
+)
+def test_given_missing_capture_when_get_screenshot_image_invoked_then_should_return_error(
+    indexed_image, query, expected_status
+):
+    response = client.get(f"/api/v1/predefined/screenshot/image{query}")
+    assert response.status_code == expected_status
+    assert response.json()["resultCd"] == ERROR_RESULT_CD
+
+
+def test_given_single_capture_when_get_screenshot_diff_invoked_then_should_return_error(
+    monkeypatch
+):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        systemNm = "LonelySystem"
+        image_path = os.path.join(tmpdir, f"{systemNm}-100.webp")
+        Image.new("RGB", (64, 48), "white").save(image_path, format="WEBP")
+        get_screenshot_index(tmpdir).add(systemNm, image_path, 100.0)
+        monkeypatch.setattr(ConfigManager, "SAVE_PATH", tmpdir)
+        response = client.get(
+            f"/api/v1/predefined/screenshot/diff?systemNm={systemNm}"
+        )
+        assert response.status_code == 200
+        assert response.json()["resultCd"] == ERROR_RESULT_CD
 
 
 @pytest.mark.parametrize(
@@ -95,14 +300,104 @@ def test_given_valid_systemNm_when_post_screenshot_invoked_then_should_return_su
     systemNm = "TestSystem"
     monkeypatch.setattr(
         ConfigManager,
-        "URLS",
-        [UrlInfo(name=systemNm, url="https://example.com")],
+        "URL_INDEX",
+        UrlIndex.build([UrlInfo(name=systemNm, url="https://example.com")]),
     )
     response = client.post("/api/v1/predefined/screenshot", json={"systemNm": systemNm})
     assert response.status_code == 200
     assert response.json()["resultCd"] == SUCCESS_RESULT_CD
 
 
+def test_given_stream_when_post_screenshot_invoked_then_should_return_ndjson(
+    monkeypatch
+):
+    systemNm = "TestSystem"
+    urlinfo = UrlInfo(name=systemNm, url="https://example.com")
+    monkeypatch.setattr(ConfigManager, "URL_INDEX", UrlIndex.build([urlinfo]))
+    monkeypatch.setattr(
+        "src.screenshotAgent.capture_one",
+        AsyncMock(return_value=CaptureResult(urlinfo=urlinfo, isSuccess=True)),
+    )
+    response = client.post(
+        "/api/v1/predefined/screenshot",
+        json={"systemNm": systemNm, "stream": True},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [line for line in response.text.splitlines() if line]
+    assert len(lines) == 1
+    assert json.loads(lines[0])["isSuccess"] is True
+    assert json.loads(lines[0])["urlinfo"]["name"] == systemNm
+
+
+def test_given_viewport_matrix_when_post_screenshot_invoked_then_should_pass_viewports(
+    monkeypatch
+):
+    systemNm = "TestSystem"
+    urlinfo = UrlInfo(name=systemNm, url="https://example.com")
+    monkeypatch.setattr(ConfigManager, "URL_INDEX", UrlIndex.build([urlinfo]))
+    monkeypatch.setattr(
+        ConfigManager,
+        "get_section",
+        lambda self, section: {"desktop": "1280x800", "mobile": "375x812"},
+    )
+    capture = AsyncMock(return_value=CaptureResult(urlinfo=urlinfo, isSuccess=True))
+    monkeypatch.setattr("src.screenshotAgent.capture_one", capture)
+    response = client.post(
+        "/api/v1/predefined/screenshot",
+        json={"systemNm": systemNm, "viewportMatrix": True},
+    )
+    assert response.status_code == 200
+    assert response.json()["resultCd"] == SUCCESS_RESULT_CD
+    viewports = capture.call_args.kwargs["viewports"]
+    assert [viewport.name for viewport in viewports] == ["desktop", "mobile"]
+
+
+def test_given_metrics_when_get_metrics_invoked_then_should_return_prometheus_text():
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "screenshot_capture_queue_active" in response.text
+
+
+def test_given_screenshot_job_when_posted_then_should_accept_and_complete(
+    monkeypatch, tmp_path
+):
+    systemNm = "TestSystem"
+    urlinfo = UrlInfo(name=systemNm, url="https://example.com")
+    monkeypatch.setattr(ConfigManager, "URL_INDEX", UrlIndex.build([urlinfo]))
+    monkeypatch.setattr(ConfigManager, "JOB_DB_PATH", str(tmp_path / "jobs.sqlite3"))
+    monkeypatch.setattr(
+        "src.screenshotAgent.capture_one",
+        AsyncMock(return_value=CaptureResult(urlinfo=urlinfo, isSuccess=True)),
+    )
+    with TestClient(app) as job_client:
+        response = job_client.post(
+            "/api/v1/predefined/screenshot/jobs", json={"systemNm": systemNm}
+        )
+        assert response.status_code == 202
+        data = response.json()["data"]
+        assert data["status"] == "queued"
+        assert data["total"] == 1
+        for _ in range(500):
+            job = job_client.get(f"/api/v1/jobs/{data['jobId']}").json()["data"]
+            if job["status"] == "succeeded":
+                break
+            time.sleep(0.01)
+    assert job["status"] == "succeeded"
+    assert job["completed"] == 1
+    assert job["results"][0]["urlinfo"]["name"] == systemNm
+
+
+def test_given_unknown_job_id_when_get_job_invoked_then_should_return_error(
+    monkeypatch, tmp_path
+):
+    monkeypatch.setattr(ConfigManager, "JOB_DB_PATH", str(tmp_path / "jobs.sqlite3"))
+    response = client.get("/api/v1/jobs/unknown")
+    assert response.status_code == 200
+    assert response.json()["resultCd"] == ERROR_RESULT_CD
+
+
 # 통합 테스트: 실제 서버에 요청
 @pytest.mark.asyncio
 async def test_integration_get_openapi():
@@ -137,3 +432,82 @@ def test_given_valid_prompt_when_post_mcp_screenshot_then_should_return_success(
     assert response.status_code == 200
     assert response.json()['resultCd'] == SUCCESS_RESULT_CD
     assert response.json()['data'] == 'result'
+
+
+@pytest.fixture
+def history_index(tmp_path, monkeypatch):
+    """
+    시각이 1초씩 차이나는 캡처 5개를 인덱스에 등록
+    """
+    systemNm = "HistorySystem"
+    monkeypatch.setattr(ConfigManager, "SAVE_PATH", str(tmp_path))
+    image_path = tmp_path / "image.webp"
+    image_path.write_bytes(b"0123456789")
+    base = time.mktime(time.strptime("20260101-120000", "%Y%m%d-%H%M%S"))
+    index = get_screenshot_index(str(tmp_path))
+    ids = [
+        index.add(systemNm, str(image_path), base + offset, blob_hash=f"hash{offset}")
+        for offset in range(5)
+    ]
+    return systemNm, ids
+
+
+def test_given_history_when_get_screenshot_history_invoked_then_should_paginate(
+    history_index
+):
+    systemNm, ids = history_index
+    url = f"/api/v1/predefined/screenshot/history?systemNm={systemNm}&limit=2"
+    collected = []
+    cursor = None
+    while True:
+        response = client.get(url + (f"&cursor={cursor}" if cursor else ""))
+        data = response.json()["data"]
+        collected += [item["captureId"] for item in data["items"]]
+        cursor = data["nextCursor"]
+        if cursor is None:
+            break
+    assert collected == list(reversed(ids))
+    first = client.get(url).json()["data"]["items"][0]
+    assert first["size"] == 10
+    assert first["blobHash"] == "hash4"
+    assert first["imageUrl"].endswith(f"captureId={ids[4]}&size=full")
+
+
+def test_given_time_range_when_get_screenshot_history_invoked_then_should_filter(
+    history_index
+):
+    systemNm, ids = history_index
+    response = client.get(
+        f"/api/v1/predefined/screenshot/history?systemNm={systemNm}"
+        "&startTime=20260101-120001&endTime=20260101-120003&order=asc"
+    )
+    items = response.json()["data"]["items"]
+    assert [item["captureId"] for item in items] == ids[1:4]
+
+
+def test_given_invalid_cursor_when_get_screenshot_history_invoked_then_should_fail(
+    history_index
+):
+    systemNm, _ = history_index
+    response = client.get(
+        f"/api/v1/predefined/screenshot/history?systemNm={systemNm}&cursor=nope"
+    )
+    assert response.json()["resultCd"] == ERROR_RESULT_CD
+    assert "Invalid cursor" in response.json()["resultMsg"]
+
+
+@pytest.mark.parametrize(
+    "direction, expected_offset", [("nearest", 4), ("before", 4), ("after", None)]
+)
+def test_given_time_when_get_screenshot_closest_invoked_then_should_search_index(
+    history_index, direction, expected_offset
+):
+    systemNm, ids = history_index
+    response = client.get(
+        f"/api/v1/predefined/screenshot/history/closest?systemNm={systemNm}"
+        f"&time=20260101-130000&direction={direction}"
+    )
+    if expected_offset is None:
+        assert response.json()["data"] is None
+    else:
+        assert response.json()["data"]["captureId"] == ids[expected_offset]
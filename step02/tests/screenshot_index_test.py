@@ -0,0 +1,233 @@
+import os
+import sqlite3
+import time
+
+from src.screenshot_index import (
+    INDEX_FILE,
+    SCHEMA_VERSION,
+    ProbeValidators,
+    ScreenshotIndex,
+    get_screenshot_index,
+)
+
+SYSTEM_NM = "TestSystem"
+OTHER_SYSTEM_NM = "OtherSystem"
+
+
+def _touch(path):
+    with open(path, "wb") as f:
+        f.write(b"fake image data")
+    return str(path)
+
+
+def test_given_save_path_when_get_screenshot_index_invoked_then_should_reuse_index(
+    tmp_path
+):
+    index = get_screenshot_index(str(tmp_path))
+    assert index is get_screenshot_index(str(tmp_path))
+    assert os.path.exists(index.db_path)
+
+
+def test_given_captures_when_latest_invoked_then_should_return_newest(tmp_path):
+    index = ScreenshotIndex(str(tmp_path))
+    index.add(SYSTEM_NM, _touch(tmp_path / "old.webp"), 100.0)
+    index.add(SYSTEM_NM, _touch(tmp_path / "new.webp"), 200.0)
+    index.add(OTHER_SYSTEM_NM, _touch(tmp_path / "other.webp"), 300.0)
+    latest = index.latest(SYSTEM_NM)
+    assert latest.image_path == "new.webp"
+    assert latest.captured_at == 200.0
+    assert index.absolute_path(latest) == str(tmp_path / "new.webp")
+
+
+def test_given_no_captures_when_latest_invoked_then_should_return_none(tmp_path):
+    index = ScreenshotIndex(str(tmp_path))
+    assert index.latest(SYSTEM_NM) is None
+
+
+def test_given_removed_entry_when_latest_invoked_then_should_return_previous(
+    tmp_path
+):
+    index = ScreenshotIndex(str(tmp_path))
+    index.add(SYSTEM_NM, _touch(tmp_path / "old.webp"), 100.0)
+    entry_id = index.add(SYSTEM_NM, _touch(tmp_path / "new.webp"), 200.0)
+    index.remove(entry_id)
+    assert index.latest(SYSTEM_NM).image_path == "old.webp"
+
+
+def test_given_captures_when_previous_invoked_then_should_return_prior_capture(
+    tmp_path
+):
+    index = ScreenshotIndex(str(tmp_path))
+    first_id = index.add(SYSTEM_NM, _touch(tmp_path / "first.webp"), 100.0)
+    index.add(OTHER_SYSTEM_NM, _touch(tmp_path / "other.webp"), 150.0)
+    second_id = index.add(SYSTEM_NM, _touch(tmp_path / "second.webp"), 200.0)
+    second = index.get(second_id)
+    assert index.previous(second).id == first_id
+    assert index.previous(index.get(first_id)) is None
+    assert index.latest_before(SYSTEM_NM, 199.0).id == first_id
+    assert index.latest_before(SYSTEM_NM, 200.0).id == second_id
+    assert index.latest_before(SYSTEM_NM, 50.0) is None
+    assert index.get(9999) is None
+
+
+def test_given_legacy_files_when_backfill_invoked_then_should_index_once(tmp_path):
+    _touch(tmp_path / f"{SYSTEM_NM}-20251026-000000.png")
+    _touch(tmp_path / f"{SYSTEM_NM}-20251027-000000.webp")
+    _touch(tmp_path / f"{OTHER_SYSTEM_NM}-20251027-000000.webp")
+    index = ScreenshotIndex(str(tmp_path))
+    assert index.backfill(SYSTEM_NM) == 2
+    assert index.backfill(SYSTEM_NM) == 0
+    latest = index.latest(SYSTEM_NM)
+    assert latest.image_path == os.path.join(
+        SYSTEM_NM, "2025", "10", "27", f"{SYSTEM_NM}-20251027-000000.webp"
+    )
+    assert latest.captured_at == time.mktime((2025, 10, 27, 0, 0, 0, 0, 0, -1))
+    assert os.path.exists(index.absolute_path(latest))
+    assert index.latest(OTHER_SYSTEM_NM) is None
+
+
+def test_given_indexed_flat_file_when_migrate_invoked_then_should_move_and_keep_entry(
+    tmp_path
+):
+    index = ScreenshotIndex(str(tmp_path))
+    name = f"{SYSTEM_NM}-20251026-000000.png"
+    captured_at = time.mktime((2025, 10, 28, 9, 0, 0, 0, 0, -1))
+    entry_id = index.add(SYSTEM_NM, _touch(tmp_path / name), captured_at)
+    _touch(tmp_path / f"{SYSTEM_NM}-20251026-000000.thumbnail.webp")
+    _touch(tmp_path / "notes.txt")
+    assert index.migrate_flat_files() == 1
+    assert index.migrate_flat_files() == 0
+    entry = index.get(entry_id)
+    # 인덱스의 캡처 시각 기준 디렉터리로 이동
+    assert entry.image_path == os.path.join(SYSTEM_NM, "2025", "10", "28", name)
+    assert os.path.exists(index.absolute_path(entry))
+    assert not os.path.exists(tmp_path / name)
+    assert not os.path.exists(tmp_path / f"{SYSTEM_NM}-20251026-000000.thumbnail.webp")
+    assert os.path.exists(tmp_path / "notes.txt")
+
+
+def test_given_same_blob_when_add_invoked_twice_then_should_keep_both_entries(
+    tmp_path
+):
+    index = ScreenshotIndex(str(tmp_path))
+    blob_path = _touch(tmp_path / "blob.webp")
+    index.add(SYSTEM_NM, blob_path, 100.0, blob_hash="abc")
+    index.add(SYSTEM_NM, blob_path, 200.0, blob_hash="abc")
+    latest = index.latest(SYSTEM_NM)
+    assert latest.captured_at == 200.0
+    assert latest.blob_hash == "abc"
+
+
+def test_given_missing_file_when_add_invoked_with_require_file_then_should_skip(
+    tmp_path
+):
+    index = ScreenshotIndex(str(tmp_path))
+    missing = str(tmp_path / "missing.webp")
+    assert index.add(SYSTEM_NM, missing, 100.0, require_file=True) is None
+    assert index.latest(SYSTEM_NM) is None
+
+
+def test_given_live_entry_when_remove_unreferenced_invoked_then_should_keep_file(
+    tmp_path
+):
+    # 캡처 워커와 보존 정책이 서로 다른 연결(프로세스)로 같은 인덱스를 쓰는 경우
+    capture_index = ScreenshotIndex(str(tmp_path))
+    retention_index = ScreenshotIndex(str(tmp_path))
+    blob_path = _touch(tmp_path / "blob.webp")
+    entry_id = capture_index.add(SYSTEM_NM, blob_path, 100.0, require_file=True)
+    assert retention_index.remove_unreferenced(blob_path) is False
+    assert os.path.exists(blob_path)
+    capture_index.remove_many([entry_id])
+    assert retention_index.remove_unreferenced(blob_path) is True
+    assert not os.path.exists(blob_path)
+
+
+def test_given_v1_index_when_opened_then_should_migrate_rows(tmp_path):
+    conn = sqlite3.connect(tmp_path / INDEX_FILE)
+    conn.execute(
+        "CREATE TABLE captures ("
+        " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+        " system_nm TEXT NOT NULL,"
+        " captured_at REAL NOT NULL,"
+        " image_path TEXT NOT NULL UNIQUE"
+        ")"
+    )
+    conn.execute(
+        "INSERT INTO captures (system_nm, captured_at, image_path)"
+        " VALUES (?, ?, ?)",
+        (SYSTEM_NM, 100.0, "legacy.png"),
+    )
+    conn.execute("PRAGMA user_version = 1")
+    conn.commit()
+    conn.close()
+
+    index = ScreenshotIndex(str(tmp_path))
+    latest = index.latest(SYSTEM_NM)
+    assert latest.image_path == "legacy.png"
+    assert latest.blob_hash is None
+    version = index._conn.execute("PRAGMA user_version").fetchone()[0]
+    assert version == SCHEMA_VERSION
+
+
+def test_given_probe_validators_when_save_probe_invoked_then_should_replace(tmp_path):
+    index = ScreenshotIndex(str(tmp_path))
+    assert index.get_probe(SYSTEM_NM) is None
+    index.save_probe(SYSTEM_NM, ProbeValidators(url="https://a", etag='"1"'))
+    index.save_probe(
+        SYSTEM_NM, ProbeValidators(url="https://a", etag='"2"', dom_hash="abc")
+    )
+    assert index.get_probe(SYSTEM_NM) == ProbeValidators(
+        url="https://a", etag='"2"', dom_hash="abc"
+    )
+    assert index.get_probe(OTHER_SYSTEM_NM) is None
+
+
+def test_given_captures_when_history_invoked_then_should_page_with_cursor(tmp_path):
+    index = ScreenshotIndex(str(tmp_path))
+    path = _touch(tmp_path / "same.webp")
+    ids = [index.add(SYSTEM_NM, path, captured_at) for captured_at in (100.0, 200.0, 200.0, 300.0)]
+    index.add(OTHER_SYSTEM_NM, path, 250.0)
+
+    first = index.history(SYSTEM_NM, limit=2)
+    assert [entry.id for entry in first] == [ids[3], ids[2]]
+    last = first[-1]
+    second = index.history(SYSTEM_NM, cursor=(last.captured_at, last.id), limit=2)
+    # 같은 시각의 캡처도 id로 구분해 빠짐없이 이어서 읽음
+    assert [entry.id for entry in second] == [ids[1], ids[0]]
+    ascending = index.history(SYSTEM_NM, start=150.0, end=250.0, descending=False)
+    assert [entry.id for entry in ascending] == [ids[1], ids[2]]
+    assert first[0].size == len(b"fake image data")
+
+
+def test_given_captures_when_closest_invoked_then_should_return_nearest(tmp_path):
+    index = ScreenshotIndex(str(tmp_path))
+    early = index.add(SYSTEM_NM, _touch(tmp_path / "early.webp"), 100.0)
+    late = index.add(SYSTEM_NM, _touch(tmp_path / "late.webp"), 200.0)
+    assert index.closest(SYSTEM_NM, 140.0).id == early
+    assert index.closest(SYSTEM_NM, 160.0).id == late
+    assert index.closest(SYSTEM_NM, 150.0).id == early
+    assert index.closest(SYSTEM_NM, 500.0).id == late
+    assert index.closest(SYSTEM_NM, 0.0).id == early
+    assert index.earliest_after(SYSTEM_NM, 101.0).id == late
+    assert index.closest(OTHER_SYSTEM_NM, 100.0) is None
+
+
+def test_given_cursor_when_history_invoked_then_should_range_scan_index(tmp_path):
+    index = ScreenshotIndex(str(tmp_path))
+    entry = index.get(index.add(SYSTEM_NM, _touch(tmp_path / "a.webp"), 100.0))
+    statements = []
+    index._conn.set_trace_callback(statements.append)
+    index.history(SYSTEM_NM, cursor=(entry.captured_at, entry.id), limit=2)
+    index.history(
+        SYSTEM_NM, cursor=(entry.captured_at, entry.id), limit=2, descending=False
+    )
+    index.previous(entry)
+    index._conn.set_trace_callback(None)
+    selects = [sql for sql in statements if sql.startswith("SELECT")]
+    assert len(selects) == 3
+    for sql in selects:
+        plan = " ".join(
+            row[3] for row in index._conn.execute(f"EXPLAIN QUERY PLAN {sql}")
+        )
+        # 커서 이후만 읽도록 captured_at까지 인덱스 범위로 탐색해야 함 (깊은 페이지도 O(log n))
+        assert "idx_captures_system_time (system_nm=? AND captured_at" in plan
@@ -0,0 +1,51 @@
+import os
+import time
+
+from src.screenshot_store import ScreenshotStore, safe_name
+
+IMAGE_BYTES = b"fake image data"
+OTHER_IMAGE_BYTES = b"other image data"
+
+
+def test_given_new_bytes_when_put_invoked_then_should_write_blob(tmp_path):
+    store = ScreenshotStore(str(tmp_path))
+    blob = store.put(IMAGE_BYTES, "webp")
+    assert blob.is_new is True
+    assert blob.size == len(IMAGE_BYTES)
+    assert blob.path == store.blob_path(blob.digest, "webp")
+    with open(blob.path, "rb") as f:
+        assert f.read() == IMAGE_BYTES
+
+
+def test_given_same_bytes_when_put_invoked_twice_then_should_deduplicate(tmp_path):
+    store = ScreenshotStore(str(tmp_path))
+    first = store.put(IMAGE_BYTES, "webp")
+    second = store.put(IMAGE_BYTES, "webp")
+    other = store.put(OTHER_IMAGE_BYTES, "webp")
+    assert second.is_new is False
+    assert second.path == first.path
+    assert other.path != first.path
+    blob_files = [
+        file for _, _, files in os.walk(store.blob_dir) for file in files
+    ]
+    assert len(blob_files) == 2
+    assert not any(file.endswith(".tmp") for file in blob_files)
+
+
+def test_given_capture_when_put_capture_invoked_then_should_write_dated_path(tmp_path):
+    store = ScreenshotStore(str(tmp_path))
+    captured_at = time.mktime((2025, 10, 26, 13, 5, 9, 0, 0, -1)) + 0.25
+    path = store.put_capture("a/b", captured_at, IMAGE_BYTES, "png")
+    assert path == os.path.join(
+        str(tmp_path), "a_b", "2025", "10", "26", "a_b-20251026-130509-250.png"
+    )
+    with open(path, "rb") as f:
+        assert f.read() == IMAGE_BYTES
+    # 임시 파일은 남지 않음
+    assert os.listdir(os.path.dirname(path)) == [os.path.basename(path)]
+
+
+def test_given_unsafe_system_name_when_safe_name_invoked_then_should_replace():
+    assert safe_name("네이버@mobile") == "네이버@mobile"
+    assert safe_name("a\\b:c") == "a_b_c"
+    assert safe_name("..") == "_"
@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+from src.capture import capture_one
+from src.config import ConfigManager
+from src.models import CaptureResult, UrlInfo
+from src.single_flight import FLIGHT_FRESH, FLIGHT_INFLIGHT, FLIGHT_LEADER, SingleFlight
+
+KEY = "서울시"
+
+
+def _slow(calls, result="done", delay=0.05):
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return result
+    return func
+
+
+@pytest.mark.asyncio
+async def test_given_concurrent_calls_when_run_invoked_then_should_execute_once():
+    flight = SingleFlight()
+    calls = []
+    results = await asyncio.gather(
+        *(flight.run(KEY, _slow(calls)) for _ in range(3))
+    )
+    assert len(calls) == 1
+    assert [result for result, _ in results] == ["done"] * 3
+    assert sorted(kind for _, kind in results) == [
+        FLIGHT_INFLIGHT, FLIGHT_INFLIGHT, FLIGHT_LEADER
+    ]
+
+
+@pytest.mark.asyncio
+async def test_given_different_keys_when_run_invoked_then_should_execute_each():
+    flight = SingleFlight()
+    calls = []
+    await asyncio.gather(flight.run("a", _slow(calls)), flight.run("b", _slow(calls)))
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_given_fresh_window_when_run_invoked_again_then_should_reuse_result():
+    flight = SingleFlight()
+    calls = []
+    await flight.run(KEY, _slow(calls, delay=0))
+    result, kind = await flight.run(KEY, _slow(calls, delay=0), fresh_seconds=60)
+    assert (result, kind) == ("done", FLIGHT_FRESH)
+    _, kind = await flight.run(KEY, _slow(calls, delay=0))
+    assert kind == FLIGHT_LEADER
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_given_unreusable_result_when_run_invoked_again_then_should_execute_again():
+    flight = SingleFlight()
+    calls = []
+    await flight.run(KEY, _slow(calls, "failed", 0), is_reusable=lambda r: r != "failed")
+    _, kind = await flight.run(KEY, _slow(calls, delay=0), fresh_seconds=60)
+    assert kind == FLIGHT_LEADER
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_given_cancelled_leader_when_others_wait_then_should_still_share_result():
+    flight = SingleFlight()
+    calls = []
+    leader = asyncio.create_task(flight.run(KEY, _slow(calls)))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.run(KEY, _slow(calls)))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == ("done", FLIGHT_INFLIGHT)
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_given_all_callers_cancelled_when_run_invoked_then_should_cancel_execution():
+    flight = SingleFlight()
+    finished = []
+
+    async def func():
+        await asyncio.sleep(3600)
+        finished.append(1)
+
+    caller = asyncio.create_task(flight.run(KEY, func))
+    await asyncio.sleep(0)
+    (task, _), = flight._flights.values()
+    caller.cancel()
+    await asyncio.gather(caller, return_exceptions=True)
+    await asyncio.sleep(0)
+    assert task.cancelled()
+    assert not flight._flights
+
+
+@pytest.mark.asyncio
+async def test_given_concurrent_requests_when_capture_one_invoked_then_should_share_capture(
+    monkeypatch,
+):
+    urlinfo = UrlInfo(name=KEY, url="https://www.seoul.go.kr/")
+
+    async def capture(*args):
+        await asyncio.sleep(0.05)
+        return CaptureResult(urlinfo=urlinfo, isSuccess=True, imagePath="a.webp")
+
+    inner = AsyncMock(side_effect=capture)
+    monkeypatch.setattr("src.capture._capture_one", inner)
+    monkeypatch.setattr(ConfigManager, "FRESH_SECONDS", 0)
+    results = await asyncio.gather(*(capture_one(urlinfo) for _ in range(3)))
+    assert inner.await_count == 1
+    assert all(result.imagePath == "a.webp" for result in results)
+    assert len({id(result) for result in results}) == 3
+
+
+@pytest.mark.asyncio
+async def test_given_leader_mutates_result_when_capture_one_reused_then_should_keep_cached_result(
+    monkeypatch,
+):
+    urlinfo = UrlInfo(name=KEY, url="https://www.seoul.go.kr/news/")
+    inner = AsyncMock(
+        return_value=CaptureResult(urlinfo=urlinfo, isSuccess=True, imagePath="a.webp")
+    )
+    monkeypatch.setattr("src.capture._capture_one", inner)
+    monkeypatch.setattr(ConfigManager, "FRESH_SECONDS", 60)
+    leader = await capture_one(urlinfo)
+    leader.imagePath = "changed.webp"
+    reused = await capture_one(urlinfo)
+    assert inner.await_count == 1
+    assert reused.imagePath == "a.webp"
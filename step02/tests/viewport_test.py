@@ -0,0 +1,48 @@
+import pytest
+from src.config import ConfigManager
+from src.viewport import (
+    Viewport,
+    configured_viewports,
+    parse_viewport,
+    viewport_system_name,
+)
+
+VIEWPORTS = {"desktop": "1280x800", "tablet": "768X1024", "mobile": "375x812"}
+
+
+@pytest.fixture
+def viewport_config(monkeypatch):
+    monkeypatch.setattr(ConfigManager, "get_section", lambda self, section: VIEWPORTS)
+
+
+def test_given_size_when_parse_viewport_invoked_then_should_return_viewport():
+    viewport = parse_viewport("tablet", "768X1024")
+    assert viewport == Viewport(name="tablet", width=768, height=1024)
+    assert viewport.size == {"width": 768, "height": 1024}
+
+
+@pytest.mark.parametrize("value", ["", "1280", "1280x", "axb", "0x800", "1x2x3"])
+def test_given_invalid_size_when_parse_viewport_invoked_then_should_raise(value):
+    with pytest.raises(ValueError):
+        parse_viewport("desktop", value)
+
+
+def test_given_viewports_section_when_configured_viewports_invoked_then_should_keep_order(
+    viewport_config,
+):
+    assert [v.name for v in configured_viewports()] == ["desktop", "tablet", "mobile"]
+    assert [v.name for v in configured_viewports(["Mobile", "desktop"])] == [
+        "desktop", "mobile"
+    ]
+
+
+def test_given_unknown_name_when_configured_viewports_invoked_then_should_raise(
+    viewport_config,
+):
+    with pytest.raises(ValueError):
+        configured_viewports(["watch"])
+
+
+def test_given_viewport_when_viewport_system_name_invoked_then_should_join_names():
+    viewport = Viewport(name="mobile", width=375, height=812)
+    assert viewport_system_name("네이버", viewport) == "네이버@mobile"